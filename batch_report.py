@@ -0,0 +1,58 @@
+import argparse
+import sys
+
+from utils.batch_runner import SECTIONS, BatchReportRunner
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate reports for many CSV datasets, e.g. `python batch_report.py 'data/*.csv'`."
+    )
+    parser.add_argument("paths", nargs="+", help="CSV files, directories or glob patterns")
+    parser.add_argument("--output-dir", default="reports", help="where the per-dataset reports are written")
+    parser.add_argument("--workers", type=int, default=None, help="profiling processes (default: CPU count)")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS))
+    parser.add_argument("--model", default=None, help="LLM model name (default: config MODEL_NAME)")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="in-flight LLM requests")
+    parser.add_argument("--requests-per-second", type=float, default=None, help="LLM rate limit")
+    parser.add_argument("--n-samples", type=int, default=5, help="sample rows in the overview profile")
+    parser.add_argument("--token-budget", type=int, default=None, help="compact prompts to this many tokens")
+    parser.add_argument("--offline", action="store_true", help="render reports from templates without an LLM")
+    parser.add_argument("--no-resume", action="store_true", help="redo datasets that were already reported")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from utils.prompt_compactor import PromptCompactor
+
+    llm_client = None
+    if not args.offline:
+        from utils.llm_client import LLMClient
+
+        model = args.model
+        if model is None:
+            from config.config import MODEL_NAME
+            model = MODEL_NAME
+
+        llm_client = LLMClient(
+            model=model,
+            max_concurrency=args.max_concurrency,
+            requests_per_second=args.requests_per_second
+        )
+    runner = BatchReportRunner(
+        llm_client=llm_client,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        sections=tuple(args.sections),
+        n_samples=args.n_samples,
+        compactor=PromptCompactor(args.token_budget) if args.token_budget else None,
+        resume=not args.no_resume
+    )
+    summary = runner.run(args.paths)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
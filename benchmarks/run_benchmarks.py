@@ -0,0 +1,194 @@
+"""
+Benchmark the extractors, health checks and report steps on synthetic data.
+
+    python -m benchmarks.run_benchmarks --rows 10000 100000 --columns 20 --output bench.json
+    python -m benchmarks.run_benchmarks --compare bench.json   # ratios against an earlier run
+
+Runs offline: the LLM step uses FakeLLMClient, so only prompt building is measured.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_dataset
+from utils import checks
+from utils.column_stats import ColumnStatsContext
+from utils.data_health_base import BaseHealthCheck, HealthValidator
+from utils.data_health_generator import DataHealthGenerator
+from utils.info_extraction.dataset_profile_builder import CombinedDatasetProfileBuilder
+from utils.info_extraction.metadata_extractor import DatasetMetadataExtractor
+from utils.info_extraction.schema_extractor import SchemaExtractor
+from utils.info_extraction.statistics_extractor import StatisticsExtractor
+from utils.overview_generator import OverviewGenerator
+
+
+class FakeLLMClient:
+    """Stands in for LLMClient: answers instantly and records the prompt size."""
+
+    def __init__(self):
+        self.prompt_chars = 0
+
+    def chat(self, system_prompt: str, user_prompt: str, temperature: float = 0, on_token=None):
+        self.prompt_chars = len(system_prompt) + len(user_prompt)
+        if on_token is not None:
+            on_token("benchmark")
+        return "benchmark"
+
+    async def achat(self, system_prompt: str, user_prompt: str, temperature: float = 0, on_token=None):
+        return self.chat(system_prompt, user_prompt, temperature, on_token)
+
+
+def benchmark_targets() -> dict:
+    """name -> callable(df); every call starts without memoized column statistics."""
+    metadata, schema, stats = DatasetMetadataExtractor(), SchemaExtractor(), StatisticsExtractor()
+    builder = CombinedDatasetProfileBuilder(metadata, schema, stats)
+    check_classes = sorted(
+        (cls for cls in BaseHealthCheck.__subclasses__() if cls.__module__ == checks.__name__),
+        key=lambda cls: cls.__name__
+    )
+    validator = HealthValidator([cls() for cls in check_classes])
+    llm_client = FakeLLMClient()
+
+    targets = {f"check.{cls.__name__}": cls().run for cls in check_classes}
+    targets.update({
+        "extractor.DatasetMetadataExtractor": metadata.extract_dataframe_metadata,
+        "extractor.SchemaExtractor": schema.extract_schema,
+        "extractor.StatisticsExtractor": stats.extract,
+        "CombinedDatasetProfileBuilder.build_profile": builder.build_profile,
+        "HealthValidator.run": validator.run,
+        "report.overview": lambda df: OverviewGenerator(llm_client).generate(builder.build_profile(df)),
+        "report.data_health": lambda df: DataHealthGenerator(llm_client).generate(validator.run(df).to_dict()),
+    })
+    return targets
+
+
+def measure(fn, df: pd.DataFrame, repeats: int) -> dict:
+    """Median wall time over `repeats` runs, then one extra run under tracemalloc for peak memory."""
+    timings = []
+    for _ in range(repeats):
+        ColumnStatsContext.invalidate(df)
+        gc.collect()
+        start = time.perf_counter()
+        fn(df)
+        timings.append(time.perf_counter() - start)
+
+    ColumnStatsContext.invalidate(df)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(df)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "seconds_median": median,
+        "seconds_min": min(timings),
+        "repeats": repeats,
+        "peak_memory_bytes": peak,
+        "rows_per_second": len(df) / median if median > 0 else None,
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def run(args) -> dict:
+    targets = benchmark_targets()
+    if args.only:
+        targets = {name: fn for name, fn in targets.items() if any(key in name for key in args.only)}
+
+    results = []
+    for rows in args.rows:
+        params = {
+            "rows": rows, "columns": args.columns, "null_density": args.null_density,
+            "duplicate_rate": args.duplicate_rate, "cardinality": args.cardinality,
+            "outlier_rate": args.outlier_rate, "seed": args.seed,
+        }
+        df = make_dataset(**params)
+        for name, fn in targets.items():
+            result = {"target": name, "dataset": params, **measure(fn, df, args.repeats)}
+            results.append(result)
+            print(f"{name:<48} rows={rows:<9} {result['seconds_median'] * 1000:10.1f} ms "
+                  f"{result['peak_memory_bytes'] / 1024 ** 2:9.1f} MiB", file=sys.stderr)
+    return {"environment": environment(), "results": results}
+
+
+def compare(current: dict, baseline: dict) -> list:
+    """Time and memory ratios (current / baseline) for every target measured in both runs."""
+    def key(result):
+        return result["target"], json.dumps(result["dataset"], sort_keys=True)
+
+    previous = {key(r): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        rows.append({
+            "target": result["target"],
+            "rows": result["dataset"]["rows"],
+            "time_ratio": result["seconds_median"] / before["seconds_median"] if before["seconds_median"] else None,
+            "memory_ratio": (result["peak_memory_bytes"] / before["peak_memory_bytes"]
+                             if before["peak_memory_bytes"] else None),
+        })
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark extractors and health checks on synthetic data.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--null-density", type=float, default=0.05)
+    parser.add_argument("--duplicate-rate", type=float, default=0.02)
+    parser.add_argument("--cardinality", type=int, default=100)
+    parser.add_argument("--outlier-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="only targets whose name contains one of these strings")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to write the JSON results")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = run(args)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report["comparison"] = compare(report, json.load(f))
+        for row in report["comparison"]:
+            print(f"{row['target']:<48} rows={row['rows']:<9} time x{row['time_ratio'] or float('nan'):.2f} "
+                  f"memory x{row['memory_ratio'] or float('nan'):.2f}", file=sys.stderr)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+# Column types are assigned round-robin in this order.
+COLUMN_KINDS = ("float", "integer", "string", "boolean")
+
+
+def make_dataset(rows: int = 100_000, columns: int = 20, null_density: float = 0.05,
+                 duplicate_rate: float = 0.02, cardinality: int = 100, outlier_rate: float = 0.01,
+                 seed: int = 0) -> pd.DataFrame:
+    """
+    Deterministic synthetic dataset for benchmarks.
+
+    null_density: fraction of cells set to missing (in every column type)
+    duplicate_rate: fraction of rows overwritten with a copy of another row
+    cardinality: distinct values in string and integer columns
+    outlier_rate: fraction of numeric cells pushed far outside the normal range
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(columns):
+        kind = COLUMN_KINDS[i % len(COLUMN_KINDS)]
+        name = f"{kind}_{i}"
+        if kind == "float":
+            values = rng.normal(100.0, 15.0, rows)
+            values[rng.random(rows) < outlier_rate] = 100.0 + 20 * 15.0 * rng.choice([-1, 1])
+        elif kind == "integer":
+            values = rng.integers(0, cardinality, rows).astype(float)
+            values[rng.random(rows) < outlier_rate] = cardinality * 50
+        elif kind == "string":
+            values = np.array([f"value_{k}" for k in range(cardinality)], dtype=object)[
+                rng.integers(0, cardinality, rows)
+            ]
+        else:
+            values = rng.random(rows) < 0.5
+            values = values.astype(object)
+        values[rng.random(rows) < null_density] = None if kind in ("string", "boolean") else np.nan
+        data[name] = values
+
+    n_duplicates = int(rows * duplicate_rate) if rows > 1 else 0
+    if n_duplicates:
+        targets = rng.choice(np.arange(1, rows), n_duplicates, replace=False)
+        sources = rng.integers(0, targets)
+        for values in data.values():
+            values[targets] = values[sources]
+
+    df = pd.DataFrame(data)
+    for col in df.columns:
+        if col.startswith("integer") and not df[col].isna().any():
+            df[col] = df[col].astype(np.int64)
+        elif col.startswith("boolean") and not df[col].isna().any():
+            df[col] = df[col].astype(bool)
+    return df
@@ -1,3 +1,4 @@
+import argparse
 import os
 import sys
 import pandas as pd
@@ -6,9 +7,7 @@ import json
 project_path = "/content/drive/MyDrive/Colab Notebooks/report"
 sys.path.append(project_path)
 
-from utils.data_loader import CSVLoader
-from utils.llm_client import LLMClient
-from config.config import MODEL_NAME
+from utils.data_loader import CSVLoader, PartitionedCSVLoader, is_partitioned_path
 from modules.overview_module import OverviewModule
 from modules.data_health_module import DataHealthModule
 
@@ -17,22 +16,37 @@ from modules.data_health_module import DataHealthModule
 pd.set_option('display.max_columns', None)
 pd.set_option('display.width', None)
 
-def main():
-  data_path = "/content/drive/MyDrive/Colab Notebooks/report/data/Housing.csv"
+def parse_args(argv=None):
+  parser = argparse.ArgumentParser(description="Generate the report sections for one CSV dataset.")
+  parser.add_argument("data_path", nargs="?", default="/content/drive/MyDrive/Colab Notebooks/report/data/Housing.csv",
+                      help="a CSV file, or a directory / glob pattern of CSV shards")
+  parser.add_argument("--offline", action="store_true",
+                      help="render the sections from templates; no LLM, config or network needed")
+  return parser.parse_args(argv)
 
+def main(argv=None):
+  args = parse_args(argv)
+  data_path = args.data_path
 
-  loader = CSVLoader(data_path)
+
+  loader = PartitionedCSVLoader(data_path) if is_partitioned_path(data_path) else CSVLoader(data_path)
   df = loader.load()
 
-  llm_client = LLMClient(model=MODEL_NAME)
+  llm_client = None
+  if not args.offline:
+    # Imported here so offline runs never load openai or need config.config.
+    from utils.llm_client import LLMClient
+    from config.config import MODEL_NAME
+    llm_client = LLMClient(model=MODEL_NAME)
 
   # overview_module = OverviewModule(llm_client=llm_client)
   # overview_text = overview_module.get_overview(df, file_path=data_path)
   # print(overview_text)
 
   data_health_module = DataHealthModule(llm_client=llm_client)
-  data_health_text = data_health_module.get_data_health(df)
-  print(data_health_text)
+  # Stream the report to the terminal as it is generated.
+  data_health_module.get_data_health(df, on_token=lambda text: print(text, end="", flush=True))
+  print()
 
 if __name__ == "__main__":
   main()
@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING
 from utils.checks import NullRatioCheck, OutlierIQRCheck, EmptyDatasetCheck, DuplicateRowsCheck
 from utils.data_health_base import HealthValidator
 
 from utils.data_health_generator import DataHealthGenerator
-from utils.llm_client import LLMClient
+from utils.sample_estimates import SampleEstimator
+
+if TYPE_CHECKING:
+    from utils.llm_client import LLMClient  # imports openai; only needed with an LLM
 
 class DataHealthModule:
     """
@@ -11,9 +15,10 @@ class DataHealthModule:
     1. Building dataset profile
     2. Connecting with LLM via OverviewGenerator
     3. Returning the final overview text
+    Offline mode: without an llm_client the report is rendered from a template.
     """
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(self, llm_client: "LLMClient" = None, compactor=None):
         self.null_ratio_check = NullRatioCheck()
         self.outlier_check = OutlierIQRCheck()
         self.empty_dataset_check = EmptyDatasetCheck()
@@ -24,8 +29,9 @@ class DataHealthModule:
             self.empty_dataset_check,
             self.duplicate_rows_check
         ])
-        self.data_health_generator = DataHealthGenerator(llm_client=llm_client)
-    def get_data_health(self, df) -> str:
+        self.data_health_generator = DataHealthGenerator(llm_client=llm_client, compactor=compactor)
+        self.sample_estimator = SampleEstimator()
+    def get_data_health(self, df, on_token=None) -> str:
       """
       Main method to generate the Data Health section.
 
@@ -34,12 +40,26 @@ class DataHealthModule:
       2. Convert the report to dict
       3. Pass it to DataHealthGenerator
       4. Return the final generated text
+      on_token: optional callback that receives the text as it streams in.
       """
 
-      health_report = self.health_validator.run(df)
-
-      health_dict = health_report.to_dict()
+      health_dict = self.build_health_report(df)
 
-      health_text = self.data_health_generator.generate(health_dict)
+      health_text = self.data_health_generator.generate(health_dict, on_token=on_token)
 
       return health_text
+
+    def build_health_report(self, df) -> dict:
+      """
+      Local step only: run the health checks and return the report dict.
+      Fast mode: for a sample from SamplingCSVLoader the rates get confidence intervals.
+      """
+      health_report = self.health_validator.run(df).to_dict()
+      if self.sample_estimator.is_sample(df):
+        health_report = self.sample_estimator.annotate_health_report(health_report, df)
+      return health_report
+
+    async def aget_data_health(self, df, on_token=None) -> str:
+      """Async version of `get_data_health`."""
+      health_dict = self.build_health_report(df)
+      return await self.data_health_generator.agenerate(health_dict, on_token=on_token)
@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
 from utils.info_extraction.metadata_extractor import DatasetMetadataExtractor
 from utils.info_extraction.schema_extractor import SchemaExtractor
 from utils.info_extraction.statistics_extractor import StatisticsExtractor
 from utils.info_extraction.dataset_profile_builder import CombinedDatasetProfileBuilder
 from utils.overview_generator import OverviewGenerator
-from utils.llm_client import LLMClient
+from utils.sample_estimates import SampleEstimator
+
+if TYPE_CHECKING:
+    from utils.llm_client import LLMClient  # imports openai; only needed with an LLM
 
 class OverviewModule:
     """
@@ -12,9 +16,13 @@ class OverviewModule:
     1. Building dataset profile
     2. Connecting with LLM via OverviewGenerator
     3. Returning the final overview text
+
+    Fast mode: pass a sample from SamplingCSVLoader and the profile gets
+    confidence intervals for the whole file.
+    Offline mode: without an llm_client the overview is rendered from a template.
     """
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(self, llm_client: "LLMClient" = None, compactor=None):
         self.metadata_extractor = DatasetMetadataExtractor()
         self.schema_extractor = SchemaExtractor()
         self.stats_extractor = StatisticsExtractor()
@@ -23,18 +31,32 @@ class OverviewModule:
             schema_extractor=self.schema_extractor,
             stats_extractor=self.stats_extractor
         )
-        self.overview_generator = OverviewGenerator(llm_client=llm_client)
+        self.overview_generator = OverviewGenerator(llm_client=llm_client, compactor=compactor)
+        self.sample_estimator = SampleEstimator()
 
-    def get_overview(self, df, file_path: str = None, n_samples: int = 5) -> str:
+    def get_overview(self, df, file_path: str = None, n_samples: int = 5, on_token=None) -> str:
         """
         Main method to get the Overview section.
         Steps:
         1. Build the dataset profile
         2. Pass it to OverviewGenerator
         3. Return generated overview text
+        on_token: optional callback that receives the text as it streams in.
         """
-        profile = self.profile_builder.build_profile(df, file_path=file_path, n_samples=n_samples)
+        profile = self.build_profile(df, file_path=file_path, n_samples=n_samples)
 
-        overview_text = self.overview_generator.generate(profile)
+        overview_text = self.overview_generator.generate(profile, on_token=on_token)
 
         return overview_text
+
+    def build_profile(self, df, file_path: str = None, n_samples: int = 5) -> dict:
+        """Local step only: build the dataset profile without calling the LLM."""
+        profile = self.profile_builder.build_profile(df, file_path=file_path, n_samples=n_samples)
+        if self.sample_estimator.is_sample(df):
+            profile = self.sample_estimator.annotate_profile(profile, df)
+        return profile
+
+    async def aget_overview(self, df, file_path: str = None, n_samples: int = 5, on_token=None) -> str:
+        """Async version of `get_overview`."""
+        profile = self.build_profile(df, file_path=file_path, n_samples=n_samples)
+        return await self.overview_generator.agenerate(profile, on_token=on_token)
@@ -0,0 +1,52 @@
+import argparse
+import sys
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve reports from a long-running process that keeps datasets and profiles in memory."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", default=None, help="listen on this Unix socket path instead of host:port")
+    parser.add_argument("--cache-mb", type=int, default=2048, help="memory budget for cached datasets")
+    parser.add_argument("--model", default=None, help="LLM model name (default: config MODEL_NAME)")
+    parser.add_argument("--token-budget", type=int, default=None, help="compact prompts to this many tokens")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from utils.llm_client import LLMClient
+    from utils.prompt_compactor import PromptCompactor
+    from utils.report_service import DatasetCache, ReportService, make_server
+    from modules.overview_module import OverviewModule
+    from modules.data_health_module import DataHealthModule
+
+    model = args.model
+    if model is None:
+        from config.config import MODEL_NAME
+        model = MODEL_NAME
+
+    llm_client = LLMClient(model=model)
+    compactor = PromptCompactor(args.token_budget) if args.token_budget else None
+    service = ReportService(
+        overview_module=OverviewModule(llm_client=llm_client, compactor=compactor),
+        data_health_module=DataHealthModule(llm_client=llm_client, compactor=compactor),
+        cache=DatasetCache(max_bytes=args.cache_mb * 1024 ** 2)
+    )
+    server = make_server(service, host=args.host, port=args.port, unix_socket=args.unix_socket)
+    where = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"Report service listening on {where}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+import sys
+import types
+
+# config/config.py holds the API key and is not committed. LLMClient only
+# reads the names at import time; the tests never reach a real endpoint.
+try:
+    import config.config  # noqa: F401
+except ImportError:
+    config_package = types.ModuleType("config")
+    config_module = types.ModuleType("config.config")
+    config_module.API_KEY = "test-key"
+    config_module.MODEL_NAME = "test-model"
+    config_package.config = config_module
+    sys.modules.setdefault("config", config_package)
+    sys.modules["config.config"] = config_module
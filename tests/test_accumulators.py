@@ -0,0 +1,86 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.accumulators import RowFingerprintAccumulator
+from utils.checks import DuplicateRowsCheck
+
+# Column `a` reads as int64 in the first chunk and float64 in the second.
+CSV = "a,b\n1,x\n2,z\n3,w\n1,x\n,y\n3,w\n"
+
+
+@pytest.mark.parametrize("mode", DuplicateRowsCheck.MODES)
+def test_duplicates_across_chunks_with_changing_dtype(mode):
+    expected = int(pd.read_csv(io.StringIO(CSV)).duplicated().sum())
+    check = DuplicateRowsCheck(mode=mode)
+    accumulator = check.create_accumulator()
+    for chunk in pd.read_csv(io.StringIO(CSV), chunksize=3):
+        accumulator.update(chunk)
+
+    assert expected == 2
+    assert check.finalize(accumulator).details["duplicate_count"] == expected
+
+
+@pytest.mark.parametrize("mode", DuplicateRowsCheck.MODES)
+def test_large_integer_ids_are_not_duplicates(mode):
+    df = pd.DataFrame({
+        "id": [2 ** 53, 2 ** 53 + 1, 1234567890123456789, 1234567890123456790],
+        "v": [1, 1, 2, 2],
+    })
+    check = DuplicateRowsCheck(mode=mode)
+    accumulator = check.create_accumulator()
+    for start in range(0, len(df), 2):
+        accumulator.update(df.iloc[start:start + 2])
+
+    assert int(df.duplicated().sum()) == 0
+    assert check.finalize(accumulator).details["duplicate_count"] == 0
+
+
+def _rows_with_duplicates(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "id": rng.integers(0, n // 3, n) + 2 ** 60,
+        "x": rng.integers(0, 3, n) / 2,
+        "s": rng.choice(["a", "b", None], n),
+    })
+    df.loc[rng.random(n) < 0.1, "x"] = np.nan
+    return df
+
+
+def test_fingerprint_mode_counts_exactly():
+    df = _rows_with_duplicates()
+    duplicates = df.duplicated()
+    result = DuplicateRowsCheck(mode="fingerprint", batch_rows=700).run(df)
+
+    assert duplicates.sum() > 0
+    assert result.details["duplicate_count"] == int(duplicates.sum())
+    assert result.details["sample_duplicates"] == df[duplicates].head().to_dict(orient="records")
+
+
+def test_fingerprint_store_spills_and_stays_exact(tmp_path):
+    df = _rows_with_duplicates()
+    accumulator = RowFingerprintAccumulator(memory_budget_bytes=2048, num_partitions=8, spill_dir=str(tmp_path))
+    for start in range(0, len(df), 500):
+        accumulator.update(df.iloc[start:start + 500])
+
+    assert accumulator.store.spilled
+    duplicate_count, positions = accumulator.store.scan(sample_size=5)
+    assert duplicate_count == int(df.duplicated().sum())
+    assert positions == np.flatnonzero(df.duplicated().to_numpy())[:5].tolist()
+    accumulator.store.close()
+
+
+def test_fingerprint_merge_offsets_positions():
+    df = _rows_with_duplicates(n=1000)
+    first, second = RowFingerprintAccumulator(), RowFingerprintAccumulator()
+    first.update(df.iloc[:600])
+    second.update(df.iloc[600:])
+    first.merge(second)
+
+    duplicate_count, positions = first.store.scan(sample_size=20)
+    expected = np.flatnonzero(df.duplicated().to_numpy())
+    assert first.row_count == len(df)
+    assert duplicate_count == len(expected)
+    assert positions == expected[:20].tolist()
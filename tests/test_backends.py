@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.backends import DuckDBBackend, PandasBackend
+from utils.checks import DuplicateRowsCheck, EmptyDatasetCheck, NullRatioCheck, OutlierIQRCheck
+from utils.column_stats import ColumnStatsContext
+from utils.info_extraction.metadata_extractor import DatasetMetadataExtractor
+from utils.info_extraction.schema_extractor import SchemaExtractor
+from utils.info_extraction.statistics_extractor import StatisticsExtractor
+from utils.serialization import to_builtin
+
+duckdb = pytest.importorskip("duckdb")
+
+CHECKS = [NullRatioCheck(), OutlierIQRCheck(), EmptyDatasetCheck(), DuplicateRowsCheck()]
+
+
+@pytest.fixture(scope="module")
+def csv_path(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    n = 400
+    df = pd.DataFrame({
+        "count": rng.integers(0, 50, n),
+        "count_with_nulls": rng.integers(0, 50, n).astype(float),
+        "price": np.r_[rng.normal(100, 10, n - 3), [400.0, -250.0, 999.0]],
+        "city": rng.choice(["Cairo", "Giza", "Alexandria", None], n),
+        "flag": rng.choice([True, False], n),
+        "empty": np.nan,
+    })
+    df.loc[rng.random(n) < 0.1, "count_with_nulls"] = np.nan
+    df = pd.concat([df, df.iloc[:7]], ignore_index=True)  # exact duplicate rows
+    path = tmp_path_factory.mktemp("backends") / "synthetic.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def backends(csv_path):
+    df = pd.read_csv(csv_path)
+    duck = DuckDBBackend(csv_path)
+    yield df, duck
+    duck.close()
+
+
+def _assert_same(actual, expected):
+    """Equal as JSON payloads (NaN and None alike), floats up to rounding."""
+    actual, expected = to_builtin(actual), to_builtin(expected)
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            _assert_same(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            _assert_same(a, e)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-9)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize("check", CHECKS, ids=lambda check: type(check).__name__)
+def test_checks_match_pandas(backends, check):
+    df, duck = backends
+    expected = check.run(df)
+    actual = check.run_on_backend(duck)
+
+    assert actual.status == expected.status
+    _assert_same(actual.details, expected.details)
+
+
+def test_extractors_match_pandas(backends):
+    df, duck = backends
+    context = ColumnStatsContext.of(df)
+
+    _assert_same(StatisticsExtractor().extract_from_backend(duck), StatisticsExtractor().extract(df))
+    _assert_same(SchemaExtractor().extract_from_backend(duck), SchemaExtractor().extract_schema(df))
+    _assert_same(DatasetMetadataExtractor().extract_from_backend(duck),
+                 DatasetMetadataExtractor().extract_dataframe_metadata(df, context=context))
+
+
+def test_pandas_backend_matches_eager_statistics(backends):
+    df, _ = backends
+    _assert_same(StatisticsExtractor().extract_from_backend(PandasBackend(df)), StatisticsExtractor().extract(df))
@@ -0,0 +1,55 @@
+import os
+
+import pandas as pd
+
+from utils.data_loader import CachedCSVLoader, PartitionedCSVLoader, is_partitioned_path
+from utils.info_extraction.metadata_extractor import DatasetMetadataExtractor
+
+
+def test_file_with_glob_characters_is_not_a_pattern(tmp_path):
+    path = tmp_path / "sales[2024].csv"
+    pd.DataFrame({"x": [1, 2]}).to_csv(path, index=False)
+
+    assert not is_partitioned_path(str(path))
+    assert DatasetMetadataExtractor().extract_file_metadata(str(path))["file_size_bytes"] == path.stat().st_size
+
+
+def test_directory_and_glob_are_partitioned(tmp_path):
+    for i in range(2):
+        pd.DataFrame({"x": [i, i + 10]}).to_csv(tmp_path / f"part-{i}.csv", index=False)
+
+    assert is_partitioned_path(str(tmp_path))
+    assert is_partitioned_path(str(tmp_path / "part-*.csv"))
+    df = PartitionedCSVLoader(str(tmp_path)).load()
+    assert df["x"].tolist() == [0, 10, 1, 11]
+    assert [shard["rows"] for shard in df.attrs["shards"]] == [2, 2]
+
+
+def test_cache_entries_for_other_read_kwargs_survive(tmp_path):
+    path = tmp_path / "data.csv"
+    cache_dir = str(tmp_path / "cache")
+    pd.DataFrame({"x": [1, 2, 3], "s": ["a", "b", "c"]}).to_csv(path, index=False)
+    full = CachedCSVLoader(str(path), cache_dir=cache_dir)
+    head = CachedCSVLoader(str(path), {"nrows": 2}, cache_dir=cache_dir)
+    full.load()
+    head.load()
+
+    assert full.cache_hit and head.cache_hit
+    assert len(os.listdir(cache_dir)) == 2
+
+    pd.DataFrame({"x": [4, 5, 6, 7], "s": ["d", "e", "f", "g"]}).to_csv(path, index=False)
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10 ** 9))
+    reloaded = CachedCSVLoader(str(path), cache_dir=cache_dir)
+
+    assert reloaded.load()["x"].tolist() == [4, 5, 6, 7]
+    assert os.listdir(cache_dir) == [os.path.basename(reloaded._entry_path())]
+
+
+def test_batch_discovery_uses_shard_discovery(tmp_path):
+    from utils.batch_runner import discover_datasets
+
+    for name in ("a.csv", "b.csv", "notes.txt", "sales[2024].csv"):
+        (tmp_path / name).write_text("x\n1\n")
+
+    found = discover_datasets([str(tmp_path), str(tmp_path / "a.csv"), str(tmp_path / "sales[2024].csv")])
+    assert found == sorted(str(tmp_path / name) for name in ("a.csv", "b.csv", "sales[2024].csv"))
@@ -0,0 +1,94 @@
+import os
+
+import pandas as pd
+import pytest
+
+from utils.checks import DuplicateRowsCheck, EmptyDatasetCheck, NullRatioCheck, OutlierIQRCheck
+from utils.data_health_base import HealthValidator
+from utils.data_loader import CSVLoader
+from utils.incremental_profiler import IncrementalProfiler
+from utils.info_extraction.dataset_profile_builder import CombinedDatasetProfileBuilder
+from utils.info_extraction.metadata_extractor import DatasetMetadataExtractor
+from utils.info_extraction.schema_extractor import SchemaExtractor
+from utils.info_extraction.statistics_extractor import StatisticsExtractor
+from utils.serialization import to_builtin
+from utils.streaming_profiler import StreamingProfiler
+
+CHURN = os.path.join(os.path.dirname(__file__), os.pardir, "data", "churn.csv")
+
+
+def _streaming_profiler():
+    return StreamingProfiler(
+        CombinedDatasetProfileBuilder(DatasetMetadataExtractor(), SchemaExtractor(), StatisticsExtractor()),
+        HealthValidator([NullRatioCheck(), OutlierIQRCheck(), EmptyDatasetCheck(), DuplicateRowsCheck()]),
+    )
+
+
+def _full_profile(path):
+    profile, report = _streaming_profiler().profile_file(CSVLoader(path), chunksize=500)
+    return to_builtin(profile), to_builtin(report.to_dict())
+
+
+def _assert_same(actual, expected):
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            _assert_same(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            _assert_same(a, e)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-9)
+    else:
+        assert actual == expected
+
+
+@pytest.fixture
+def lines():
+    with open(CHURN, encoding="utf-8") as f:
+        return f.readlines()
+
+
+def _refresh(profiler, path):
+    profile, report = profiler.refresh(path)
+    return to_builtin(profile), to_builtin(report.to_dict())
+
+
+def test_appended_rows_match_a_full_profile(tmp_path, lines):
+    path = str(tmp_path / "churn.csv")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines[:2001])
+    profiler = IncrementalProfiler(_streaming_profiler(), chunksize=500)
+    profiler.refresh(path)
+    assert profiler.last_refresh["full_rescan"]
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(lines[2001:])
+    result = _refresh(profiler, path)
+
+    assert not profiler.last_refresh["full_rescan"]
+    assert profiler.last_refresh["bytes_parsed"] < profiler.last_refresh["bytes_total"]
+    _assert_same(result, _full_profile(path))
+
+
+def test_rewritten_file_is_profiled_from_scratch(tmp_path, lines):
+    path = str(tmp_path / "churn.csv")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines[:3001])
+    profiler = IncrementalProfiler(_streaming_profiler(), chunksize=500)
+    profiler.refresh(path)
+
+    # Truncated: the saved offset lies past the end of the file.
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines[:1001])
+    result = _refresh(profiler, path)
+    assert profiler.last_refresh["full_rescan"]
+    _assert_same(result, _full_profile(path))
+
+    # Same length, different content: the prefix fingerprint no longer matches.
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines([lines[0]] + [line.replace("Female", "Femme!") for line in lines[1:1001]])
+    result = _refresh(profiler, path)
+    assert profiler.last_refresh["full_rescan"]
+    _assert_same(result, _full_profile(path))
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pytest
+
+import utils.llm_cache as llm_cache
+from utils.llm_cache import LLMResponseCache
+from utils.llm_client import LLMClient
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeCompletions:
+    def __init__(self, text="answer"):
+        self.text = text
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=f" {self.text} ")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "responses.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_key_is_stable_and_covers_every_input():
+    key = LLMResponseCache.make_key("m", "system", "user", 0)
+
+    assert key == LLMResponseCache.make_key("m", "system", "user", 0.0)
+    assert len({
+        key,
+        LLMResponseCache.make_key("other", "system", "user", 0),
+        LLMResponseCache.make_key("m", "other", "user", 0),
+        LLMResponseCache.make_key("m", "system", "other", 0),
+        LLMResponseCache.make_key("m", "system", "user", 0.7),
+    }) == 5
+
+
+def test_entries_expire_after_ttl(clock, cache):
+    cache.ttl_seconds = 10
+    cache.put("k", "response")
+
+    clock.now += 9
+    assert cache.get("k") == "response"
+    clock.now += 2
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(clock, cache):
+    cache.max_bytes = 8
+    cache.put("a", "aaaa")
+    clock.now += 1
+    cache.put("b", "bbbb")
+    clock.now += 1
+    assert cache.get("a") == "aaaa"  # `b` is now the least recently used
+    clock.now += 1
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.stats()["size_bytes"] == 8
+
+
+def test_client_answers_repeated_requests_from_cache(cache):
+    completions = FakeCompletions()
+    client = LLMClient("m", cache=cache, client=SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+
+    assert client.chat("system", "user") == "answer"
+    assert client.chat("system", "user") == "answer"
+    assert completions.calls == 1
+    assert client.last_call["cached"] is True
+    assert client.usage["cache_hits"] == 1
+
+    client.chat("system", "another question")
+    assert completions.calls == 2
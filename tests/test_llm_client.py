@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from utils import llm_client as llm_client_module
+from utils.llm_client import LLMClient, close_shared_http_client, shared_http_client
+
+
+def _timeout():
+    return openai.APITimeoutError(request=httpx.Request("POST", "http://stub/chat/completions"))
+
+
+def _response(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))], usage=None)
+
+
+def _chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))], usage=None)
+
+
+class FlakyCompletions:
+    """Stub endpoint: the first call raises a timeout, later calls answer."""
+
+    def __init__(self, failures=1):
+        self.failures = failures
+        self.calls = 0
+
+    def create(self, stream=False, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise _timeout()
+        return iter([_chunk("hel"), _chunk("lo")]) if stream else _response("hello")
+
+
+class BrokenStreamCompletions:
+    """Stub endpoint whose stream drops after the first token."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+
+        def stream():
+            yield _chunk("hel")
+            raise _timeout()
+        return stream()
+
+
+class AsyncFlakyCompletions(FlakyCompletions):
+    async def create(self, stream=False, **kwargs):
+        return FlakyCompletions.create(self, stream=False, **kwargs)
+
+
+def _client(completions, **kwargs):
+    stub = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return LLMClient("m", client=stub, async_client=stub, backoff_base=0, **kwargs)
+
+
+def test_timeout_is_retried():
+    completions = FlakyCompletions()
+    client = _client(completions)
+
+    assert client.chat("system", "user") == "hello"
+    assert completions.calls == 2
+    assert client.last_call["retries"] == 1
+
+
+def test_retries_give_up_after_max_retries():
+    completions = FlakyCompletions(failures=5)
+    client = _client(completions, max_retries=2)
+
+    with pytest.raises(openai.APITimeoutError):
+        client.chat("system", "user")
+    assert completions.calls == 3
+
+
+def test_stream_is_retried_before_the_first_token():
+    completions = FlakyCompletions()
+    tokens = []
+
+    assert _client(completions).chat("system", "user", on_token=tokens.append) == "hello"
+    assert tokens == ["hel", "lo"]
+    assert completions.calls == 2
+
+
+def test_stream_is_not_retried_after_the_first_token():
+    completions = BrokenStreamCompletions()
+    tokens = []
+
+    with pytest.raises(openai.APITimeoutError):
+        _client(completions).chat("system", "user", on_token=tokens.append)
+    assert tokens == ["hel"]
+    assert completions.calls == 1
+
+
+def test_async_timeout_is_retried():
+    completions = AsyncFlakyCompletions()
+    client = _client(completions)
+
+    assert asyncio.run(client.achat("system", "user")) == "hello"
+    assert completions.calls == 2
+    assert client.usage["retries"] == 1
+
+
+def test_async_pool_of_a_previous_event_loop_is_closed():
+    client = LLMClient("m", client=SimpleNamespace())
+    first = asyncio.run(client._async_resources())[0]
+    second = asyncio.run(client._async_resources())[0]
+
+    assert first is not second
+    assert first.is_closed()
+    asyncio.run(client.aclose())
+    assert second.is_closed()
+
+
+def test_shared_http_client_can_be_closed():
+    pool = shared_http_client()
+    close_shared_http_client()
+
+    assert pool.is_closed
+    assert llm_client_module._shared_http_client is None
+    assert shared_http_client() is not pool
+    close_shared_http_client()
@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from modules.data_health_module import DataHealthModule
+from modules.overview_module import OverviewModule
+from utils.llm_cache import LLMResponseCache
+from utils.llm_client import LLMClient
+from utils.report_orchestrator import ReportOrchestrator
+
+
+class FakeAsyncCompletions:
+    """Stub OpenAI async endpoint that records how many requests overlap."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        message = SimpleNamespace(content=f"section {self.calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def _orchestrator(completions, max_concurrency, cache=None):
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    client = LLMClient("m", cache=cache, client=fake, async_client=fake, max_concurrency=max_concurrency)
+    return ReportOrchestrator(OverviewModule(llm_client=client), DataHealthModule(llm_client=client))
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"x": [1.0, 2.0, 2.0, 40.0], "s": ["a", "b", "b", None]})
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2])
+def test_sections_run_concurrently_within_the_limit(df, max_concurrency):
+    completions = FakeAsyncCompletions()
+    report = asyncio.run(_orchestrator(completions, max_concurrency).agenerate(df))
+
+    assert set(report) == {"overview", "data_health"}
+    assert completions.calls == 2
+    assert completions.peak == max_concurrency
+
+
+def test_cache_hits_skip_the_client(df, tmp_path):
+    completions = FakeAsyncCompletions()
+    cache = LLMResponseCache(str(tmp_path / "responses.sqlite"))
+    first = asyncio.run(_orchestrator(completions, 2, cache).agenerate(df))
+    second = asyncio.run(_orchestrator(completions, 2, cache).agenerate(df))
+    cache.close()
+
+    assert completions.calls == 2
+    assert second == first
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from utils.serialization import dumps, to_builtin
+
+
+def test_non_finite_scalars_become_none():
+    payload = {"nan": float("nan"), "inf": float("inf"), "ninf": -np.inf, "np": np.float32("inf"), "ok": 1.5}
+    assert to_builtin(payload) == {"nan": None, "inf": None, "ninf": None, "np": None, "ok": 1.5}
+
+
+def test_non_finite_array_values_become_none():
+    values = np.array([1.0, np.nan, np.inf, -np.inf])
+    assert to_builtin(values) == [1.0, None, None, None]
+    assert to_builtin(pd.Series(values)) == [1.0, None, None, None]
+    assert to_builtin(pd.DataFrame({"x": values})) == [{"x": 1.0}, {"x": None}, {"x": None}, {"x": None}]
+
+
+def test_dumps_is_strict_json():
+    text = dumps({"a": float("inf"), "b": [np.nan, -np.inf], "c": np.array([np.inf])})
+    assert text == '{"a":null,"b":[null,null],"c":[null]}'
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.checks import OutlierIQRCheck
+from utils.sketches import KLLSketch
+
+
+@pytest.mark.parametrize("q", [0.1, 0.25, 0.5, 0.75, 0.9, 0.999])
+def test_kll_quantile_matches_pandas_before_compaction(q):
+    values = pd.Series([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0, 5.0])
+    sketch = KLLSketch(k=200)
+    sketch.update(values.to_numpy()[:6])
+    sketch.update(values.to_numpy()[6:])
+
+    assert sketch.quantile(q) == pytest.approx(values.quantile(q))
+
+
+def test_kll_quantile_stays_within_rank_error():
+    values = np.random.default_rng(0).normal(size=100_000)
+    sketch = KLLSketch.for_error(0.01)
+    sketch.update(values)
+
+    for q in (0.25, 0.5, 0.75):
+        assert abs((values < sketch.quantile(q)).mean() - q) <= 0.01
+
+
+def test_chunked_outlier_counts_match_eager_below_sketch_capacity():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": np.r_[rng.normal(size=192), [8.0, -9.0, 12.5]], "y": rng.exponential(size=195)})
+    check = OutlierIQRCheck()
+    accumulator = check.create_accumulator()
+    for start in range(0, len(df), 50):
+        accumulator.update(df.iloc[start:start + 50])
+
+    eager = check.run(df).details["outlier_count_per_column"]
+    assert check.finalize(accumulator).details["outlier_count_per_column"] == eager
@@ -0,0 +1,68 @@
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from utils.column_stats import ColumnStatsContext
+from utils.info_extraction.statistics_extractor import StatisticsExtractor
+
+CHURN = os.path.join(os.path.dirname(__file__), os.pardir, "data", "churn.csv")
+# `code` reads as int64, then float64 (integral), then text.
+CSV = "code,n\n1,1\n2,2\n1,3\n,4\n2,5\n7,6\nA7,7\n1.50,8\n"
+
+
+def _chunked(extractor, read, chunksize):
+    """Stream `read(chunksize=...)`, then recount mixed columns from a text read, as StreamingProfiler does."""
+    accumulator = extractor.create_accumulator()
+    for chunk in read(chunksize=chunksize):
+        accumulator.update(chunk)
+    columns = accumulator.recount_columns
+    if columns:
+        accumulator.recount(read(chunksize=chunksize, usecols=columns, dtype={col: str for col in columns}))
+    return extractor.finalize(accumulator), columns
+
+
+def test_chunked_matches_eager_when_column_turns_to_text():
+    extractor = StatisticsExtractor()
+    eager = extractor.extract(pd.read_csv(io.StringIO(CSV)))
+    chunked, recounted = _chunked(extractor, lambda **kw: pd.read_csv(io.StringIO(CSV), **kw), 3)
+
+    assert recounted == ["code"]
+    assert eager["code"] == {"unique_values": 5, "top_values": {"1": 2, "2": 2, "7": 1}, "missing": 1}
+    assert chunked["code"] == eager["code"]
+
+
+def test_chunked_matches_eager_on_churn():
+    extractor = StatisticsExtractor()
+    eager = extractor.extract(pd.read_csv(CHURN))
+    chunked, recounted = _chunked(extractor, lambda **kw: pd.read_csv(CHURN, **kw), 500)
+
+    assert recounted == ["TotalCharges"]
+
+    assert chunked["TotalCharges"] == eager["TotalCharges"]
+    for col, stats in eager.items():
+        if "mean" in stats:
+            assert chunked[col] == pytest.approx(stats), col
+        else:
+            assert chunked[col] == stats, col
+
+
+def test_sketch_mode_builds_no_categorical_summaries():
+    df = pd.read_csv(CHURN)
+    context = ColumnStatsContext.of(df)
+    stats = StatisticsExtractor(mode="sketch").extract(df, context=context)
+
+    assert not [key for key in context._cache if isinstance(key, tuple) and key[0] == "categorical"]
+    assert stats["TotalCharges"]["missing"] == 0
+    assert stats["TotalCharges"]["approximate"] is True
+
+
+def test_numeric_chunks_keep_no_value_counts():
+    extractor = StatisticsExtractor()
+    accumulator = extractor.create_accumulator()
+    for chunk in pd.read_csv(CHURN, chunksize=500):
+        accumulator.update(chunk)
+
+    assert not accumulator.columns["MonthlyCharges"].counts
+    assert extractor.finalize(accumulator)["TotalCharges"] == {"missing": 0, "recount_needed": True}
@@ -0,0 +1,248 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from utils.row_fingerprints import RowFingerprintStore, hashable_frame, row_fingerprints
+from utils.sketches import HyperLogLog, KLLSketch
+
+
+class Accumulator(ABC):
+    """
+    Mergeable partial state for one extractor or check.
+    - update(chunk): fold one DataFrame chunk into the state
+    - merge(other): fold another accumulator of the same type into this one
+    Accumulators never keep the chunks themselves, only bounded summaries.
+    """
+
+    @abstractmethod
+    def update(self, chunk: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def merge(self, other: "Accumulator") -> None:
+        raise NotImplementedError
+
+
+class ShapeAccumulator(Accumulator):
+    """Counts rows and remembers the column layout."""
+
+    def __init__(self):
+        self.row_count = 0
+        self.columns: List = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.row_count += len(chunk)
+        if not self.columns:
+            self.columns = list(chunk.columns)
+
+    def merge(self, other: "ShapeAccumulator") -> None:
+        self.row_count += other.row_count
+        if not self.columns:
+            self.columns = list(other.columns)
+
+
+class NullCountAccumulator(ShapeAccumulator):
+    """Row count plus per-column null counts."""
+
+    def __init__(self):
+        super().__init__()
+        self.null_counts: Dict = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        super().update(chunk)
+        for col, count in chunk.isna().sum().items():
+            self.null_counts[col] = self.null_counts.get(col, 0) + int(count)
+
+    def merge(self, other: "NullCountAccumulator") -> None:
+        super().merge(other)
+        for col, count in other.null_counts.items():
+            self.null_counts[col] = self.null_counts.get(col, 0) + count
+
+
+class RowHashAccumulator(Accumulator):
+    """
+    Exact duplicate-row detection over a stream of chunks.
+    Keeps one 64-bit hash per distinct row and a small sample of duplicate rows.
+    """
+
+    def __init__(self, sample_size: int = 5):
+        self.sample_size = sample_size
+        self.row_count = 0
+        self.duplicate_count = 0
+        self.seen = set()
+        self.sample_rows: List[dict] = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.row_count += len(chunk)
+        if chunk.empty:
+            return
+
+        hashes = pd.util.hash_pandas_object(hashable_frame(chunk), index=False)
+        in_chunk = hashes.duplicated().to_numpy()
+        seen = self.seen
+        in_seen = np.fromiter((h in seen for h in hashes.tolist()), dtype=bool, count=len(hashes))
+        duplicate_mask = in_chunk | in_seen
+
+        self.duplicate_count += int(duplicate_mask.sum())
+        seen.update(hashes.tolist())
+
+        missing = self.sample_size - len(self.sample_rows)
+        if missing > 0 and duplicate_mask.any():
+            self.sample_rows.extend(chunk[duplicate_mask].head(missing).to_dict(orient="records"))
+
+    def merge(self, other: "RowHashAccumulator") -> None:
+        # Rows of `other` that were already seen here are duplicates as well.
+        overlap = len(self.seen & other.seen)
+        self.row_count += other.row_count
+        self.duplicate_count += other.duplicate_count + overlap
+        self.seen |= other.seen
+        self.sample_rows = (self.sample_rows + other.sample_rows)[:self.sample_size]
+
+
+class _ChunkDuplicateSampler:
+    """Collects sample duplicate rows from duplicates found within a single chunk."""
+
+    def __init__(self, sample_size: int):
+        self.sample_size = sample_size
+        self.sample_rows: List[dict] = []
+
+    def offer(self, chunk: pd.DataFrame, h1: np.ndarray, h2: np.ndarray) -> None:
+        missing = self.sample_size - len(self.sample_rows)
+        if missing <= 0:
+            return
+        mask = pd.DataFrame({"h1": h1, "h2": h2}).duplicated().to_numpy()
+        if mask.any():
+            self.sample_rows.extend(chunk[mask].head(missing).to_dict(orient="records"))
+
+    def merge(self, other: "_ChunkDuplicateSampler") -> None:
+        self.sample_rows = (self.sample_rows + other.sample_rows)[:self.sample_size]
+
+
+class RowFingerprintAccumulator(Accumulator):
+    """
+    Exact duplicate counting with 128-bit row fingerprints in a
+    RowFingerprintStore that spills to disk past its memory budget.
+    Sample rows are best-effort: only duplicates found within one chunk.
+    """
+
+    def __init__(self, sample_size: int = 5, memory_budget_bytes: int = 256 * 1024 ** 2,
+                 num_partitions: int = 64, spill_dir: str = None):
+        self.store = RowFingerprintStore(memory_budget_bytes, num_partitions, spill_dir)
+        self.sampler = _ChunkDuplicateSampler(sample_size)
+
+    @property
+    def row_count(self) -> int:
+        return self.store.row_count
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        h1, h2 = row_fingerprints(chunk)
+        start = self.store.row_count
+        self.store.add(h1, h2, np.arange(start, start + len(chunk)))
+        self.sampler.offer(chunk, h1, h2)
+
+    def merge(self, other: "RowFingerprintAccumulator") -> None:
+        # Positions of `other` are shifted to follow this accumulator's rows.
+        offset = self.store.row_count
+        for p in range(other.store.num_partitions):
+            records = other.store._load_partition(p)
+            if records.size:
+                self.store.add(records["h1"], records["h2"], records["pos"] + offset)
+        self.sampler.merge(other.sampler)
+
+    def result(self):
+        """(duplicate_count, sample_rows)"""
+        duplicate_count, _ = self.store.scan(sample_size=0)
+        return duplicate_count, self.sampler.sample_rows
+
+
+class DistinctRowsAccumulator(Accumulator):
+    """
+    Approximate duplicate counting in constant memory:
+    duplicates = rows - HyperLogLog estimate of distinct rows.
+    """
+
+    def __init__(self, sample_size: int = 5, precision: int = 14):
+        self.row_count = 0
+        self.hll = HyperLogLog(precision)
+        self.sampler = _ChunkDuplicateSampler(sample_size)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.row_count += len(chunk)
+        if chunk.empty:
+            return
+        h1, h2 = row_fingerprints(chunk)
+        self.hll.update_hashes(h1)
+        self.sampler.offer(chunk, h1, h2)
+
+    def merge(self, other: "DistinctRowsAccumulator") -> None:
+        self.row_count += other.row_count
+        self.hll.merge(other.hll)
+        self.sampler.merge(other.sampler)
+
+    def estimated_duplicates(self) -> int:
+        distinct = min(self.hll.estimate(), self.row_count)
+        return int(round(self.row_count - distinct))
+
+
+class QuantileSketchAccumulator(Accumulator):
+    """
+    Keeps one mergeable KLL quantile sketch per numeric column, so quartiles
+    and rank queries cost constant memory however many rows stream past.
+    """
+
+    def __init__(self, relative_error: float = 0.01):
+        self.relative_error = relative_error
+        self.row_count = 0
+        self.sketches: Dict = {}
+        # Up to three distinct values per column, enough to tell binaries apart.
+        self.distinct: Dict = {}
+        self.non_numeric = set()
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.row_count += len(chunk)
+        for col in chunk.columns:
+            if col in self.non_numeric:
+                continue
+            series = chunk[col]
+            if not pd.api.types.is_numeric_dtype(series):
+                if series.notna().any():
+                    self._drop(col)
+                continue
+
+            values = series.dropna().to_numpy(dtype=np.float64)
+            if values.size == 0:
+                continue
+            self._add_distinct(col, values)
+            self._sketch(col).update(values)
+
+    def merge(self, other: "QuantileSketchAccumulator") -> None:
+        self.row_count += other.row_count
+        for col in other.non_numeric:
+            self._drop(col)
+        for col, sketch in other.sketches.items():
+            if col in self.non_numeric:
+                continue
+            self._add_distinct(col, np.fromiter(other.distinct[col], dtype=np.float64))
+            self._sketch(col).merge(sketch)
+
+    def numeric_columns(self) -> List:
+        return list(self.sketches)
+
+    def _sketch(self, col) -> KLLSketch:
+        if col not in self.sketches:
+            self.sketches[col] = KLLSketch.for_error(self.relative_error)
+        return self.sketches[col]
+
+    def _add_distinct(self, col, values: np.ndarray) -> None:
+        distinct = self.distinct.setdefault(col, set())
+        if len(distinct) < 3:
+            distinct.update(np.unique(values)[:3].tolist())
+
+    def _drop(self, col) -> None:
+        self.non_numeric.add(col)
+        self.sketches.pop(col, None)
+        self.distinct.pop(col, None)
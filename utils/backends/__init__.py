@@ -0,0 +1,5 @@
+from utils.backends.base import DataBackend
+from utils.backends.pandas_backend import PandasBackend
+from utils.backends.duckdb_backend import DuckDBBackend
+
+__all__ = ["DataBackend", "PandasBackend", "DuckDBBackend"]
@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+
+class DataBackend(ABC):
+    """
+    Responsible for:
+    - Executing the aggregations that health checks and extractors need
+      (null counts, moments, quantiles, distinct / value counts, duplicates)
+
+    Checks and extractors describe their work in terms of these primitives
+    (`run_on_backend`, `extract_from_backend`), so the same check runs on an
+    in-memory DataFrame (PandasBackend) or inside a query engine over the
+    file itself (DuckDBBackend). Every backend reports types and values the
+    way pandas.read_csv would see them, so results match between backends.
+
+    Column kinds and types follow ColumnStatsContext / SchemaExtractor:
+    kind is 'numeric' | 'string' | 'boolean' | None,
+    type is 'integer' | 'float' | 'boolean' | 'datetime' | 'string'.
+    """
+
+    @property
+    @abstractmethod
+    def columns(self) -> List:
+        pass
+
+    @abstractmethod
+    def row_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def kinds(self) -> Dict:
+        """Column -> statistics family ('numeric', 'string', 'boolean' or None)."""
+
+    @abstractmethod
+    def column_types(self) -> Dict:
+        """Column -> inferred type as reported in the schema."""
+
+    @abstractmethod
+    def null_counts(self) -> Dict:
+        pass
+
+    @abstractmethod
+    def numeric_stats(self, columns: List) -> Dict:
+        """Column -> {mean, std, min, max} over non-null values (sample std)."""
+
+    @abstractmethod
+    def nunique(self, col) -> int:
+        """Distinct non-null values."""
+
+    @abstractmethod
+    def value_counts(self, col, limit: Optional[int] = None) -> Dict:
+        """Value -> count, most frequent first; ties in order of first appearance."""
+
+    @abstractmethod
+    def quantiles(self, col, qs: Tuple[float, ...]) -> Tuple[float, ...]:
+        """Quantiles with linear interpolation (as Series.quantile)."""
+
+    @abstractmethod
+    def count_outside(self, col, lower: float, upper: float) -> int:
+        """Values strictly below `lower` or above `upper`."""
+
+    @abstractmethod
+    def duplicate_rows(self, sample_size: int = 5) -> Tuple[int, list]:
+        """(rows that repeat an earlier row, the first `sample_size` of them as records)."""
+
+    @abstractmethod
+    def head(self, n: int = 5) -> list:
+        """First `n` rows as records."""
+
+    def columns_of_kind(self, kind: str) -> List:
+        return [col for col, k in self.kinds().items() if k == kind]
+
+    @property
+    def numeric_columns(self) -> List:
+        return self.columns_of_kind("numeric")
@@ -0,0 +1,208 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+from utils.backends.base import DataBackend
+
+# pandas.read_csv's default missing-value markers, so both backends see the same nulls.
+PANDAS_NA_VALUES = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+)
+# Spellings pandas.read_csv turns into booleans.
+PANDAS_TRUE_VALUES = ("True", "TRUE", "true")
+PANDAS_FALSE_VALUES = ("False", "FALSE", "false")
+
+_INTEGER_TYPES = ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT",
+                  "UTINYINT", "USMALLINT", "UINTEGER", "UBIGINT", "UHUGEINT")
+_FLOAT_TYPES = ("FLOAT", "DOUBLE", "REAL")
+_DATETIME_PREFIXES = ("DATE", "TIMESTAMP", "TIME")
+
+
+def _quote(name) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _float(value) -> float:
+    return float("nan") if value is None else float(value)
+
+
+class DuckDBBackend(DataBackend):
+    """
+    Aggregations pushed down to DuckDB, straight over a CSV or Parquet file;
+    the data never passes through pandas.
+
+    The file is read once into a DuckDB table (compressed and columnar; it
+    spills to `temp_directory` past `memory_limit`) and every aggregation is
+    a query on it, run with DuckDB's own `threads`. CSV columns are typed the
+    way pandas.read_csv would type them: integers, floats, True/False
+    booleans and everything else as text, with pandas' missing-value markers.
+    Moments can differ from pandas in the last bits of a float.
+
+    DuckDB is an optional dependency, imported only when a backend is created.
+    """
+
+    def __init__(self, path: str, threads: int = None, memory_limit: str = None,
+                 temp_directory: str = None, read_options: dict = None):
+        import duckdb
+
+        config = {"preserve_insertion_order": True}
+        if threads:
+            config["threads"] = threads
+        if memory_limit:
+            config["memory_limit"] = memory_limit
+        if temp_directory:
+            config["temp_directory"] = temp_directory
+        self.path = path
+        self.con = duckdb.connect(config=config)
+        self.con.execute(f"CREATE TEMP TABLE data AS SELECT * FROM {self._source(path, read_options or {})}")
+        self._types = dict(self.con.execute(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_name = 'data' ORDER BY ordinal_position"
+        ).fetchall())
+        self._null_counts = None
+        if not path.lower().endswith(".parquet"):
+            self._coerce_like_pandas()
+
+    @staticmethod
+    def _source(path: str, read_options: dict) -> str:
+        if path.lower().endswith(".parquet"):
+            return f"read_parquet({_literal(path)})"
+        options = {
+            # No date / time detection: pandas leaves those columns as text.
+            "auto_type_candidates": "['BIGINT', 'DOUBLE', 'VARCHAR']",
+            "nullstr": "[" + ", ".join(_literal(v) for v in PANDAS_NA_VALUES) + "]",
+            **read_options,
+        }
+        rendered = ", ".join(f"{key} = {value}" for key, value in options.items())
+        return f"read_csv({_literal(path)}, {rendered})"
+
+    def _coerce_like_pandas(self) -> None:
+        """True/False text columns become BOOLEAN, all-null columns DOUBLE (as pandas reads them)."""
+        text_columns = [col for col, dtype in self._types.items() if dtype == "VARCHAR"]
+        if not text_columns:
+            return
+        spellings = ", ".join(_literal(v) for v in PANDAS_TRUE_VALUES + PANDAS_FALSE_VALUES)
+        checks = ", ".join(f"count({_quote(col)}), bool_and({_quote(col)} IN ({spellings}))" for col in text_columns)
+        row = self.con.execute(f"SELECT {checks} FROM data").fetchone()
+        trues = ", ".join(_literal(v) for v in PANDAS_TRUE_VALUES)
+        for i, col in enumerate(text_columns):
+            non_null, all_boolean = row[2 * i], row[2 * i + 1]
+            if non_null == 0:
+                self.con.execute(f"ALTER TABLE data ALTER {_quote(col)} TYPE DOUBLE USING NULL")
+                self._types[col] = "DOUBLE"
+            elif all_boolean:
+                self.con.execute(f"ALTER TABLE data ALTER {_quote(col)} TYPE BOOLEAN "
+                                 f"USING {_quote(col)} IN ({trues})")
+                self._types[col] = "BOOLEAN"
+
+    def close(self) -> None:
+        self.con.close()
+
+    # ---- DataBackend ----
+
+    @property
+    def columns(self) -> List:
+        return list(self._types)
+
+    def row_count(self) -> int:
+        return self.con.execute("SELECT count(*) FROM data").fetchone()[0]
+
+    def kinds(self) -> Dict:
+        kinds = {}
+        for col, dtype in self._types.items():
+            if dtype == "BOOLEAN":
+                # pandas keeps a bool column only without nulls; with nulls it is
+                # an object column that no statistics family claims.
+                kinds[col] = None if self.null_counts()[col] else "numeric"
+            elif dtype in _INTEGER_TYPES or dtype in _FLOAT_TYPES or dtype.startswith("DECIMAL"):
+                kinds[col] = "numeric"
+            elif dtype == "VARCHAR":
+                kinds[col] = "string"
+            else:
+                kinds[col] = None
+        return kinds
+
+    def column_types(self) -> Dict:
+        types = {}
+        for col, dtype in self._types.items():
+            if dtype in _INTEGER_TYPES:
+                # pandas stores an integer column with nulls as float64.
+                types[col] = "float" if self.null_counts()[col] else "integer"
+            elif dtype in _FLOAT_TYPES or dtype.startswith("DECIMAL"):
+                types[col] = "float"
+            elif dtype == "BOOLEAN":
+                types[col] = "string" if self.null_counts()[col] else "boolean"
+            elif dtype.startswith(_DATETIME_PREFIXES):
+                types[col] = "datetime"
+            else:
+                types[col] = "string"
+        return types
+
+    def null_counts(self) -> Dict:
+        if self._null_counts is None:
+            columns = self.columns
+            if not columns:
+                self._null_counts = {}
+            else:
+                counts = ", ".join(f"count(*) - count({_quote(col)})" for col in columns)
+                self._null_counts = dict(zip(columns, self.con.execute(f"SELECT {counts} FROM data").fetchone()))
+        return self._null_counts
+
+    def numeric_stats(self, columns: List) -> Dict:
+        columns = list(columns)
+        if not columns:
+            return {}
+        aggregates = []
+        for col in columns:
+            value = f"CAST({_quote(col)} AS DOUBLE)"
+            aggregates += [f"avg({value})", f"stddev_samp({value})", f"min({value})", f"max({value})"]
+        row = self.con.execute(f"SELECT {', '.join(aggregates)} FROM data").fetchone()
+        return {
+            col: dict(zip(("mean", "std", "min", "max"), map(_float, row[4 * i:4 * i + 4])))
+            for i, col in enumerate(columns)
+        }
+
+    def nunique(self, col) -> int:
+        return self.con.execute(f"SELECT count(DISTINCT {_quote(col)}) FROM data").fetchone()[0]
+
+    def value_counts(self, col, limit: Optional[int] = None) -> Dict:
+        query = (f"SELECT {_quote(col)}, count(*) AS n, min(rowid) AS first FROM data "
+                 f"WHERE {_quote(col)} IS NOT NULL GROUP BY 1 ORDER BY n DESC, first")
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return {value: count for value, count, _ in self.con.execute(query).fetchall()}
+
+    def quantiles(self, col, qs: Tuple[float, ...]) -> Tuple[float, ...]:
+        qs = [float(q) for q in qs]
+        values = self.con.execute(
+            f"SELECT quantile_cont(CAST({_quote(col)} AS DOUBLE), ?::DOUBLE[]) FROM data", [qs]
+        ).fetchone()[0]
+        return tuple(_float(v) for v in values) if values is not None else tuple(math.nan for _ in qs)
+
+    def count_outside(self, col, lower: float, upper: float) -> int:
+        return self.con.execute(
+            f"SELECT count(*) FROM data WHERE {_quote(col)} < ? OR {_quote(col)} > ?", [lower, upper]
+        ).fetchone()[0]
+
+    def duplicate_rows(self, sample_size: int = 5) -> Tuple[int, list]:
+        columns = ", ".join(map(_quote, self.columns))
+        if not columns:
+            return 0, []
+        distinct = self.con.execute(f"SELECT count(*) FROM (SELECT DISTINCT {columns} FROM data)").fetchone()[0]
+        # Every occurrence after the first, in file order (as DataFrame.duplicated()).
+        repeats = (f"SELECT {columns} FROM (SELECT *, rowid AS __row, row_number() OVER "
+                   f"(PARTITION BY {columns} ORDER BY rowid) AS __occurrence FROM data) "
+                   f"WHERE __occurrence > 1 ORDER BY __row LIMIT {int(sample_size)}")
+        return self.row_count() - distinct, self._records(repeats)
+
+    def head(self, n: int = 5) -> list:
+        return self._records(f"SELECT * FROM data ORDER BY rowid LIMIT {int(n)}")
+
+    def _records(self, query: str) -> list:
+        cursor = self.con.execute(query)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
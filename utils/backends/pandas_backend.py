@@ -0,0 +1,59 @@
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.backends.base import DataBackend
+from utils.column_stats import ColumnStatsContext
+from utils.dtype_optimizer import INFERRED_TYPES_ATTR
+
+
+class PandasBackend(DataBackend):
+    """The default backend: aggregations over an in-memory DataFrame, memoized in its ColumnStatsContext."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.context = ColumnStatsContext.of(df)
+
+    @property
+    def columns(self) -> List:
+        return list(self.df.columns)
+
+    def row_count(self) -> int:
+        return self.context.row_count
+
+    def kinds(self) -> Dict:
+        return self.context.kinds
+
+    def column_types(self) -> Dict:
+        from utils.info_extraction.schema_extractor import SchemaExtractor
+        known_types = self.df.attrs.get(INFERRED_TYPES_ATTR, {})
+        infer_type = SchemaExtractor().infer_type
+        return {col: known_types.get(col) or infer_type(self.df[col]) for col in self.df.columns}
+
+    def null_counts(self) -> Dict:
+        return dict(zip(self.df.columns, self.context.null_counts.tolist()))
+
+    def numeric_stats(self, columns: List) -> Dict:
+        return {col: {field: stats[field] for field in ("mean", "std", "min", "max")}
+                for col, stats in self.context.numeric_stats(columns).items()}
+
+    def nunique(self, col) -> int:
+        return self.context.nunique(col)
+
+    def value_counts(self, col, limit: Optional[int] = None) -> Dict:
+        counts = self.context.value_counts(col)
+        return (counts if limit is None else counts.head(limit)).to_dict()
+
+    def quantiles(self, col, qs: Tuple[float, ...]) -> Tuple[float, ...]:
+        return self.context.quantiles(col, qs)
+
+    def count_outside(self, col, lower: float, upper: float) -> int:
+        series = self.df[col]
+        return int(((series < lower) | (series > upper)).sum())
+
+    def duplicate_rows(self, sample_size: int = 5) -> Tuple[int, list]:
+        duplicate_mask = self.df.duplicated()
+        return int(duplicate_mask.sum()), self.df[duplicate_mask].head(sample_size).to_dict(orient="records")
+
+    def head(self, n: int = 5) -> list:
+        return self.df.head(n).to_dict(orient="records")
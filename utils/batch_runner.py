@@ -0,0 +1,168 @@
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List
+
+from utils.data_loader import discover_shards
+
+SECTIONS = ("overview", "data_health")
+MANIFEST_NAME = "_manifest.jsonl"
+
+
+def discover_datasets(patterns: Iterable[str]) -> List[str]:
+    """Expand directories (their *.csv files) and glob patterns into a sorted file list."""
+    paths = set()
+    for pattern in patterns:
+        paths.update(discover_shards(pattern))
+    return sorted(os.path.abspath(p) for p in paths)
+
+
+def dataset_fingerprint(path: str) -> dict:
+    stat = os.stat(path)
+    return {"path": path, "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def compute_local_inputs(path: str, sections: tuple, n_samples: int = 5) -> Dict[str, dict]:
+    """
+    Worker-process step: load one dataset and build every section's LLM input.
+    No LLM calls happen here, so workers need no network connection.
+    """
+    from utils.data_loader import CSVLoader
+    from modules.overview_module import OverviewModule
+    from modules.data_health_module import DataHealthModule
+
+    df = CSVLoader(path).load()
+    inputs = {}
+    if "overview" in sections:
+        inputs["overview"] = OverviewModule(llm_client=None).build_profile(df, file_path=path, n_samples=n_samples)
+    if "data_health" in sections:
+        inputs["data_health"] = DataHealthModule(llm_client=None).build_health_report(df)
+    return inputs
+
+
+class BatchReportRunner:
+    """
+    Responsible for:
+    - Profiling many datasets in parallel worker processes
+    - Sending all section prompts through one shared (rate-limited) LLMClient
+    - Writing one markdown report per dataset and resuming after interruption
+
+    Finished datasets are recorded in `<output_dir>/_manifest.jsonl` together
+    with their size and mtime; they are skipped on the next run unless the
+    file changed.
+    """
+
+    def __init__(self, llm_client, output_dir: str = "reports", workers: int = None,
+                 sections: tuple = SECTIONS, n_samples: int = 5, compactor=None, resume: bool = True,
+                 log=sys.stderr):
+        from utils.overview_generator import OverviewGenerator
+        from utils.data_health_generator import DataHealthGenerator
+
+        self.llm_client = llm_client
+        self.output_dir = output_dir
+        self.workers = workers
+        self.sections = tuple(sections)
+        self.n_samples = n_samples
+        self.resume = resume
+        self.log = log
+        self.generators = {
+            "overview": OverviewGenerator(llm_client=llm_client, compactor=compactor),
+            "data_health": DataHealthGenerator(llm_client=llm_client, compactor=compactor),
+        }
+
+    def run(self, patterns: Iterable[str]) -> dict:
+        """Blocking entry point; returns {"done": n, "skipped": n, "failed": {path: error}}."""
+        return asyncio.run(self.arun(patterns))
+
+    async def arun(self, patterns: Iterable[str]) -> dict:
+        os.makedirs(self.output_dir, exist_ok=True)
+        datasets = discover_datasets(patterns)
+        finished = self._load_manifest() if self.resume else {}
+        pending = [p for p in datasets if finished.get(p) != dataset_fingerprint(p)]
+        names = self._output_names(datasets)
+
+        summary = {"done": 0, "skipped": len(datasets) - len(pending), "failed": {}}
+        self._progress(f"{len(datasets)} datasets, {summary['skipped']} already done, {len(pending)} to run")
+        if not pending:
+            return summary
+
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            tasks = [asyncio.ensure_future(self._report(loop, pool, path, names[path])) for path in pending]
+            for task in asyncio.as_completed(tasks):
+                path, error = await task
+                if error is None:
+                    summary["done"] += 1
+                else:
+                    summary["failed"][path] = error
+                finished_count = summary["done"] + len(summary["failed"])
+                elapsed = time.monotonic() - started
+                self._progress(
+                    f"[{finished_count}/{len(pending)}] {os.path.basename(path)} "
+                    f"{'ok' if error is None else 'FAILED: ' + error} "
+                    f"({finished_count / elapsed:.2f} datasets/s)"
+                )
+
+        if self.llm_client is not None:
+            await self.llm_client.aclose()
+        return summary
+
+    async def _report(self, loop, pool, path: str, name: str):
+        try:
+            fingerprint = dataset_fingerprint(path)
+            inputs = await loop.run_in_executor(pool, compute_local_inputs, path, self.sections, self.n_samples)
+            texts = await asyncio.gather(*(
+                self.generators[section].agenerate(inputs[section]) for section in self.sections
+            ))
+            self._write_report(path, name, dict(zip(self.sections, texts)))
+            self._append_manifest(fingerprint)
+            return path, None
+        except Exception as exc:
+            return path, f"{type(exc).__name__}: {exc}"
+
+    def _write_report(self, path: str, name: str, texts: dict) -> None:
+        titles = {"overview": "Overview", "data_health": "Data Health"}
+        body = [f"# Report: {os.path.basename(path)}", ""]
+        for section, text in texts.items():
+            body += [f"## {titles[section]}", "", text, ""]
+        target = os.path.join(self.output_dir, f"{name}.md")
+        tmp = target + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(body))
+        os.replace(tmp, target)
+
+    def _output_names(self, datasets: List[str]) -> Dict[str, str]:
+        stems = [os.path.splitext(os.path.basename(p))[0] for p in datasets]
+        return {
+            path: stem if stems.count(stem) == 1
+            else f"{stem}-{hashlib.sha1(path.encode('utf-8')).hexdigest()[:8]}"
+            for path, stem in zip(datasets, stems)
+        }
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        finished = {}
+        manifest = os.path.join(self.output_dir, MANIFEST_NAME)
+        if os.path.exists(manifest):
+            with open(manifest, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut short by an interruption
+                    finished[entry["path"]] = entry
+        return finished
+
+    def _append_manifest(self, fingerprint: dict) -> None:
+        with open(os.path.join(self.output_dir, MANIFEST_NAME), "a", encoding="utf-8") as f:
+            f.write(json.dumps(fingerprint) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _progress(self, message: str) -> None:
+        if self.log is not None:
+            print(message, file=self.log, flush=True)
@@ -1,4 +1,18 @@
 from utils.data_health_base import BaseHealthCheck, HealthCheckResult
+from utils.accumulators import (
+    ShapeAccumulator,
+    NullCountAccumulator,
+    RowHashAccumulator,
+    RowFingerprintAccumulator,
+    DistinctRowsAccumulator,
+    QuantileSketchAccumulator,
+)
+from utils.column_stats import ColumnStatsContext, at_most_two_values
+from utils.executors import COLUMN_EXECUTOR_MODES, map_ordered
+from utils.shared_columns import shared_outlier_counts
+from utils.sketches import KLLSketch
+from functools import partial
+import numpy as np
 import pandas as pd
 
 class EmptyDatasetCheck(BaseHealthCheck):
@@ -9,10 +23,20 @@ class EmptyDatasetCheck(BaseHealthCheck):
     """
 
     def run(self, df: pd.DataFrame) -> HealthCheckResult:
+        return self._build_result(len(df), len(df.columns))
 
-        is_empty = df.empty
-        row_count = len(df)
-        column_count = len(df.columns)
+    def create_accumulator(self) -> ShapeAccumulator:
+        return ShapeAccumulator()
+
+    def finalize(self, accumulator: ShapeAccumulator) -> HealthCheckResult:
+        return self._build_result(accumulator.row_count, len(accumulator.columns))
+
+    def run_on_backend(self, backend) -> HealthCheckResult:
+        return self._build_result(backend.row_count(), len(backend.columns))
+
+    def _build_result(self, row_count: int, column_count: int) -> HealthCheckResult:
+
+        is_empty = row_count == 0 or column_count == 0
 
         if is_empty:
             status = "critical"
@@ -43,7 +67,26 @@ class NullRatioCheck(BaseHealthCheck):
         self.critical_threshold = critical_threshold
 
     def run(self, df) -> HealthCheckResult:
-        null_ratios = df.isna().mean().to_dict()
+        null_ratios = ColumnStatsContext.of(df).null_ratios.to_dict()
+        return self._build_result(null_ratios)
+
+    def create_accumulator(self) -> NullCountAccumulator:
+        return NullCountAccumulator()
+
+    def finalize(self, accumulator: NullCountAccumulator) -> HealthCheckResult:
+        rows = accumulator.row_count
+        null_ratios = {
+            col: (accumulator.null_counts.get(col, 0) / rows if rows else float("nan"))
+            for col in accumulator.columns
+        }
+        return self._build_result(null_ratios)
+
+    def run_on_backend(self, backend) -> HealthCheckResult:
+        rows = backend.row_count()
+        null_ratios = {col: (count / rows if rows else float("nan")) for col, count in backend.null_counts().items()}
+        return self._build_result(null_ratios)
+
+    def _build_result(self, null_ratios: dict) -> HealthCheckResult:
         max_null = max(null_ratios.values()) if null_ratios else 0
 
         if max_null >= self.critical_threshold:
@@ -70,17 +113,85 @@ class DuplicateRowsCheck(BaseHealthCheck):
         - duplicate_count
         - duplicate_percentage
         - sample_duplicates (first 5 duplicate rows)
+    mode:
+    - 'exact': df.duplicated(), one in-memory hash table over whole rows
+    - 'fingerprint': exact counts from 128-bit row hashes, partitioned by hash
+      prefix and spilled to temp files past `memory_budget_bytes`
+    - 'approximate': HyperLogLog distinct-row estimate in constant memory
     """
 
-    def __init__(self, warning_threshold=0.05, critical_threshold=0.2):
+    MODES = ("exact", "fingerprint", "approximate")
+
+    def __init__(self, warning_threshold=0.05, critical_threshold=0.2, mode="exact",
+                 memory_budget_bytes=256 * 1024 ** 2, num_partitions=64, spill_dir=None,
+                 hll_precision=14, batch_rows=1_000_000):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {self.MODES}.")
         self.warning_threshold = warning_threshold
         self.critical_threshold = critical_threshold
+        self.mode = mode
+        self.memory_budget_bytes = memory_budget_bytes
+        self.num_partitions = num_partitions
+        self.spill_dir = spill_dir
+        self.hll_precision = hll_precision
+        self.batch_rows = batch_rows
 
     def run(self, df: pd.DataFrame) -> HealthCheckResult:
 
+        if self.mode != "exact":
+            accumulator = self.create_accumulator()
+            for start in range(0, len(df), self.batch_rows):
+                accumulator.update(df.iloc[start:start + self.batch_rows])
+            if self.mode == "approximate":
+                return self.finalize(accumulator)
+            duplicate_count, positions = accumulator.store.scan(sample_size=5)
+            accumulator.store.close()
+            sample_duplicates = df.iloc[positions].to_dict(orient="records")
+            return self._build_result(duplicate_count, len(df), sample_duplicates)
+
         duplicate_mask = df.duplicated()
         duplicate_count = int(duplicate_mask.sum())
-        duplicate_percentage = float(duplicate_count / len(df)) if len(df) > 0 else 0
+
+        # get small sample of duplicate rows
+        sample_duplicates = df[duplicate_mask].head().to_dict(orient="records")
+
+        return self._build_result(duplicate_count, len(df), sample_duplicates)
+
+    def run_on_backend(self, backend) -> HealthCheckResult:
+        # The engine counts exactly and manages its own memory, whatever the mode.
+        duplicate_count, sample_duplicates = backend.duplicate_rows(sample_size=5)
+        return self._build_result(duplicate_count, backend.row_count(), sample_duplicates)
+
+    def create_accumulator(self):
+        if self.mode == "fingerprint":
+            return RowFingerprintAccumulator(5, self.memory_budget_bytes, self.num_partitions, self.spill_dir)
+        if self.mode == "approximate":
+            return DistinctRowsAccumulator(5, self.hll_precision)
+        return RowHashAccumulator(sample_size=5)
+
+    def finalize(self, accumulator) -> HealthCheckResult:
+        if isinstance(accumulator, RowFingerprintAccumulator):
+            duplicate_count, sample_rows = accumulator.result()
+            return self._build_result(duplicate_count, accumulator.row_count, sample_rows)
+
+        if isinstance(accumulator, DistinctRowsAccumulator):
+            rows = accumulator.row_count
+            estimate = accumulator.estimated_duplicates()
+            # Two standard errors of the distinct-count estimate.
+            margin = 2 * accumulator.hll.relative_error * (rows - estimate)
+            result = self._build_result(estimate, rows, accumulator.sampler.sample_rows)
+            result.details["duplicate_count_bounds"] = [
+                max(int(np.floor(estimate - margin)), 0), min(int(np.ceil(estimate + margin)), rows)
+            ]
+            result.details["approximate"] = True
+            return result
+
+        return self._build_result(
+            accumulator.duplicate_count, accumulator.row_count, accumulator.sample_rows
+        )
+
+    def _build_result(self, duplicate_count: int, row_count: int, sample_duplicates: list) -> HealthCheckResult:
+        duplicate_percentage = float(duplicate_count / row_count) if row_count > 0 else 0
 
         # status decision
         if duplicate_percentage >= self.critical_threshold:
@@ -90,9 +201,6 @@ class DuplicateRowsCheck(BaseHealthCheck):
         else:
             status = "healthy"
 
-        # get small sample of duplicate rows
-        sample_duplicates = df[duplicate_mask].head().to_dict(orient="records")
-
         return HealthCheckResult(
             name="Duplicate Rows Check",
             status=status,
@@ -105,33 +213,179 @@ class DuplicateRowsCheck(BaseHealthCheck):
             }
         )
 
+def _at_most_two_values(series: pd.Series) -> bool:
+    return at_most_two_values(series.to_numpy(dtype=np.float64, na_value=np.nan))
+
+
+def _iqr_outlier_count(series: pd.Series, q1: float = None, q3: float = None):
+    """Number of IQR outliers in `series`, or None for binary/constant columns."""
+    if q1 is None:
+        if _at_most_two_values(series):
+            return None
+        q1, q3 = series.quantile([0.25, 0.75])
+    iqr = q3 - q1
+    lower, upper = q1 - 1.5*iqr, q3 + 1.5*iqr
+    return int(((series < lower) | (series > upper)).sum())
+
+
+def _sketch_outlier_estimate(sketch: KLLSketch):
+    """
+    Estimated IQR outlier count from a quantile sketch, with error bars.
+    Returns (estimate, [low, high]). The bounds cover both the uncertainty of
+    the quartiles and the sketch's rank error on the counts.
+    """
+    n, eps = sketch.count, sketch.rank_error
+
+    def outside(lower, upper):
+        return n * (sketch.rank(lower) + 1 - sketch.rank(upper, inclusive=True))
+
+    def fences(q1, q3):
+        iqr = max(q3 - q1, 0)
+        return q1 - 1.5*iqr, q3 + 1.5*iqr
+
+    q1, q3 = sketch.quantile(0.25), sketch.quantile(0.75)
+    q1_lo, q1_hi = sketch.quantile(0.25 - eps), sketch.quantile(0.25 + eps)
+    q3_lo, q3_hi = sketch.quantile(0.75 - eps), sketch.quantile(0.75 + eps)
+
+    estimate = outside(*fences(q1, q3))
+    # Widest fences give the fewest outliers, narrowest fences the most.
+    low = outside(*fences(q1_lo, q3_hi)) - 2*eps*n
+    high = outside(*fences(q1_hi, q3_lo)) + 2*eps*n
+
+    low, high = max(int(np.floor(min(low, estimate))), 0), min(int(np.ceil(max(high, estimate))), n)
+    return int(round(estimate)), [low, high]
+
+
+def _sketch_column_estimate(series: pd.Series, relative_error: float, batch_size: int,
+                            sample_size: int = None, check_binary: bool = False):
+    """Sketch one column (fully, or from a random sample) and estimate its outliers."""
+    if check_binary and _at_most_two_values(series):
+        return None
+    values = series.dropna().to_numpy(dtype=np.float64)
+    sketch = KLLSketch.for_error(relative_error)
+    if sample_size and values.size > sample_size:
+        rng = np.random.default_rng(0)
+        sketch.update(values[rng.choice(values.size, sample_size, replace=False)])
+        # The sampled sketch stands in for the full column: rescale the counts.
+        estimate, (low, high) = _sketch_outlier_estimate(sketch)
+        scale = values.size / sample_size
+        return int(round(estimate * scale)), [int(low * scale), int(np.ceil(high * scale))]
+    for start in range(0, values.size, batch_size):
+        sketch.update(values[start:start + batch_size])
+    return _sketch_outlier_estimate(sketch)
+
+
 class OutlierIQRCheck(BaseHealthCheck):
     """
     Detects outliers in numeric columns using the IQR method.
+    mode:
+    - 'exact': pandas quantiles and boolean masks over the full column
+    - 'approximate': a KLL quantile sketch per column with `relative_error`
+      rank error, fed in slices of `sketch_batch_size` values (or from a random
+      sample of `sketch_sample_size` values); counts come with error bounds.
+      Bounds on sampled sketches cover the sketch error only, not sampling error.
+    Chunked input always uses the approximate path.
+    executor: 'serial' | 'thread' | 'process' | 'shared' — how the per-column work is fanned out.
+    'shared' places the numeric columns in shared memory once and lets worker
+    processes attach to them instead of pickling each column (approximate mode
+    falls back to 'process').
     """
 
-    def __init__(self, warning_threshold=0.05, critical_threshold=0.1, sample_size=5):
+    def __init__(self, warning_threshold=0.05, critical_threshold=0.1, sample_size=5,
+                 executor="serial", max_workers=None, mode="exact", relative_error=0.01,
+                 sketch_batch_size=1_000_000, sketch_sample_size=None):
 
+        if mode not in ("exact", "approximate"):
+            raise ValueError(f"Unknown mode {mode!r}; expected 'exact' or 'approximate'.")
+        if executor not in COLUMN_EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode {executor!r}; expected one of {COLUMN_EXECUTOR_MODES}.")
         self.warning_threshold = warning_threshold
         self.critical_threshold = critical_threshold
         self.sample_size = sample_size
+        self.executor = executor
+        self.max_workers = max_workers
+        self.mode = mode
+        self.relative_error = relative_error
+        self.sketch_batch_size = sketch_batch_size
+        self.sketch_sample_size = sketch_sample_size
 
     def run(self, df: pd.DataFrame) -> HealthCheckResult:
-        numeric_cols = df.select_dtypes(include='number').columns
-        numeric_cols = [c for c in numeric_cols if df[c].nunique() > 2]  # فقط الأعمدة المتنوعة
-        outlier_counts = {}
-        outlier_samples = {}
+        context = ColumnStatsContext.of(df)
+        numeric_cols = context.numeric_columns
+
+        if self.mode == "approximate":
+            if self.executor in ("process", "shared"):
+                estimates = map_ordered(partial(_sketch_column_estimate, check_binary=True, **self._sketch_options()),
+                                        (df[c] for c in numeric_cols), mode="process", max_workers=self.max_workers)
+            else:
+                estimates = map_ordered(lambda col: self._column_sketch_estimate(context, col), numeric_cols,
+                                        mode=self.executor, max_workers=self.max_workers)
+            estimates = {col: est for col, est in zip(numeric_cols, estimates) if est is not None}
+            return self._build_sketch_result(estimates, len(df))
+
+        if self.executor == "shared":
+            counts = shared_outlier_counts(df, numeric_cols, max_workers=self.max_workers).values()
+        elif self.executor == "process":
+            # Workers cannot see this process's context; each gets its own column.
+            counts = map_ordered(_iqr_outlier_count, (df[c] for c in numeric_cols),
+                                 mode="process", max_workers=self.max_workers)
+        else:
+            counts = map_ordered(lambda col: self._column_outliers(context, col), numeric_cols,
+                                 mode=self.executor, max_workers=self.max_workers)
 
-        for col in numeric_cols:
-            q1, q3 = df[col].quantile([0.25, 0.75])
+        # فقط الأعمدة المتنوعة
+        outlier_counts = {col: count for col, count in zip(numeric_cols, counts) if count is not None}
+
+        return self._build_result(outlier_counts, len(df))
+
+    def run_on_backend(self, backend) -> HealthCheckResult:
+        """Exact IQR counts from the backend's quantiles (the mode and executor do not apply)."""
+        outlier_counts = {}
+        for col in backend.numeric_columns:
+            if backend.nunique(col) <= 2:
+                continue
+            q1, q3 = backend.quantiles(col, (0.25, 0.75))
             iqr = q3 - q1
-            lower, upper = q1 - 1.5*iqr, q3 + 1.5*iqr
-            mask = (df[col] < lower) | (df[col] > upper)
-            count = int(mask.sum())
-            outlier_counts[col] = count
-            outlier_samples[col] = df.loc[mask].head(self.sample_size).to_dict(orient='records')
+            outlier_counts[col] = backend.count_outside(col, q1 - 1.5*iqr, q3 + 1.5*iqr)
+        return self._build_result(outlier_counts, backend.row_count())
+
+    def _column_outliers(self, context: ColumnStatsContext, col):
+        if context.at_most_two_values(col):
+            return None
+        q1, q3 = context.quantiles(col, (0.25, 0.75))
+        return _iqr_outlier_count(context.df[col], q1, q3)
+
+    def _column_sketch_estimate(self, context: ColumnStatsContext, col):
+        if context.at_most_two_values(col):
+            return None
+        return _sketch_column_estimate(context.df[col], **self._sketch_options())
+
+    def _sketch_options(self) -> dict:
+        return {
+            "relative_error": self.relative_error,
+            "batch_size": self.sketch_batch_size,
+            "sample_size": self.sketch_sample_size,
+        }
+
+    def create_accumulator(self) -> QuantileSketchAccumulator:
+        return QuantileSketchAccumulator(relative_error=self.relative_error)
+
+    def finalize(self, accumulator: QuantileSketchAccumulator) -> HealthCheckResult:
+        estimates = {
+            col: _sketch_outlier_estimate(sketch)
+            for col, sketch in accumulator.sketches.items()
+            if len(accumulator.distinct[col]) > 2
+        }
+        return self._build_sketch_result(estimates, accumulator.row_count)
+
+    def _build_sketch_result(self, estimates: dict, row_count: int) -> HealthCheckResult:
+        result = self._build_result({col: est for col, (est, _) in estimates.items()}, row_count)
+        result.details["outlier_count_bounds_per_column"] = {col: bounds for col, (_, bounds) in estimates.items()}
+        result.details["relative_error"] = self.relative_error
+        return result
 
-        max_outlier_pct = max((count/len(df) for count in outlier_counts.values()), default=0)
+    def _build_result(self, outlier_counts: dict, row_count: int) -> HealthCheckResult:
+        max_outlier_pct = max((count/row_count for count in outlier_counts.values()), default=0)
 
         if max_outlier_pct >= self.critical_threshold:
             status = "critical"
@@ -0,0 +1,285 @@
+import threading
+import weakref
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Numeric columns are reduced in batches of roughly this many bytes (as float64).
+_BLOCK_BYTES = 32 * 1024 ** 2
+_MOMENT_FIELDS = ["missing", "mean", "std", "min", "max"]
+
+
+def column_kind(series: pd.Series):
+    """Statistics family of a column: 'numeric', 'string', 'boolean' or None."""
+    if pd.api.types.is_numeric_dtype(series):
+        return "numeric"
+    if pd.api.types.is_string_dtype(series):
+        return "string"
+    if pd.api.types.is_bool_dtype(series):
+        return "boolean"
+    return None
+
+
+def at_most_two_values(values: np.ndarray, low: float = None, high: float = None) -> bool:
+    """
+    True when a float array holds at most two distinct non-NaN values.
+    Tests for a value strictly between min and max instead of building a
+    hash table as nunique() would; pass `low` / `high` when already known.
+    """
+    if low is None:
+        if values.size == 0 or np.isnan(values).all():
+            return True
+        low, high = np.nanmin(values), np.nanmax(values)
+    return not ((values > low) & (values < high)).any()
+
+
+def block_moments(values: np.ndarray, columns: list) -> pd.DataFrame:
+    """missing / mean / std / min / max of every column of a 2-D float array in one set of NumPy passes."""
+    rows = values.shape[0]
+    missing = np.isnan(values)
+    missing_counts = missing.sum(axis=0)
+    count = rows - missing_counts
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(missing, 0.0, values).sum(axis=0) / count
+        deviations = np.where(missing, 0.0, values - mean)
+        std = np.sqrt((deviations * deviations).sum(axis=0) / (count - 1))
+    std[count < 2] = np.nan
+    if rows:
+        # fmin / fmax skip NaN and return NaN only for all-NaN columns.
+        minimum, maximum = np.fmin.reduce(values, axis=0), np.fmax.reduce(values, axis=0)
+    else:
+        minimum = maximum = np.full(len(columns), np.nan)
+    return pd.DataFrame(
+        {"missing": missing_counts, "mean": mean, "std": std, "min": minimum, "max": maximum},
+        index=pd.Index(columns), columns=_MOMENT_FIELDS
+    )
+
+
+class ColumnStatsContext:
+    """
+    Memoized column primitives for one DataFrame.
+    Every primitive (null counts, dtype families, nunique, quantiles,
+    mean/std/min/max, value counts) is computed at most once and then
+    shared by all checks and extractors that look at the same DataFrame.
+
+    Numeric columns are summarized block-wise: a few NumPy reductions over
+    batches of columns give null counts and all moments at once. String and
+    boolean columns are factorized once each, which yields their null count,
+    number of distinct values and value counts together.
+
+    Use ColumnStatsContext.of(df) to get the shared instance. The context
+    only keeps a weak reference to the DataFrame; call invalidate(df) after
+    mutating a DataFrame in place.
+    """
+
+    _registry: Dict[int, "ColumnStatsContext"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, df: pd.DataFrame):
+        self._df_ref = weakref.ref(df)
+        self._shape = df.shape
+        self._columns = tuple(df.columns)
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, df: pd.DataFrame) -> "ColumnStatsContext":
+        """Shared context for `df`, created on first use."""
+        key = id(df)
+        with cls._registry_lock:
+            context = cls._registry.get(key)
+            if context is not None and context._matches(df):
+                return context
+            context = cls(df)
+            cls._registry[key] = context
+        weakref.finalize(df, cls._forget, key, context)
+        return context
+
+    @classmethod
+    def invalidate(cls, df: pd.DataFrame) -> None:
+        with cls._registry_lock:
+            cls._registry.pop(id(df), None)
+
+    @classmethod
+    def _forget(cls, key: int, context: "ColumnStatsContext") -> None:
+        with cls._registry_lock:
+            if cls._registry.get(key) is context:
+                del cls._registry[key]
+
+    def _matches(self, df: pd.DataFrame) -> bool:
+        return self._df_ref() is df and df.shape == self._shape and tuple(df.columns) == self._columns
+
+    @property
+    def df(self) -> pd.DataFrame:
+        df = self._df_ref()
+        if df is None:
+            raise ReferenceError("The DataFrame behind this ColumnStatsContext no longer exists.")
+        return df
+
+    def _memo(self, key, compute):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        # Computed outside the lock: two threads may race, both get the same value.
+        value = compute()
+        with self._lock:
+            return self._cache.setdefault(key, value)
+
+    # ---- nulls ----
+
+    @property
+    def row_count(self) -> int:
+        return self._shape[0]
+
+    @property
+    def null_counts(self) -> pd.Series:
+        def compute():
+            df = self.df
+            # Reuse block moments and factorized columns when they already exist;
+            # everything else gets one batched isna.
+            counts = {}
+            for col, kind in self.kinds.items():
+                if ("numeric", col) in self._cache:
+                    counts[col] = self._cache[("numeric", col)]["missing"]
+                elif ("categorical", col) in self._cache:
+                    counts[col] = self._cache[("categorical", col)]["missing"]
+            rest = [col for col in df.columns if col not in counts]
+            if rest:
+                counts.update(df[rest].isna().sum().to_dict())
+            return pd.Series([counts[col] for col in df.columns], index=df.columns, dtype=np.int64)
+        return self._memo("null_counts", compute)
+
+    @property
+    def null_ratios(self) -> pd.Series:
+        def compute():
+            if self.row_count == 0:
+                return self.null_counts.astype(float) * float("nan")
+            return self.null_counts / self.row_count
+        return self._memo("null_ratios", compute)
+
+    @property
+    def has_nulls(self) -> pd.Series:
+        return self._memo("has_nulls", lambda: self.null_counts > 0)
+
+    # ---- dtype classification ----
+
+    @property
+    def kinds(self) -> Dict:
+        """Column -> 'numeric' | 'string' | 'boolean' | None."""
+        def compute():
+            df, by_dtype, kinds = self.df, {}, {}
+            for col, dtype in df.dtypes.items():
+                if dtype == object:
+                    # Depends on the values (e.g. strings vs. mixed objects).
+                    kinds[col] = column_kind(df[col])
+                else:
+                    if dtype not in by_dtype:
+                        by_dtype[dtype] = column_kind(df[col])
+                    kinds[col] = by_dtype[dtype]
+            return kinds
+        return self._memo("kinds", compute)
+
+    def columns_of_kind(self, kind: str) -> List:
+        return self._memo(("columns_of_kind", kind),
+                          lambda: [col for col, k in self.kinds.items() if k == kind])
+
+    @property
+    def numeric_columns(self) -> List:
+        return self.columns_of_kind("numeric")
+
+    # ---- per-column primitives ----
+
+    def nunique(self, col) -> int:
+        if self.kinds[col] in ("string", "boolean"):
+            return self._categorical_summary(col)["nunique"]
+        return self._memo(("nunique", col), lambda: int(self.df[col].nunique()))
+
+    def at_most_two_values(self, col) -> bool:
+        """Numeric column with at most two distinct values, from its memoized min / max plus one pass."""
+        def compute():
+            stats = self.numeric_stats([col])[col]
+            values = self.df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            return at_most_two_values(values, stats["min"], stats["max"])
+        return self._memo(("at_most_two_values", col), compute)
+
+    def value_counts(self, col) -> pd.Series:
+        if self.kinds[col] in ("string", "boolean"):
+            return self._categorical_summary(col)["value_counts"]
+        return self._memo(("value_counts", col), lambda: self.df[col].value_counts())
+
+    def summarize_categoricals(self) -> None:
+        """Factorize every string / boolean column now, so null counts reuse the result."""
+        for col, kind in self.kinds.items():
+            if kind in ("string", "boolean"):
+                self._categorical_summary(col)
+
+    def _categorical_summary(self, col) -> dict:
+        """Null count, distinct count and value counts of one column from a single factorize pass."""
+        def compute():
+            series = self.df[col]
+            codes, uniques = pd.factorize(series)
+            valid = codes >= 0
+            counts = np.bincount(codes[valid], minlength=len(uniques))
+            # Stable sort over first-appearance order: ties come out as in Series.value_counts.
+            order = np.argsort(-counts, kind="stable")
+            value_counts = pd.Series(counts[order], index=uniques[order], name="count")
+            value_counts.index.name = series.name
+            return {"missing": int(len(codes) - valid.sum()), "nunique": len(uniques), "value_counts": value_counts}
+        return self._memo(("categorical", col), compute)
+
+    def quantiles(self, col, qs: Tuple[float, ...]) -> Tuple[float, ...]:
+        qs = tuple(qs)
+        return self._memo(("quantiles", col, qs), lambda: tuple(self.df[col].quantile(list(qs))))
+
+    @property
+    def numeric_summary(self) -> pd.DataFrame:
+        """mean / std / min / max for every numeric column, one row per column."""
+        return self._memo("numeric_summary", lambda: self.numeric_block_stats[["mean", "std", "min", "max"]])
+
+    @property
+    def numeric_block_stats(self) -> pd.DataFrame:
+        """missing / mean / std / min / max of every numeric column, computed in column batches."""
+        def compute():
+            stats = self.numeric_stats()
+            return pd.DataFrame([stats[col] for col in self.numeric_columns],
+                                index=pd.Index(self.numeric_columns), columns=_MOMENT_FIELDS)
+        return self._memo("numeric_block_stats", compute)
+
+    def numeric_stats(self, columns: List = None, executor: str = "serial", max_workers: int = None) -> Dict:
+        """
+        Column -> {missing, mean, std, min, max} for numeric `columns` (default: all).
+        Only columns not seen before are computed, together in column batches.
+        executor='shared' spreads the batches over worker processes that read
+        the columns from shared memory (see utils.shared_columns).
+        """
+        columns = self.numeric_columns if columns is None else list(columns)
+        pending = [col for col in columns if ("numeric", col) not in self._cache]
+        if pending and executor == "shared":
+            from utils.shared_columns import shared_numeric_stats
+            for col, row in shared_numeric_stats(self.df, pending, max_workers=max_workers).items():
+                with self._lock:
+                    self._cache.setdefault(("numeric", col), row)
+        elif pending:
+            df = self.df
+            step = max(1, _BLOCK_BYTES // (8 * max(self.row_count, 1)))
+            for i in range(0, len(pending), step):
+                batch = pending[i:i + step]
+                moments = block_moments(df[batch].to_numpy(dtype=np.float64, na_value=np.nan), batch)
+                for col, row in zip(batch, moments.to_dict(orient="records")):
+                    row["missing"] = int(row["missing"])
+                    with self._lock:
+                        self._cache.setdefault(("numeric", col), row)
+        return {col: self._cache[("numeric", col)] for col in columns}
+
+    def null_count(self, col) -> int:
+        """Nulls in one column, reusing whichever summary of it already exists."""
+        if "null_counts" in self._cache:
+            return int(self._cache["null_counts"][col])
+        kind = self.kinds[col]
+        if kind == "numeric":
+            return self.numeric_stats([col])[col]["missing"]
+        if kind in ("string", "boolean"):
+            return self._categorical_summary(col)["missing"]
+        return self._memo(("null_count", col), lambda: int(self.df[col].isna().sum()))
@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from functools import partial
+
+from utils.column_stats import ColumnStatsContext
+from utils.executors import EXECUTOR_MODES, map_ordered
+from utils.instrumentation import Tracer, measure, trace_metrics
 
 class BaseHealthCheck(ABC):
     """Abstract class for all data health checks."""
@@ -8,14 +13,28 @@ class BaseHealthCheck(ABC):
         """Run the health check and return a HealthCheckResult."""
         raise NotImplementedError
 
+    def create_accumulator(self):
+        """Return a fresh Accumulator so the check can run over a stream of chunks."""
+        raise NotImplementedError(f"{type(self).__name__} does not support chunked input.")
+
+    def finalize(self, accumulator) -> "HealthCheckResult":
+        """Turn a filled accumulator into the same result `run` would return."""
+        raise NotImplementedError(f"{type(self).__name__} does not support chunked input.")
+
+    def run_on_backend(self, backend) -> "HealthCheckResult":
+        """Same result as `run`, computed with a DataBackend's aggregations (see utils.backends)."""
+        raise NotImplementedError(f"{type(self).__name__} does not support query backends.")
+
 
 class HealthCheckResult:
     """Holds the output of a health check."""
 
-    def __init__(self, name: str, status: str, details: dict):
+    def __init__(self, name: str, status: str, details: dict, metrics: dict = None):
         self.name = name
         self.status = status  # 'healthy' | 'warning' | 'critical'
         self.details = details
+        # Timing / memory of the check, filled in by HealthValidator.run.
+        self.metrics = metrics
 
     def __repr__(self):
         return f"{self.name} ({self.status}) -> {self.details}"
@@ -26,31 +45,98 @@ class HealthReport:
 
     def __init__(self):
         self.results = []
+        self.metrics = None
 
     def add(self, result: HealthCheckResult):
         self.results.append(result)
 
-    def to_dict(self):
-        return {
-            "checks": [
-                {"name": r.name, "status": r.status, "details": r.details}
-                for r in self.results
-            ]
-        }
+    def to_dict(self, include_metrics: bool = False):
+        """include_metrics adds per-check and total timings (keep it off for LLM prompts)."""
+        checks = []
+        for r in self.results:
+            entry = {"name": r.name, "status": r.status, "details": r.details}
+            if include_metrics:
+                entry["metrics"] = r.metrics
+            checks.append(entry)
+        if include_metrics:
+            return {"checks": checks, "metrics": self.metrics}
+        return {"checks": checks}
 
     def __repr__(self):
         return "\n".join([repr(r) for r in self.results])
 
 
-class HealthValidator:
-    """Coordinator to run multiple health checks."""
+def _run_check(check: BaseHealthCheck, df, track_memory: bool = False) -> HealthCheckResult:
+    with measure(rows=len(df), track_memory=track_memory) as metrics:
+        result = check.run(df)
+    result.metrics = metrics
+    return result
+
 
-    def __init__(self, checks: list):
+class HealthValidator:
+    """
+    Coordinator to run multiple health checks.
+    executor: 'serial' | 'thread' | 'process' — how the checks are scheduled.
+    Results are always reported in the order of `checks`.
+    track_memory: also record each check's peak allocation (tracemalloc, slower).
+    Not available with the thread executor, where tracemalloc cannot tell
+    concurrent checks apart; peak_memory_bytes is None there.
+    tracer: optional Tracer that receives one span per check.
+    """
+
+    def __init__(self, checks: list, executor: str = "serial", max_workers: int = None,
+                 track_memory: bool = False, tracer: Tracer = None):
+        if executor not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode {executor!r}; expected one of {EXECUTOR_MODES}.")
         self.checks = checks
+        self.executor = executor
+        self.max_workers = max_workers
+        self.track_memory = track_memory
+        self.tracer = tracer
 
     def run(self, df) -> HealthReport:
         report = HealthReport()
-        for check in self.checks:
-            result = check.run(df)
+        track_memory = self.track_memory and self.executor != "thread"
+        with measure(rows=len(df)) as report_metrics:
+            # Keeps the shared column statistics alive while the checks run.
+            context = ColumnStatsContext.of(df)
+            results = map_ordered(partial(_run_check, df=df, track_memory=track_memory), self.checks,
+                                  mode=self.executor, max_workers=self.max_workers)
+        for check, result in zip(self.checks, results):
             report.add(result)
+            trace_metrics(self.tracer, type(check).__name__, "health_check", result.metrics, status=result.status)
+        report.metrics = report_metrics
+        trace_metrics(self.tracer, "HealthValidator.run", "health_check", report_metrics)
         return report
+
+    def run_on_backend(self, backend) -> HealthReport:
+        """Run every check through `backend` (e.g. DuckDBBackend over the file); checks run in order."""
+        report = HealthReport()
+        with measure() as report_metrics:
+            for check in self.checks:
+                with measure() as metrics:
+                    result = check.run_on_backend(backend)
+                result.metrics = metrics
+                report.add(result)
+                trace_metrics(self.tracer, type(check).__name__, "health_check", metrics, status=result.status)
+        report.metrics = report_metrics
+        trace_metrics(self.tracer, "HealthValidator.run_on_backend", "health_check", report_metrics)
+        return report
+
+    def create_accumulators(self) -> list:
+        """One accumulator per check, in the same order as `self.checks`."""
+        return [check.create_accumulator() for check in self.checks]
+
+    def finalize(self, accumulators: list) -> HealthReport:
+        report = HealthReport()
+        for check, accumulator in zip(self.checks, accumulators):
+            report.add(check.finalize(accumulator))
+        return report
+
+    def run_chunks(self, chunks) -> HealthReport:
+        """Run every check over an iterable of DataFrame chunks in a single pass."""
+        accumulators = self.create_accumulators()
+        for chunk in chunks:
+            for accumulator in accumulators:
+                accumulator.update(chunk)
+        return self.finalize(accumulators)
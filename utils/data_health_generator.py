@@ -1,14 +1,19 @@
-import json
+from utils.serialization import dumps
+from utils.template_renderer import TemplateRenderer
 
 class DataHealthGenerator:
     """
     Responsible for:
     - Preparing the Data Health prompt
+    - Rendering it from a template instead when there is no llm_client (offline)
     - Calling LLMClient to generate the final report text
     """
 
-    def __init__(self, llm_client):
+    def __init__(self, llm_client, compactor=None):
         self.llm_client = llm_client
+        # Optional PromptCompactor that shrinks the payload to a token budget.
+        self.compactor = compactor
+        self.renderer = TemplateRenderer()
 
         self.system_prompt = """
         You are a senior data quality analyst.
@@ -46,19 +51,44 @@ class DataHealthGenerator:
         - Do NOT invent issues not present in the input.
         """
 
-    def generate(self, health_report: dict) -> str:
+    def build_user_prompt(self, health_report: dict) -> str:
+        if self.compactor is not None:
+            health_report = self.compactor.compact_health_report(health_report)
+        return (
+            "Data Quality Checks JSON:\n"
+            f"{dumps(health_report)}"
+        )
+
+    def generate(self, health_report: dict, on_token=None) -> str:
         """
         Takes the health report dict and returns
         LLM-generated data quality analysis.
+        on_token: optional callback that receives the text as it streams in.
         """
+        if self.llm_client is None:
+            return self._render_offline(health_report, on_token)
 
-        user_prompt = (
-            "Data Quality Checks JSON:\n"
-            f"{json.dumps(health_report, separators=(',', ':'))}"
+        return self.llm_client.chat(
+            system_prompt=self.system_prompt,
+            user_prompt=self.build_user_prompt(health_report),
+            temperature=0,
+            on_token=on_token
         )
 
-        return self.llm_client.chat(
+    async def agenerate(self, health_report: dict, on_token=None) -> str:
+        """Async version of `generate`."""
+        if self.llm_client is None:
+            return self._render_offline(health_report, on_token)
+
+        return await self.llm_client.achat(
             system_prompt=self.system_prompt,
-            user_prompt=user_prompt,
-            temperature=0
+            user_prompt=self.build_user_prompt(health_report),
+            temperature=0,
+            on_token=on_token
         )
+
+    def _render_offline(self, health_report: dict, on_token=None) -> str:
+        text = self.renderer.render_data_health(health_report)
+        if on_token is not None:
+            on_token(text)
+        return text
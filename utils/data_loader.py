@@ -1,6 +1,17 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import numpy as np
 import pandas as pd 
-from typing import Optional
+from typing import Iterator, List, Optional
+
+from utils.dtype_optimizer import DtypeOptimizer
 
 class IDataLoader(ABC):
     """Responsibility: load dataset and provide optional caching."""
@@ -15,15 +26,26 @@ class IDataLoader(ABC):
 
 
 class CSVLoader(IDataLoader):
-    """Loads CSV and supports sampling (preview) without full load."""
-    def __init__(self, file_path: str, read_kwargs: dict = None):
+    """
+    Loads CSV and supports sampling (preview) without full load.
+    With optimize_dtypes=True the narrowest safe dtypes are used (see DtypeOptimizer)
+    and the memory before/after is available in `memory_report` after load().
+    """
+    def __init__(self, file_path: str, read_kwargs: dict = None, optimize_dtypes: bool = False):
         self.file_path = file_path
         self.read_kwargs = read_kwargs or {}
+        self.optimize_dtypes = optimize_dtypes
+        self.memory_report: Optional[dict] = None
         self._df: Optional[pd.DataFrame] = None
 
     def load(self) -> pd.DataFrame:
         if self._df is None:
-            self._df = pd.read_csv(self.file_path, **self.read_kwargs)
+            if self.optimize_dtypes:
+                optimizer = DtypeOptimizer()
+                self._df = optimizer.read(self.file_path, self.read_kwargs)
+                self.memory_report = optimizer.last_report
+            else:
+                self._df = pd.read_csv(self.file_path, **self.read_kwargs)
         return self._df
 
     def preview(self, n: int = 5) -> pd.DataFrame:
@@ -31,4 +53,338 @@ class CSVLoader(IDataLoader):
         if self._df is not None:
             return self._df.head(n)
         # Otherwise read only n rows
+        if self.optimize_dtypes:
+            return DtypeOptimizer().read(self.file_path, self.read_kwargs, nrows=n)
         return pd.read_csv(self.file_path, nrows=n, **self.read_kwargs)
+
+    def iter_chunks(self, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Stream the file in DataFrames of at most `chunksize` rows.
+        Never materializes the whole file; a header-only file yields one empty chunk.
+        """
+        with pd.read_csv(self.file_path, chunksize=chunksize, **self.read_kwargs) as reader:
+            empty = True
+            for chunk in reader:
+                empty = False
+                yield chunk
+        if empty:
+            yield pd.read_csv(self.file_path, nrows=0, **self.read_kwargs)
+
+
+class CachedCSVLoader(IDataLoader):
+    """
+    Loads a CSV through a columnar binary cache.
+    First load: parse with CSVLoader, then write one .npy file per column
+    (text columns as int32 codes + a pickled list of distinct values).
+    Later loads: memory-map the .npy files, so numeric columns are used
+    zero-copy and nothing is parsed. The cache key covers path, size, mtime
+    and read_kwargs; a changed file gets a fresh cache and its older
+    entries are removed, while entries for other read_kwargs of the same
+    file version stay.
+
+    strings_as: 'object' restores text columns with their original dtype;
+    'category' keeps them as categoricals on top of the mapped codes (faster, lighter).
+    Memory-mapped columns are read-only; copy the DataFrame before editing it in place.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, file_path: str, read_kwargs: dict = None, cache_dir: str = ".dataset_cache",
+                 strings_as: str = "object"):
+        if strings_as not in ("object", "category"):
+            raise ValueError("strings_as must be 'object' or 'category'.")
+        self.file_path = file_path
+        self.read_kwargs = read_kwargs or {}
+        self.cache_dir = cache_dir
+        self.strings_as = strings_as
+        self._df: Optional[pd.DataFrame] = None
+
+    def load(self) -> pd.DataFrame:
+        if self._df is None:
+            entry = self._entry_path()
+            if not os.path.exists(os.path.join(entry, "manifest.json")):
+                df = CSVLoader(self.file_path, self.read_kwargs).load()
+                self._write_cache(df, entry)
+            self._df = self._read_cache(entry)
+        return self._df
+
+    def preview(self, n: int = 5) -> pd.DataFrame:
+        if self._df is not None:
+            return self._df.head(n)
+        entry = self._entry_path()
+        if os.path.exists(os.path.join(entry, "manifest.json")):
+            return self._read_cache(entry, nrows=n)
+        return CSVLoader(self.file_path, self.read_kwargs).preview(n)
+
+    @property
+    def cache_hit(self) -> bool:
+        return os.path.exists(os.path.join(self._entry_path(), "manifest.json"))
+
+    def _path_key(self) -> str:
+        return hashlib.sha256(os.path.abspath(self.file_path).encode("utf-8")).hexdigest()[:16]
+
+    def _entry_path(self) -> str:
+        stat = os.stat(self.file_path)
+        version = repr((stat.st_size, stat.st_mtime_ns, sorted(self.read_kwargs.items()), self.FORMAT_VERSION))
+        version_key = hashlib.sha256(version.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{self._path_key()}-{version_key}")
+
+    def _write_cache(self, df: pd.DataFrame, entry: str) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir)
+        columns = []
+        for i, col in enumerate(df.columns):
+            series = df[col]
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+                np.save(os.path.join(tmp, f"{i}.npy"), series.to_numpy())
+                encoding = "array"
+            elif pd.api.types.is_string_dtype(series) or series.dtype == object:
+                codes, uniques = pd.factorize(series, use_na_sentinel=True)
+                np.save(os.path.join(tmp, f"{i}.npy"), codes.astype(np.int32))
+                with open(os.path.join(tmp, f"{i}.values.pkl"), "wb") as f:
+                    pickle.dump(list(uniques), f, protocol=pickle.HIGHEST_PROTOCOL)
+                encoding = "codes"
+            else:
+                with open(os.path.join(tmp, f"{i}.series.pkl"), "wb") as f:
+                    pickle.dump(series.reset_index(drop=True), f, protocol=pickle.HIGHEST_PROTOCOL)
+                encoding = "pickle"
+            columns.append({"name": col, "dtype": str(series.dtype), "encoding": encoding})
+
+        stat = os.stat(self.file_path)
+        with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({"source": os.path.abspath(self.file_path), "size": stat.st_size,
+                       "mtime_ns": stat.st_mtime_ns, "rows": len(df), "columns": columns}, f)
+
+        # Caches of older versions of the file are stale now (other read_kwargs are not).
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(self._path_key() + "-") and path != entry and self._is_stale(path, stat):
+                shutil.rmtree(path, ignore_errors=True)
+        try:
+            os.replace(tmp, entry)
+        except OSError:
+            # Another process wrote the same entry first.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    @staticmethod
+    def _is_stale(entry: str, stat: os.stat_result) -> bool:
+        """Entry written for another size / mtime of the file (or by an older format)."""
+        try:
+            with open(os.path.join(entry, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return True
+        return (manifest.get("size"), manifest.get("mtime_ns")) != (stat.st_size, stat.st_mtime_ns)
+
+    def _read_cache(self, entry: str, nrows: int = None) -> pd.DataFrame:
+        with open(os.path.join(entry, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        rows = manifest["rows"] if nrows is None else min(nrows, manifest["rows"])
+        data = {}
+        for i, info in enumerate(manifest["columns"]):
+            if info["encoding"] == "pickle":
+                with open(os.path.join(entry, f"{i}.series.pkl"), "rb") as f:
+                    data[info["name"]] = pickle.load(f).iloc[:rows]
+                continue
+            values = np.load(os.path.join(entry, f"{i}.npy"), mmap_mode="r")[:rows]
+            if info["encoding"] == "array":
+                data[info["name"]] = values
+                continue
+            with open(os.path.join(entry, f"{i}.values.pkl"), "rb") as f:
+                uniques = pickle.load(f)
+            categorical = pd.Categorical.from_codes(values, categories=pd.Index(uniques, dtype=object))
+            if self.strings_as == "category":
+                data[info["name"]] = categorical
+            else:
+                data[info["name"]] = pd.Series(np.asarray(categorical, dtype=object)).astype(info["dtype"])
+        return pd.DataFrame(data, copy=False)
+
+
+SAMPLING_ATTR = "sampling"
+
+
+class SamplingCSVLoader(IDataLoader):
+    """
+    Loads a uniform random sample of a CSV while streaming it chunk by chunk.
+
+    method='reservoir': exactly `sample_size` rows (or every row of a smaller
+    file), chosen by keeping the rows with the smallest random priorities.
+    method='bernoulli': every row is kept independently with probability `fraction`.
+
+    Rows keep their file order. The sample carries its provenance in
+    df.attrs["sampling"] (method, sample and population row counts), which
+    OverviewModule / DataHealthModule use to attach confidence intervals.
+    Memory is bounded by the chunk size plus the sample.
+    """
+
+    METHODS = ("reservoir", "bernoulli")
+
+    def __init__(self, file_path: str, read_kwargs: dict = None, sample_size: int = 100_000,
+                 method: str = "reservoir", fraction: float = None, seed: int = 0,
+                 chunksize: int = 100_000):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown sampling method {method!r}; expected one of {self.METHODS}.")
+        if method == "bernoulli" and not (fraction and 0 < fraction <= 1):
+            raise ValueError("Bernoulli sampling needs a fraction in (0, 1].")
+        if method == "reservoir" and sample_size < 1:
+            raise ValueError("sample_size must be at least 1.")
+        self.file_path = file_path
+        self.read_kwargs = read_kwargs or {}
+        self.sample_size = sample_size
+        self.method = method
+        self.fraction = fraction
+        self.seed = seed
+        self.chunksize = chunksize
+        self._df: Optional[pd.DataFrame] = None
+
+    def load(self) -> pd.DataFrame:
+        if self._df is None:
+            rng = np.random.default_rng(self.seed)
+            chunks = CSVLoader(self.file_path, self.read_kwargs).iter_chunks(chunksize=self.chunksize)
+            if self.method == "reservoir":
+                sample, population = self._reservoir(chunks, rng)
+            else:
+                sample, population = self._bernoulli(chunks, rng)
+            sample = sample.sort_index().reset_index(drop=True)
+            sample.attrs[SAMPLING_ATTR] = {
+                "method": self.method,
+                "sample_rows": len(sample),
+                "population_rows": population,
+                "fraction": len(sample) / population if population else 1.0,
+                "seed": self.seed,
+            }
+            self._df = sample
+        return self._df
+
+    def preview(self, n: int = 5) -> pd.DataFrame:
+        """First n rows of the random sample (unlike CSVLoader.preview, not the head of the file)."""
+        return self.load().head(n)
+
+    def _reservoir(self, chunks, rng):
+        kept, priorities, population = None, np.empty(0), 0
+        for chunk in chunks:
+            population += len(chunk)
+            chunk_priorities = rng.random(len(chunk))
+            if kept is not None and len(kept) >= self.sample_size:
+                # Only rows that beat the current worst kept row can enter the sample.
+                mask = chunk_priorities < priorities.max()
+                chunk, chunk_priorities = chunk[mask], chunk_priorities[mask]
+            kept = chunk if kept is None else pd.concat([kept, chunk])
+            priorities = np.concatenate([priorities, chunk_priorities])
+            if len(kept) > self.sample_size:
+                keep = np.argpartition(priorities, self.sample_size - 1)[:self.sample_size]
+                kept, priorities = kept.iloc[keep], priorities[keep]
+        return kept, population
+
+    def _bernoulli(self, chunks, rng):
+        parts, population = [], 0
+        for chunk in chunks:
+            population += len(chunk)
+            parts.append(chunk[rng.random(len(chunk)) < self.fraction])
+        return pd.concat(parts), population
+
+
+SHARDS_ATTR = "shards"
+
+
+def is_partitioned_path(path: str) -> bool:
+    """
+    True for a directory or a glob pattern (what PartitionedCSVLoader takes).
+    An existing file is never a pattern, even with '[' or '*' in its name.
+    """
+    if os.path.isfile(path):
+        return False
+    return os.path.isdir(path) or glob.has_magic(path)
+
+
+def discover_shards(path: str) -> List[str]:
+    """
+    The *.csv files of a directory, or the files matching a glob pattern, in
+    sorted order. An existing file is returned as is (see is_partitioned_path).
+    """
+    if os.path.isfile(path):
+        return [path]
+    pattern = os.path.join(path, "*.csv") if os.path.isdir(path) else path
+    return sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+
+
+class PartitionedCSVLoader(IDataLoader):
+    """
+    Loads a dataset stored as many CSV shards: a directory (its *.csv files)
+    or a glob pattern. Shards are parsed in parallel threads (`max_workers`,
+    default one per shard up to the CPU count) and concatenated once, in
+    sorted path order, with a fresh RangeIndex.
+
+    Every shard must have the same columns. A column may be integer in one
+    shard and float in another (the result is float, as one big file would
+    read) or entirely empty in some shards; any other dtype mismatch raises
+    ValueError naming the shard and column.
+
+    After load() the per-shard path, size and row count are in `shards` and
+    df.attrs["shards"], which DatasetMetadataExtractor reports.
+    """
+
+    def __init__(self, path: str, read_kwargs: dict = None, max_workers: int = None):
+        self.path = path
+        self.read_kwargs = read_kwargs or {}
+        self.max_workers = max_workers
+        self.shards: Optional[List[dict]] = None
+        self._df: Optional[pd.DataFrame] = None
+
+    @property
+    def shard_paths(self) -> List[str]:
+        paths = discover_shards(self.path)
+        if not paths:
+            raise FileNotFoundError(f"No CSV shards found for {self.path!r}.")
+        return paths
+
+    def load(self) -> pd.DataFrame:
+        if self._df is None:
+            paths = self.shard_paths
+            workers = min(len(paths), self.max_workers or os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(lambda shard: pd.read_csv(shard, **self.read_kwargs), paths))
+            self._check_schema(paths, frames)
+            self.shards = [
+                {"path": path, "size_bytes": os.path.getsize(path), "rows": len(frame)}
+                for path, frame in zip(paths, frames)
+            ]
+            # Header-only shards would turn their columns into object; they add no rows anyway.
+            frames = [frame for frame in frames if len(frame)] or frames[:1]
+            # One concatenation straight into the result; the shard frames are dropped right after.
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            del frames
+            df.attrs[SHARDS_ATTR] = self.shards
+            self._df = df
+        return self._df
+
+    def preview(self, n: int = 5) -> pd.DataFrame:
+        if self._df is not None:
+            return self._df.head(n)
+        return pd.read_csv(self.shard_paths[0], nrows=n, **self.read_kwargs)
+
+    def iter_chunks(self, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Stream every shard in turn, in chunks of at most `chunksize` rows (see CSVLoader.iter_chunks)."""
+        for path in self.shard_paths:
+            yield from CSVLoader(path, self.read_kwargs).iter_chunks(chunksize=chunksize)
+
+    @staticmethod
+    def _check_schema(paths: List[str], frames: List[pd.DataFrame]) -> None:
+        expected = list(frames[0].columns)
+        dtypes = {}
+        for path, frame in zip(paths, frames):
+            if list(frame.columns) != expected:
+                missing = [c for c in expected if c not in frame.columns]
+                extra = [c for c in frame.columns if c not in expected]
+                raise ValueError(f"Shard {path} does not match the columns of {paths[0]} "
+                                 f"(missing: {missing}, unexpected: {extra}, or a different order).")
+            for col in expected:
+                series = frame[col]
+                if series.isna().all():
+                    continue  # empty or all-null shard column; takes the other shards' type
+                dtype, (first_path, known) = series.dtype, dtypes.setdefault(col, (path, series.dtype))
+                if dtype == known:
+                    continue
+                if all(pd.api.types.is_numeric_dtype(t) and not pd.api.types.is_bool_dtype(t) for t in (dtype, known)):
+                    continue  # integer + float -> float
+                raise ValueError(f"Column {col!r} is {dtype} in shard {path} but {known} in shard {first_path}.")
@@ -0,0 +1,131 @@
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Same vocabulary as SchemaExtractor.infer_type.
+INFERRED_TYPES_ATTR = "inferred_types"
+
+
+class DtypeOptimizer:
+    """
+    Responsible for:
+    - Sampling a CSV and choosing the narrowest safe dtype for every column
+    - Reading the file with those dtypes and reporting the memory saved
+    - Recording the inferred column types in df.attrs["inferred_types"]
+
+    Low-cardinality text columns and ISO-8601 date columns are typed while
+    parsing. Integers are downcast to int8/16/32 (uint for non-negative
+    columns) and floats to float32 after parsing, using the full column, so
+    a value outside the sample can never overflow or lose precision.
+    """
+
+    def __init__(self, sample_rows: int = 100_000, max_category_ratio: float = 0.5,
+                 max_categories: int = 10_000, downcast_floats: bool = True):
+        self.sample_rows = sample_rows
+        self.max_category_ratio = max_category_ratio
+        self.max_categories = max_categories
+        self.downcast_floats = downcast_floats
+        self.last_report: Optional[dict] = None
+
+    def plan(self, file_path: str, read_kwargs: dict = None) -> dict:
+        """read_csv keyword arguments (dtype / parse_dates) inferred from a sample of the file."""
+        return self._plan_from_sample(self._read_sample(file_path, read_kwargs or {}))
+
+    def _plan_from_sample(self, sample: pd.DataFrame) -> dict:
+        dtypes, dates = {}, []
+        for col in sample.columns:
+            series = sample[col]
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+                continue
+            values = series.dropna()
+            if values.empty:
+                continue
+            if self._looks_like_dates(values):
+                dates.append(col)
+            elif values.nunique() <= min(self.max_categories, self.max_category_ratio * len(values)):
+                dtypes[col] = "category"
+        plan = {}
+        if dtypes:
+            plan["dtype"] = dtypes
+        if dates:
+            plan["parse_dates"] = dates
+            plan["date_format"] = "ISO8601"
+        return plan
+
+    def read(self, file_path: str, read_kwargs: dict = None, nrows: int = None) -> pd.DataFrame:
+        """Read the file with optimized dtypes; the memory comparison ends up in `last_report`."""
+        read_kwargs = dict(read_kwargs or {})
+        if nrows is not None:
+            read_kwargs["nrows"] = nrows
+        sample = self._read_sample(file_path, read_kwargs)
+        df = pd.read_csv(file_path, **{**read_kwargs, **self._plan_from_sample(sample)})
+        self.downcast(df)
+        df.attrs[INFERRED_TYPES_ATTR] = self.inferred_types(df)
+
+        after = df.memory_usage(deep=True).sum()
+        before = after
+        if len(sample):
+            # Memory of a plain read_csv, extrapolated from the sample.
+            before = sample.memory_usage(deep=True, index=False).sum() / len(sample) * len(df)
+            before += df.memory_usage(index=True).iloc[0]
+        self.last_report = {
+            "rows": len(df),
+            "memory_before_bytes": int(before),
+            "memory_after_bytes": int(after),
+            "dtype_changes": {
+                col: {"before": str(sample[col].dtype), "after": str(df[col].dtype)}
+                for col in df.columns if str(sample[col].dtype) != str(df[col].dtype)
+            },
+        }
+        return df
+
+    def downcast(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Narrow integer and float columns in place where no value changes."""
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+                continue
+            if pd.api.types.is_integer_dtype(series):
+                unsigned = len(series) > 0 and series.min() >= 0
+                df[col] = pd.to_numeric(series, downcast="unsigned" if unsigned else "integer")
+            elif self.downcast_floats and pd.api.types.is_float_dtype(series) and series.dtype != np.float32:
+                narrowed = series.astype(np.float32)
+                same = (narrowed.astype(series.dtype) == series) | series.isna()
+                if same.all():
+                    df[col] = narrowed
+        return df
+
+    @staticmethod
+    def inferred_types(df: pd.DataFrame) -> Dict[str, str]:
+        """Column types in SchemaExtractor's vocabulary; categories report the type of their values."""
+        types = {}
+        for col in df.columns:
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                dtype = dtype.categories.dtype
+            if pd.api.types.is_bool_dtype(dtype):
+                types[col] = "boolean"
+            elif pd.api.types.is_integer_dtype(dtype):
+                types[col] = "integer"
+            elif pd.api.types.is_float_dtype(dtype):
+                types[col] = "float"
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                types[col] = "datetime"
+            else:
+                types[col] = "string"
+        return types
+
+    @staticmethod
+    def _looks_like_dates(values: pd.Series) -> bool:
+        if not pd.api.types.is_string_dtype(values):
+            return False
+        try:
+            pd.to_datetime(values, format="ISO8601")
+        except (ValueError, TypeError, OverflowError):
+            return False
+        return True
+
+    def _read_sample(self, file_path: str, read_kwargs: dict) -> pd.DataFrame:
+        nrows = min(self.sample_rows, read_kwargs.get("nrows") or self.sample_rows)
+        return pd.read_csv(file_path, **{**read_kwargs, "nrows": nrows})
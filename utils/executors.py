@@ -0,0 +1,41 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+EXECUTOR_MODES = ("serial", "thread", "process")
+# Per-column work can also run as 'shared': numeric columns are placed in shared
+# memory once and worker processes attach to them (see utils.shared_columns).
+COLUMN_EXECUTOR_MODES = EXECUTOR_MODES + ("shared",)
+
+
+class SerialExecutor(Executor):
+    """Executor that runs every task immediately in the calling thread."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def create_executor(mode: str = "serial", max_workers: Optional[int] = None) -> Executor:
+    """
+    Build an executor for one of EXECUTOR_MODES.
+    - serial: no concurrency
+    - thread: pandas/NumPy reductions release the GIL, cheap to start
+    - process: full isolation, arguments are pickled to the workers
+    """
+    if mode == "serial":
+        return SerialExecutor()
+    if mode == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if mode == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor mode {mode!r}; expected one of {EXECUTOR_MODES}.")
+
+
+def map_ordered(fn: Callable, items: Iterable, mode: str = "serial", max_workers: Optional[int] = None) -> List:
+    """Apply `fn` to every item with the given executor mode; results keep input order."""
+    with create_executor(mode, max_workers) as executor:
+        return list(executor.map(fn, items))
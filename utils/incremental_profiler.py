@@ -0,0 +1,179 @@
+import hashlib
+import io
+import os
+import pickle
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from utils.data_health_base import HealthReport
+from utils.streaming_profiler import StreamingProfiler
+
+# 2: rows are hashed in canonical dtypes (row_fingerprints.hashable_frame).
+# 3: numeric columns keep text-keyed value counts (StatisticsAccumulator).
+# 4: integral numbers hash as int64, losslessly.
+# 5: numeric columns keep moments only; mixed columns are recounted as text.
+STATE_VERSION = 5
+STATE_SUFFIX = ".profile-state.pkl"
+_PROBE_BYTES = 64 * 1024
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of bytes [start, end) of a file."""
+
+    def __init__(self, path: str, start: int, end: int):
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:min(len(buffer), self._remaining)]
+        n = self._file.readinto(view)
+        self._remaining -= n
+        return n
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+class IncrementalProfiler:
+    """
+    Responsible for:
+    - Profiling append-only CSVs where each run only parses the newly appended bytes
+    - Persisting the accumulator state of a StreamingProfiler next to the file
+
+    The state file (`<csv>.profile-state.pkl`) records how many bytes were
+    processed and a fingerprint of that prefix (its length plus hashes of its
+    first and last 64 KiB). If the prefix no longer matches, or the profiler
+    configuration changed, the file is profiled from scratch.
+    Only complete lines are consumed; a trailing partial line waits for the next run.
+    """
+
+    def __init__(self, streaming_profiler: StreamingProfiler, chunksize: int = 100_000,
+                 read_kwargs: dict = None):
+        self.streaming_profiler = streaming_profiler
+        self.chunksize = chunksize
+        self.read_kwargs = read_kwargs or {}
+        self.last_refresh: Optional[dict] = None
+
+    def refresh(self, file_path: str, state_path: str = None) -> Tuple[dict, HealthReport]:
+        """Bring the saved state up to date with `file_path` and return (profile, report)."""
+        state_path = state_path or file_path + STATE_SUFFIX
+        end = self._complete_lines_end(file_path)
+        saved = self._load_state(state_path, file_path, end)
+
+        if saved is None:
+            state, start, columns = self.streaming_profiler.create_state(), 0, None
+        else:
+            state, start, columns = saved["accumulators"], saved["offset"], saved["columns"]
+
+        if columns is None:
+            columns = list(pd.read_csv(file_path, nrows=0, **self.read_kwargs).columns)
+        if end > start:
+            self.streaming_profiler.update(state, self._read_range(file_path, start, end, columns, saved is not None))
+            # Columns that turned from numbers into text: one pass over the whole file for just those.
+            self.streaming_profiler.recount(
+                state, lambda kwargs: self._read_range(file_path, 0, end, columns, False, kwargs)
+            )
+
+        self._save_state(state_path, {
+            "version": STATE_VERSION,
+            "config": self._config_key(),
+            "offset": end,
+            "prefix": self._prefix_fingerprint(file_path, end),
+            "columns": columns,
+            "accumulators": state,
+        })
+        self.last_refresh = {"full_rescan": saved is None, "bytes_parsed": end - start, "bytes_total": end}
+        return self.streaming_profiler.finalize(state, file_path=file_path)
+
+    def _read_range(self, file_path: str, start: int, end: int, columns: list, appended: bool,
+                    extra_kwargs: dict = None):
+        """Yield DataFrame chunks parsed from bytes [start, end) of the file."""
+        kwargs = {**self.read_kwargs, **(extra_kwargs or {})}
+        if appended:
+            # Appended bytes have no header line.
+            kwargs.update(header=None, names=columns)
+        handle = io.BufferedReader(_ByteRange(file_path, start, end))
+        try:
+            with pd.read_csv(handle, chunksize=self.chunksize, **kwargs) as reader:
+                empty = True
+                for chunk in reader:
+                    empty = False
+                    yield chunk
+            if empty and not appended:
+                # Header-only file: still record the column layout.
+                yield pd.read_csv(file_path, nrows=0, **self.read_kwargs)
+        finally:
+            handle.close()
+
+    @staticmethod
+    def _complete_lines_end(file_path: str) -> int:
+        """Byte offset just after the last newline in the file."""
+        size = os.path.getsize(file_path)
+        with open(file_path, "rb") as f:
+            position = size
+            while position > 0:
+                step = min(_PROBE_BYTES, position)
+                f.seek(position - step)
+                block = f.read(step)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    return position - step + newline + 1
+                position -= step
+        return 0
+
+    @staticmethod
+    def _prefix_fingerprint(file_path: str, length: int) -> str:
+        digest = hashlib.sha256(str(length).encode())
+        with open(file_path, "rb") as f:
+            digest.update(f.read(min(_PROBE_BYTES, length)))
+            f.seek(max(length - _PROBE_BYTES, 0))
+            digest.update(f.read(min(_PROBE_BYTES, length)))
+        return digest.hexdigest()
+
+    def _config_key(self) -> str:
+        """Changes whenever the extractors, checks or their settings change."""
+        def describe(obj):
+            settings = {k: v for k, v in vars(obj).items() if isinstance(v, (int, float, str, bool, type(None)))}
+            return type(obj).__name__, sorted(settings.items())
+
+        profiler = self.streaming_profiler
+        builder = profiler.profile_builder
+        parts = [
+            describe(builder.metadata_extractor), describe(builder.schema_extractor),
+            describe(builder.stats_extractor), profiler.n_samples,
+            [describe(check) for check in profiler.health_validator.checks],
+            sorted(self.read_kwargs.items()),
+        ]
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _load_state(self, state_path: str, file_path: str, end: int) -> Optional[dict]:
+        if not os.path.exists(state_path):
+            return None
+        try:
+            with open(state_path, "rb") as f:
+                saved = pickle.load(f)
+        except Exception:
+            return None
+        if (
+            saved.get("version") != STATE_VERSION
+            or saved.get("config") != self._config_key()
+            or saved["offset"] > end
+            or saved["prefix"] != self._prefix_fingerprint(file_path, saved["offset"])
+        ):
+            return None
+        return saved
+
+    @staticmethod
+    def _save_state(state_path: str, state: dict) -> None:
+        tmp = state_path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, state_path)
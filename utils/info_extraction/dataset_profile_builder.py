@@ -1,26 +1,204 @@
+from collections.abc import Mapping
+from contextlib import contextmanager
+
 import pandas as pd
 
+from utils.accumulators import Accumulator
+from utils.column_stats import ColumnStatsContext
+from utils.instrumentation import Tracer, measure, trace_metrics
+
 class CombinedDatasetProfileBuilder:
-    def __init__(self, metadata_extractor, schema_extractor, stats_extractor):
+    """
+    track_memory / tracer: see HealthValidator. The timing of every profile
+    section from the last build_profile call is kept in `last_metrics`
+    (not in the profile, which goes to the LLM).
+    """
+    def __init__(self, metadata_extractor, schema_extractor, stats_extractor,
+                 track_memory: bool = False, tracer: Tracer = None):
         self.metadata_extractor = metadata_extractor
         self.schema_extractor = schema_extractor
         self.stats_extractor = stats_extractor
+        self.track_memory = track_memory
+        self.tracer = tracer
+        self.last_metrics = None
 
     def build_profile(self, df: pd.DataFrame, file_path: str = None, n_samples: int = 5) -> dict:
         profile = {}
+        metrics = {}
+        # Shared by every extractor so each column primitive is computed once.
+        context = ColumnStatsContext.of(df)
 
         # 1️⃣ Metadata
-        file_meta = self.metadata_extractor.extract_file_metadata(file_path) if file_path else {}
-        df_meta = self.metadata_extractor.extract_dataframe_metadata(df)
-        profile["metadata"] = {**file_meta, **df_meta}
+        with self._measure(df, metrics, "metadata"):
+            file_meta = self.metadata_extractor.extract_file_metadata(file_path) if file_path else {}
+            df_meta = self.metadata_extractor.extract_dataframe_metadata(df, context=context)
+            profile["metadata"] = {**file_meta, **df_meta}
 
         # 2️⃣ Schema
-        profile["schema"] = self.schema_extractor.extract_schema(df)
+        with self._measure(df, metrics, "schema"):
+            profile["schema"] = self.schema_extractor.extract_schema(df, context=context)
 
         # 3️⃣ Sample rows
-        profile["sample_rows"] = df.head(n_samples).to_dict(orient="records")
+        with self._measure(df, metrics, "sample_rows"):
+            profile["sample_rows"] = df.head(n_samples).to_dict(orient="records")
 
         # 4️⃣ Statistics
-        profile["statistics"] = self.stats_extractor.extract(df)
+        with self._measure(df, metrics, "statistics"):
+            profile["statistics"] = self.stats_extractor.extract(df, context=context)
+
+        self.last_metrics = metrics
+        return profile
+
+    def build_profile_from_backend(self, backend, file_path: str = None, n_samples: int = 5) -> dict:
+        """Same profile as build_profile, computed by a DataBackend (e.g. DuckDB over the file itself)."""
+        file_meta = self.metadata_extractor.extract_file_metadata(file_path) if file_path else {}
+        return {
+            "metadata": {**file_meta, **self.metadata_extractor.extract_from_backend(backend)},
+            "schema": self.schema_extractor.extract_from_backend(backend),
+            "sample_rows": backend.head(n_samples),
+            "statistics": self.stats_extractor.extract_from_backend(backend),
+        }
+
+    @contextmanager
+    def _measure(self, df: pd.DataFrame, metrics: dict, section: str):
+        with measure(rows=len(df), track_memory=self.track_memory) as section_metrics:
+            yield
+        metrics[section] = section_metrics
+        trace_metrics(self.tracer, f"profile.{section}", "profile", section_metrics)
+
+    def build_lazy_profile(self, df: pd.DataFrame, file_path: str = None, n_samples: int = 5) -> "LazyDatasetProfile":
+        """Same profile as build_profile, but every section / column is computed only when first needed."""
+        return LazyDatasetProfile(self, df, file_path=file_path, n_samples=n_samples)
+
+    def create_accumulator(self, n_samples: int = 5) -> "ProfileAccumulator":
+        """Accumulator that builds the same profile from a stream of chunks."""
+        return ProfileAccumulator(
+            metadata=self.metadata_extractor.create_accumulator(),
+            schema=self.schema_extractor.create_accumulator(),
+            statistics=self.stats_extractor.create_accumulator(),
+            n_samples=n_samples
+        )
+
+    def finalize(self, accumulator: "ProfileAccumulator", file_path: str = None, n_samples: int = 5) -> dict:
+        profile = {}
+
+        file_meta = self.metadata_extractor.extract_file_metadata(file_path) if file_path else {}
+        df_meta = self.metadata_extractor.finalize(accumulator.metadata)
+        profile["metadata"] = {**file_meta, **df_meta}
+
+        profile["schema"] = self.schema_extractor.finalize(accumulator.schema)
+
+        profile["sample_rows"] = accumulator.sample_rows[:n_samples]
+
+        profile["statistics"] = self.stats_extractor.finalize(accumulator.statistics)
 
         return profile
+
+    def build_profile_from_chunks(self, chunks, file_path: str = None, n_samples: int = 5) -> dict:
+        """Build the profile from an iterable of DataFrame chunks in a single pass."""
+        accumulator = self.create_accumulator(n_samples=n_samples)
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return self.finalize(accumulator, file_path=file_path, n_samples=n_samples)
+
+
+class ProfileAccumulator(Accumulator):
+    """Bundles the extractor accumulators and keeps the first sample rows."""
+
+    def __init__(self, metadata, schema, statistics, n_samples: int = 5):
+        self.metadata = metadata
+        self.schema = schema
+        self.statistics = statistics
+        self.n_samples = n_samples
+        self.sample_rows = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.metadata.update(chunk)
+        self.schema.update(chunk)
+        self.statistics.update(chunk)
+        missing = self.n_samples - len(self.sample_rows)
+        if missing > 0:
+            self.sample_rows.extend(chunk.head(missing).to_dict(orient="records"))
+
+    def merge(self, other: "ProfileAccumulator") -> None:
+        self.metadata.merge(other.metadata)
+        self.schema.merge(other.schema)
+        self.statistics.merge(other.statistics)
+        self.sample_rows = (self.sample_rows + other.sample_rows)[:self.n_samples]
+
+
+class LazyDatasetProfile(Mapping):
+    """
+    Dataset profile whose sections, and the per-column entries of schema and
+    statistics, are computed on first access and memoized.
+
+    Reads like the dict from build_profile (profile["schema"], iteration,
+    json via to_dict()). to_dict(sections=..., columns=...) serializes only
+    the requested parts, so e.g. the schema of three columns never scans the others.
+    """
+
+    SECTIONS = ("metadata", "schema", "sample_rows", "statistics")
+
+    def __init__(self, builder: CombinedDatasetProfileBuilder, df: pd.DataFrame, file_path: str = None,
+                 n_samples: int = 5):
+        self.builder = builder
+        self.df = df
+        self.file_path = file_path
+        self.n_samples = n_samples
+        self.context = ColumnStatsContext.of(df)
+        self._file_metadata = None
+        self._sample_rows = None
+        self._schema = {}
+        self._statistics = {}
+
+    def __getitem__(self, section: str):
+        if section not in self.SECTIONS:
+            raise KeyError(section)
+        return self.section(section)
+
+    def __iter__(self):
+        return iter(self.SECTIONS)
+
+    def __len__(self) -> int:
+        return len(self.SECTIONS)
+
+    def section(self, name: str, columns: list = None):
+        return getattr(self, name)(columns)
+
+    def to_dict(self, sections: list = None, columns: list = None) -> dict:
+        """Plain dict of the chosen sections (default: all), limited to `columns` (default: all)."""
+        return {name: self.section(name, columns) for name in self.SECTIONS if sections is None or name in sections}
+
+    def metadata(self, columns: list = None) -> dict:
+        if self._file_metadata is None:
+            extractor = self.builder.metadata_extractor
+            self._file_metadata = extractor.extract_file_metadata(self.file_path) if self.file_path else {}
+        df_meta = self.builder.metadata_extractor.extract_dataframe_metadata(self.df, context=self.context,
+                                                                             columns=columns)
+        return {**self._file_metadata, **df_meta}
+
+    def schema(self, columns: list = None) -> dict:
+        columns = self._columns(columns)
+        for col in columns:
+            if col not in self._schema:
+                self._schema[col] = self.builder.schema_extractor.extract_column(self.df, col, self.context)
+        return {col: self._schema[col] for col in columns}
+
+    def sample_rows(self, columns: list = None) -> list:
+        if self._sample_rows is None:
+            self._sample_rows = self.df.head(self.n_samples).to_dict(orient="records")
+        if columns is None:
+            return self._sample_rows
+        return [{col: row[col] for col in columns} for row in self._sample_rows]
+
+    def statistics(self, columns: list = None) -> dict:
+        columns = self._columns(columns)
+        pending = [col for col in columns if col not in self._statistics]
+        # Moments of all pending numeric columns in one batch.
+        self.context.numeric_stats([col for col in pending if self.context.kinds[col] == "numeric"])
+        for col in pending:
+            self._statistics[col] = self.builder.stats_extractor.extract_column(col, self.context)
+        return {col: self._statistics[col] for col in columns}
+
+    def _columns(self, columns: list = None) -> list:
+        return list(self.df.columns) if columns is None else list(columns)
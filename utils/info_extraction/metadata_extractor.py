@@ -2,6 +2,10 @@ from typing import Dict
 import os
 import pandas as pd
 
+from utils.accumulators import NullCountAccumulator
+from utils.column_stats import ColumnStatsContext
+from utils.data_loader import SHARDS_ATTR, discover_shards, is_partitioned_path
+
 class DatasetMetadataExtractor:
     """
     SRP: Extract metadata for LLM consumption.
@@ -11,7 +15,13 @@ class DatasetMetadataExtractor:
     """
 
     def extract_file_metadata(self, file_path: str) -> Dict:
-        """Extracts metadata related to the file itself."""
+        """
+        Extracts metadata related to the file itself.
+        A directory or glob pattern (PartitionedCSVLoader) is reported as one
+        dataset: total size of its shards and their number.
+        """
+        if is_partitioned_path(file_path):
+            return self.extract_partitioned_metadata(file_path)
         try:
             size_bytes = os.path.getsize(file_path)
         except OSError:
@@ -25,14 +35,66 @@ class DatasetMetadataExtractor:
             "file_size_bytes": size_bytes
         }
 
-    def extract_dataframe_metadata(self, df: pd.DataFrame) -> Dict:
-        """Extracts metadata related to the DataFrame."""
+    def extract_partitioned_metadata(self, file_path: str) -> Dict:
+        shards = discover_shards(file_path)
+        sizes = []
+        for shard in shards:
+            try:
+                sizes.append(os.path.getsize(shard))
+            except OSError:
+                sizes.append(None)
+        file_types = {os.path.splitext(shard)[1].lstrip('.').lower() for shard in shards}
+
         return {
+            "file_path": file_path,
+            "file_type": file_types.pop() if len(file_types) == 1 else None,
+            "file_size_bytes": None if None in sizes else sum(sizes),
+            "num_shards": len(shards)
+        }
+
+    def extract_dataframe_metadata(self, df: pd.DataFrame, context: ColumnStatsContext = None,
+                                   columns: list = None) -> Dict:
+        """
+        Extracts metadata related to the DataFrame.
+        columns: limit missing_counts to these columns (the rest is never scanned).
+        """
+        context = context or ColumnStatsContext.of(df)
+        if columns is None:
+            missing_counts = dict(zip(df.columns, context.null_counts.tolist()))
+        else:
+            missing_counts = {col: context.null_count(col) for col in columns}
+        metadata = {
             "num_rows": int(df.shape[0]),
             "num_columns": int(df.shape[1]),
             "column_names": list(df.columns),
+            "missing_counts": missing_counts
+        }
+        # Loaded by PartitionedCSVLoader: path, size and rows of every shard.
+        if SHARDS_ATTR in df.attrs:
+            metadata["shards"] = [dict(shard) for shard in df.attrs[SHARDS_ATTR]]
+        return metadata
+
+    def extract_from_backend(self, backend) -> Dict:
+        """Same output as extract_dataframe_metadata, from a DataBackend's aggregations."""
+        return {
+            "num_rows": int(backend.row_count()),
+            "num_columns": len(backend.columns),
+            "column_names": list(backend.columns),
+            "missing_counts": {col: int(count) for col, count in backend.null_counts().items()}
+        }
+
+    def create_accumulator(self) -> NullCountAccumulator:
+        """Accumulator for computing the DataFrame metadata chunk by chunk."""
+        return NullCountAccumulator()
+
+    def finalize(self, accumulator: NullCountAccumulator) -> Dict:
+        """Same output as extract_dataframe_metadata, built from an accumulator."""
+        return {
+            "num_rows": int(accumulator.row_count),
+            "num_columns": len(accumulator.columns),
+            "column_names": list(accumulator.columns),
             "missing_counts": {
-                col: int(df[col].isna().sum()) for col in df.columns
+                col: int(accumulator.null_counts.get(col, 0)) for col in accumulator.columns
             }
         }
 
@@ -1,23 +1,109 @@
 import pandas as pd
-import numpy as np
+
+from utils.accumulators import Accumulator
+from utils.column_stats import ColumnStatsContext
+from utils.dtype_optimizer import INFERRED_TYPES_ATTR
+from utils.serialization import to_builtin
+
+
+class SchemaAccumulator(Accumulator):
+    """
+    Tracks the inferred type and nullability of every column across chunks.
+    Type conflicts resolve the way a full pd.read_csv would:
+    integer + float -> float, any other mismatch -> string.
+    Chunks where a column is entirely null do not vote on its type.
+    """
+
+    def __init__(self, infer_type):
+        self.infer_type = infer_type
+        self.types = {}
+        self.nullable = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        nulls = chunk.isnull()
+        has_nulls, all_nulls = nulls.any(), nulls.all()
+        for col in chunk.columns:
+            self.nullable[col] = self.nullable.get(col, False) or bool(has_nulls[col])
+            if bool(all_nulls[col]) and len(chunk):
+                self.types.setdefault(col, None)
+                continue
+            self._vote(col, self.infer_type(chunk[col]))
+
+    def merge(self, other: "SchemaAccumulator") -> None:
+        for col, nullable in other.nullable.items():
+            self.nullable[col] = self.nullable.get(col, False) or nullable
+        for col, dtype in other.types.items():
+            if dtype is None:
+                self.types.setdefault(col, None)
+            else:
+                self._vote(col, dtype)
+
+    def _vote(self, col, dtype: str) -> None:
+        current = self.types.get(col)
+        if current is None or current == dtype:
+            self.types[col] = dtype
+        elif {current, dtype} == {"integer", "float"}:
+            self.types[col] = "float"
+        else:
+            self.types[col] = "string"
+
 
 class SchemaExtractor:
+    """
+    executor: 'shared' finds the nulls of numeric columns in worker processes
+    reading from shared memory (see StatisticsExtractor); 'serial' stays in-process.
+    """
+
+    def __init__(self, executor: str = "serial", max_workers: int = None):
+        if executor not in ("serial", "shared"):
+            raise ValueError(f"Unknown executor {executor!r}; expected 'serial' or 'shared'.")
+        self.executor = executor
+        self.max_workers = max_workers
 
-    def extract_schema(self, df: pd.DataFrame) -> dict:
+    def extract_schema(self, df: pd.DataFrame, context: ColumnStatsContext = None) -> dict:
+        context = context or ColumnStatsContext.of(df)
+        if self.executor == "shared":
+            context.numeric_stats(executor="shared", max_workers=self.max_workers)
+        context.null_counts  # one batched null pass; extract_column reads from it
         schema = {}
 
         for col in df.columns:
-            series = df[col]
+            schema[col] = self.extract_column(df, col, context)
 
-            column_info = {
-                "column_name": col,
-                "dtype_inferred": self.infer_type(series),
-                "nullable": bool(series.isnull().any()),
-            }
+        return schema
 
-            schema[col] = column_info
+    def extract_column(self, df: pd.DataFrame, col, context: ColumnStatsContext) -> dict:
+        """Schema entry of a single column."""
+        # Types already inferred at load time (CSVLoader(optimize_dtypes=True)).
+        known_types = df.attrs.get(INFERRED_TYPES_ATTR, {})
+        return {
+            "column_name": col,
+            "dtype_inferred": known_types.get(col) or self.infer_type(df[col]),
+            "nullable": context.null_count(col) > 0,
+        }
 
-        return schema
+    def extract_from_backend(self, backend) -> dict:
+        """Same output as extract_schema, from a DataBackend's aggregations."""
+        types, null_counts = backend.column_types(), backend.null_counts()
+        return {
+            col: {"column_name": col, "dtype_inferred": types[col], "nullable": null_counts[col] > 0}
+            for col in backend.columns
+        }
+
+    def create_accumulator(self) -> SchemaAccumulator:
+        return SchemaAccumulator(self.infer_type)
+
+    def finalize(self, accumulator: SchemaAccumulator) -> dict:
+        """Same output as extract_schema, built from an accumulator."""
+        return {
+            col: {
+                "column_name": col,
+                # A column that was null in every chunk reads as float in pandas.
+                "dtype_inferred": accumulator.types.get(col) or "float",
+                "nullable": accumulator.nullable[col],
+            }
+            for col in accumulator.nullable
+        }
 
     def infer_type(self, series: pd.Series) -> str:
         if pd.api.types.is_integer_dtype(series):
@@ -35,33 +121,4 @@ class SchemaExtractor:
 
     def normalize(self, value):
         """Convert numpy types → Python native so JSON can serialize."""
-
-        # Case 1 — list → normalize each element
-        if isinstance(value, list):
-            return [self.normalize(v) for v in value]
-
-        # Case 2 — numpy array → convert to list then normalize
-        if isinstance(value, np.ndarray):
-            return self.normalize(value.tolist())
-
-        # Case 3 — pandas or numpy scalar
-        if isinstance(value, (np.integer, np.int64)):
-            return int(value)
-        if isinstance(value, (np.floating, np.float64)):
-            return float(value)
-        if isinstance(value, (np.bool_,)):
-            return bool(value)
-
-        # Case 4 — pandas Timestamp
-        if isinstance(value, pd.Timestamp):
-            return value.isoformat()
-
-        # Case 5 — NaN / None
-        try:
-            if pd.isna(value):
-                return None
-        except Exception:
-            pass  # skip checking for lists
-
-        # Case 6 — anything else
-        return value
+        return to_builtin(value)
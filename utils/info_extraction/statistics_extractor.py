@@ -1,38 +1,328 @@
+from collections import Counter
 from typing import Dict
+import numpy as np
 import pandas as pd
 
+from utils.accumulators import Accumulator
+from utils.column_stats import ColumnStatsContext, column_kind
+from utils.sketches import HyperLogLog, SpaceSaving
+
+
+class StringColumnSketch:
+    """
+    Bounded-memory summary of one string column: a HyperLogLog for the
+    distinct count and a Space-Saving sketch for the most frequent values.
+    Values are read in batches of `batch_rows`, so no hash table grows past
+    one batch. Mergeable across chunks.
+    """
+
+    def __init__(self, precision: int = 14, capacity: int = 64, batch_rows: int = 1_000_000):
+        self.hll = HyperLogLog(precision)
+        self.heavy = SpaceSaving(capacity)
+        self.batch_rows = batch_rows
+        self.count = 0
+
+    def update(self, series: pd.Series) -> None:
+        for start in range(0, len(series), self.batch_rows):
+            values = series.iloc[start:start + self.batch_rows].dropna()
+            if values.empty:
+                continue
+            self.count += len(values)
+            self.hll.update_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+            codes, uniques = pd.factorize(values)
+            self.heavy.update_counts(uniques, np.bincount(codes, minlength=len(uniques)))
+
+    def merge(self, other: "StringColumnSketch") -> None:
+        self.hll.merge(other.hll)
+        self.heavy.merge(other.heavy)
+        self.count += other.count
+
+    def summary(self, missing: int, top: int = 3) -> dict:
+        estimate = min(self.hll.estimate(), self.count)
+        # Two standard errors of the HyperLogLog estimate.
+        margin = 2 * self.hll.relative_error * estimate
+        top_values = self.heavy.top(top)
+        return {
+            "unique_values": int(round(estimate)),
+            # Every value the Space-Saving sketch holds is a distinct value actually seen.
+            "unique_values_bounds": [max(int(np.floor(estimate - margin)), len(self.heavy.counts)),
+                                     min(int(np.ceil(estimate + margin)), self.count)],
+            "top_values": {value: int(count) for value, count, _ in top_values},
+            "top_values_bounds": {value: [int(low), int(count)] for value, count, low in top_values},
+            "missing": missing,
+            "approximate": True
+        }
+
+
+class _ColumnState:
+    """
+    Running statistics of one column: Welford moments or value counts.
+    `recount` marks a column whose chunks mixed numbers and text: a full read
+    loads it as text, so its values must be counted again from a text read
+    (StatisticsAccumulator.recount).
+    """
+
+    def __init__(self):
+        self.kind = None
+        self.missing = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.counts = Counter()
+        self.sketch = None
+        self.recount = False
+
+    def set_kind(self, kind) -> None:
+        if self.kind is None or self.kind == kind:
+            self.kind = kind
+            return
+        # Mixed chunks load as text in a full read.
+        self.kind = "string"
+        self.mark_recount()
+
+    def mark_recount(self) -> None:
+        """Drop the moments and the counts of the text chunks alone; they no longer apply."""
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        self.min, self.max = np.inf, -np.inf
+        self.counts, self.sketch = Counter(), None
+        self.recount = True
+
+    def add_moments(self, count: int, mean: float, m2: float, min_: float, max_: float) -> None:
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, min_)
+        self.max = max(self.max, max_)
+
+
+class StatisticsAccumulator(Accumulator):
+    """
+    Mergeable per-column statistics, matching StatisticsExtractor.extract.
+    sketch_options: StringColumnSketch settings; string columns are then
+    sketched instead of counted exactly.
+    """
+
+    def __init__(self, sketch_options: dict = None):
+        self.columns: Dict[str, _ColumnState] = {}
+        self.sketch_options = sketch_options
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for col in chunk.columns:
+            series = chunk[col]
+            state = self.columns.setdefault(col, _ColumnState())
+            missing = int(series.isna().sum())
+            state.missing += missing
+            if missing == len(series) and len(series):
+                # All-null chunks carry no type information.
+                continue
+
+            state.set_kind(column_kind(series) or "other")
+            if state.recount:
+                continue
+            if state.kind == "numeric":
+                values = series.dropna().to_numpy(dtype=np.float64)
+                if values.size:
+                    mean = values.mean()
+                    state.add_moments(values.size, mean, float(((values - mean) ** 2).sum()),
+                                      values.min(), values.max())
+            elif state.kind in ("string", "boolean"):
+                self._count(state, series)
+
+    def _count(self, state: _ColumnState, series: pd.Series) -> None:
+        if state.kind == "string" and self.sketch_options is not None:
+            if state.sketch is None:
+                state.sketch = StringColumnSketch(**self.sketch_options)
+            state.sketch.update(series)
+        else:
+            state.counts.update(series.value_counts().to_dict())
+
+    @property
+    def recount_columns(self) -> list:
+        """Columns that mixed numeric and text chunks and wait for recount()."""
+        return [col for col, state in self.columns.items() if state.recount]
+
+    def recount(self, chunks) -> None:
+        """
+        Second pass for recount_columns: count their values again from `chunks`
+        holding those columns read as text (e.g. pd.read_csv(usecols=..., dtype=str)).
+        Null counts are kept from the first pass.
+        """
+        columns = self.recount_columns
+        for chunk in chunks:
+            for col in columns:
+                self._count(self.columns[col], chunk[col].dropna())
+        for col in columns:
+            self.columns[col].recount = False
+
+    def merge(self, other: "StatisticsAccumulator") -> None:
+        for col, theirs in other.columns.items():
+            state = self.columns.setdefault(col, _ColumnState())
+            state.missing += theirs.missing
+            if theirs.kind is None:
+                continue
+            state.set_kind(theirs.kind)
+            if theirs.recount and not state.recount:
+                state.mark_recount()
+            if state.recount:
+                continue
+            if state.kind == "numeric":
+                state.add_moments(theirs.count, theirs.mean, theirs.m2, theirs.min, theirs.max)
+            elif theirs.sketch is not None:
+                if state.sketch is None:
+                    state.sketch = StringColumnSketch(**self.sketch_options)
+                state.sketch.merge(theirs.sketch)
+            else:
+                state.counts.update(theirs.counts)
+
+
 class StatisticsExtractor:
-    def extract(self, df: pd.DataFrame) -> dict:
+    """
+    executor: 'serial' computes the numeric moments in-process; 'shared' spreads
+    them over `max_workers` processes reading the columns from shared memory.
+    mode: 'exact' counts distinct and top values of string columns with hash
+    tables; 'sketch' uses a StringColumnSketch per column instead (HyperLogLog
+    with precision `hll_precision`, Space-Saving with `top_k_capacity`
+    counters, read in batches of `batch_rows`). Sketched columns also report
+    unique_values_bounds and top_values_bounds ([guaranteed minimum,
+    estimate]) and are marked approximate.
+    """
+
+    MODES = ("exact", "sketch")
+
+    def __init__(self, executor: str = "serial", max_workers: int = None, mode: str = "exact",
+                 hll_precision: int = 14, top_k_capacity: int = 64, batch_rows: int = 1_000_000):
+        if executor not in ("serial", "shared"):
+            raise ValueError(f"Unknown executor {executor!r}; expected 'serial' or 'shared'.")
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {self.MODES}.")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.mode = mode
+        self.hll_precision = hll_precision
+        self.top_k_capacity = top_k_capacity
+        self.batch_rows = batch_rows
+
+    def extract(self, df: pd.DataFrame, context: ColumnStatsContext = None) -> dict:
+        context = context or ColumnStatsContext.of(df)
+        # Moments and value counts of all columns in one batch; the null counts come with them.
+        context.numeric_stats(executor=self.executor, max_workers=self.max_workers)
+        if self.mode == "exact":
+            context.summarize_categoricals()
+        return {col: self.extract_column(col, context) for col in context.kinds}
+
+    def extract_column(self, col, context: ColumnStatsContext) -> dict:
+        """Statistics entry of a single column."""
+        kind = context.kinds[col]
+        col_stats = {}
+
+        # Numeric
+        if kind == "numeric":
+            summary = context.numeric_stats([col])[col]
+            col_stats = {
+                "mean": float(summary["mean"]),
+                "std": float(summary["std"]),
+                "min": float(summary["min"]),
+                "max": float(summary["max"]),
+                "missing": context.null_count(col)
+            }
+
+        # Categorical / string, sketched
+        elif kind == "string" and self.mode == "sketch":
+            sketch = StringColumnSketch(**self._sketch_options())
+            sketch.update(context.df[col])
+            # The batched isna pass: null_count(col) would factorize the column.
+            col_stats = sketch.summary(missing=int(context.null_counts[col]))
+
+        # Categorical / string
+        elif kind == "string":
+            top = context.value_counts(col).head(3).to_dict()
+            col_stats = {
+                "unique_values": context.nunique(col),
+                "top_values": top,
+                "missing": context.null_count(col)
+            }
+
+        # Boolean
+        elif kind == "boolean":
+            counts = context.value_counts(col).to_dict()
+            col_stats = {
+                "counts": {str(k): int(v) for k, v in counts.items()},
+                "missing": context.null_count(col)
+            }
+
+        return col_stats
+
+    def extract_from_backend(self, backend) -> dict:
+        """Same output as extract, from a DataBackend's aggregations."""
+        kinds, null_counts = backend.kinds(), backend.null_counts()
+        numeric = backend.numeric_stats(backend.numeric_columns)
         stats = {}
-        for col in df.columns:
-            series = df[col]
+        for col, kind in kinds.items():
             col_stats = {}
+            if kind == "numeric":
+                col_stats = {**numeric[col], "missing": int(null_counts[col])}
+            elif kind == "string":
+                col_stats = {
+                    "unique_values": backend.nunique(col),
+                    "top_values": backend.value_counts(col, limit=3),
+                    "missing": int(null_counts[col])
+                }
+            elif kind == "boolean":
+                col_stats = {
+                    "counts": {str(k): int(v) for k, v in backend.value_counts(col).items()},
+                    "missing": int(null_counts[col])
+                }
+            stats[col] = col_stats
+        return stats
+
+    def create_accumulator(self) -> StatisticsAccumulator:
+        return StatisticsAccumulator(self._sketch_options() if self.mode == "sketch" else None)
+
+    def _sketch_options(self) -> dict:
+        return {"precision": self.hll_precision, "capacity": self.top_k_capacity, "batch_rows": self.batch_rows}
 
-            # Numeric
-            if pd.api.types.is_numeric_dtype(series):
+    def finalize(self, accumulator: StatisticsAccumulator) -> dict:
+        """Same output as extract, built from an accumulator."""
+        stats = {}
+        for col, state in accumulator.columns.items():
+            col_stats = {}
+            # A column that was null in every chunk reads as float in pandas.
+            kind = state.kind or "numeric"
+
+            if kind == "numeric":
+                empty = state.count == 0
                 col_stats = {
-                    "mean": float(series.mean()),
-                    "std": float(series.std()),
-                    "min": float(series.min()),
-                    "max": float(series.max()),
-                    "missing": int(series.isna().sum())
+                    "mean": float("nan") if empty else float(state.mean),
+                    "std": float(np.sqrt(state.m2 / (state.count - 1))) if state.count > 1 else float("nan"),
+                    "min": float("nan") if empty else float(state.min),
+                    "max": float("nan") if empty else float(state.max),
+                    "missing": state.missing
                 }
 
-            # Categorical / string
-            elif pd.api.types.is_string_dtype(series):
-                top = series.value_counts().head(3).to_dict()
+            elif kind == "string" and state.recount:
+                # Mixed numeric / text chunks and no recount pass (see StatisticsAccumulator.recount).
+                col_stats = {"missing": state.missing, "recount_needed": True}
+
+            elif kind == "string" and state.sketch is not None:
+                col_stats = state.sketch.summary(missing=state.missing)
+
+            elif kind == "string":
                 col_stats = {
-                    "unique_values": int(series.nunique()),
-                    "top_values": top,
-                    "missing": int(series.isna().sum())
+                    "unique_values": len(state.counts),
+                    "top_values": dict(state.counts.most_common(3)),
+                    "missing": state.missing
                 }
 
-            # Boolean
-            elif pd.api.types.is_bool_dtype(series):
-                counts = series.value_counts().to_dict()
+            elif kind == "boolean":
                 col_stats = {
-                    "counts": {str(k): int(v) for k, v in counts.items()},
-                    "missing": int(series.isna().sum())
+                    "counts": {str(k): int(v) for k, v in state.counts.items()},
+                    "missing": state.missing
                 }
 
             stats[col] = col_stats
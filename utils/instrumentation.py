@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Optional
+
+
+@contextmanager
+def measure(rows: int = None, track_memory: bool = False):
+    """
+    Measure the enclosed block. Yields a dict that is filled in on exit with
+    wall_seconds, cpu_seconds (of the calling thread), peak_memory_bytes,
+    rows_per_second and the start time / pid / thread id for timelines.
+
+    Memory is only tracked with track_memory=True because tracemalloc slows
+    allocation-heavy code down noticeably. It is also skipped (None) when
+    tracemalloc is already running, so an outer measurement is not disturbed.
+    """
+    metrics = {}
+    trace_memory = track_memory and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+    started_at_us = time.time_ns() // 1000
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    try:
+        yield metrics
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        metrics.update({
+            "wall_seconds": wall,
+            "cpu_seconds": cpu,
+            "peak_memory_bytes": peak,
+            "rows": rows,
+            "rows_per_second": rows / wall if rows is not None and wall > 0 else None,
+            "started_at_us": started_at_us,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        })
+
+
+class Tracer:
+    """
+    Collects timed spans and exports them in the Chrome trace event format
+    (open the file in chrome://tracing or https://ui.perfetto.dev).
+    Thread-safe; spans measured in worker processes can be added afterwards
+    from their metrics with `add_metrics`.
+    """
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, category: str, start_us: int, duration_us: float,
+            pid: int = None, tid: int = None, args: dict = None) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_us,
+            "dur": duration_us,
+            "pid": pid if pid is not None else os.getpid(),
+            "tid": tid if tid is not None else threading.get_ident(),
+            "args": args or {},
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def add_metrics(self, name: str, category: str, metrics: dict, args: dict = None) -> None:
+        """Add a span from a dict produced by `measure`."""
+        self.add(name, category, metrics["started_at_us"], metrics["wall_seconds"] * 1e6,
+                 pid=metrics["pid"], tid=metrics["tid"], args=args)
+
+    @contextmanager
+    def span(self, name: str, category: str = "", **args):
+        with measure() as metrics:
+            yield metrics
+        self.add_metrics(name, category, metrics, args=args)
+
+    def to_chrome_trace(self) -> dict:
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def trace_metrics(tracer: Optional[Tracer], name: str, category: str, metrics: dict, **args) -> None:
+    """Add `metrics` to `tracer` if there is one."""
+    if tracer is not None:
+        tracer.add_metrics(name, category, metrics, args=args)
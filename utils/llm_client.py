@@ -1,35 +1,369 @@
+import asyncio
+import atexit
+import contextlib
 import os
-from openai import OpenAI
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable, Optional
+import httpx
+import openai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from config.config import API_KEY
+from utils.instrumentation import Tracer, measure, trace_metrics
+
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+PARSE_ERROR_MESSAGE = "LLM response could not be parsed."
+
+# Errors worth another attempt: timeouts, dropped connections, 429 and 5xx.
+RETRYABLE_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+_shared_http_client = None
+_shared_http_client_lock = threading.Lock()
+
+
+def shared_http_client() -> httpx.Client:
+    """
+    One keep-alive HTTP connection pool for every LLMClient in the process,
+    so the overview and data health calls reuse the same TLS connection.
+    """
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is None:
+            _shared_http_client = DefaultHttpxClient()
+        return _shared_http_client
+
+
+@atexit.register
+def close_shared_http_client() -> None:
+    """Close the shared pool; the next shared_http_client() call opens a new one."""
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is not None:
+            _shared_http_client.close()
+            _shared_http_client = None
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Exponential backoff with full jitter: uniform in [0, min(maximum, base * 2**attempt)]."""
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+class AsyncRateLimiter:
+    """Spaces out request starts to at most `rate` per second (shared by all tasks)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
 
 class LLMClient:
     """
-    A lightweight reusable client responsible ONLY for sending prompts 
+    A lightweight reusable client responsible ONLY for sending prompts
     to the LLM and returning responses.
+
+    cache: optional LLMResponseCache; identical requests are answered from disk.
+    client / async_client: optional OpenAI-compatible clients (e.g. local stubs for tests).
+    base_url: API endpoint; point it at a local fake server to test end to end.
+    max_concurrency: cap on in-flight `achat` requests, which also sizes the
+    shared HTTP connection pool.
+    requests_per_second: optional rate limit on `achat` request starts.
+    tracer: optional Tracer that receives one span per call.
+    max_retries / backoff_base / backoff_max: RETRYABLE_ERRORS are retried with
+    jittered exponential backoff. A streamed call is only retried while no
+    token has been delivered yet.
+    timeout: seconds per request attempt.
+
+    Pass `on_token` to `chat` / `achat` to stream: the callback receives each
+    piece of text as it arrives and the full text is still returned.
+
+    Every call is measured: `last_call` holds its latency (including time
+    spent waiting for a free slot), time to first token when streamed, retries,
+    token usage and whether it was cached; `usage` holds the running totals.
     """
 
-    def __init__(self, model: str):
+    def __init__(self, model: str, cache=None, client=None, async_client=None,
+                 base_url: str = DEFAULT_BASE_URL, max_concurrency: int = 8,
+                 requests_per_second: float = None, tracer: Tracer = None,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 timeout: float = 60.0):
         self.model = model
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=API_KEY
+        self.tracer = tracer
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.last_call = None
+        self.usage = {"calls": 0, "cache_hits": 0, "retries": 0, "latency_seconds": 0.0,
+                      "prompt_tokens": 0, "completion_tokens": 0}
+        self._usage_lock = threading.Lock()
+        self.cache = cache
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        # Retries are handled here (with jitter), not inside the OpenAI client.
+        self.client = client or OpenAI(
+            base_url=base_url,
+            api_key=API_KEY,
+            http_client=shared_http_client(),
+            max_retries=0,
+            timeout=timeout
         )
+        self._async_client = async_client
+        self._owns_async_client = async_client is None
+        self._async_loop = None
+        self._semaphore = None
+        self._rate_limiter = None
 
-    def chat(self, system_prompt: str, user_prompt: str, temperature: float = 0):
+    def chat(self, system_prompt: str, user_prompt: str, temperature: float = 0,
+             on_token: Optional[Callable[[str], None]] = None):
         """
         Sends a chat-completion request to the model.
+        With `on_token` the completion is streamed into the callback.
         """
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=temperature
-        )
+        call = {"retries": 0, "first_token_at": None}
+        with measure() as metrics:
+            key, cached = self._cache_lookup(system_prompt, user_prompt, temperature)
+            response = None
+            if cached is None:
+                messages = self._messages(system_prompt, user_prompt)
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        if on_token is None:
+                            response = self.client.chat.completions.create(
+                                model=self.model,
+                                messages=messages,
+                                temperature=temperature
+                            )
+                        else:
+                            response = self._collect_stream(self.client.chat.completions.create(
+                                model=self.model,
+                                messages=messages,
+                                temperature=temperature,
+                                stream=True,
+                                stream_options={"include_usage": True}
+                            ), on_token, call)
+                        break
+                    except RETRYABLE_ERRORS:
+                        if not self._should_retry(attempt, call):
+                            raise
+                        time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+            elif on_token is not None:
+                on_token(cached)
+        self._record_call(metrics, response, call)
+
+        return cached if response is None else self._parse(response, key)
+
+    async def achat(self, system_prompt: str, user_prompt: str, temperature: float = 0,
+                    on_token: Optional[Callable[[str], None]] = None):
+        """
+        Async version of `chat`. Requests share one HTTP connection pool and
+        at most `max_concurrency` of them are in flight at once. Cache reads
+        and writes run in worker threads, so disk I/O never blocks the loop.
+        """
+
+        call = {"retries": 0, "first_token_at": None}
+        with measure() as metrics:
+            key, cached = await self._acache_lookup(system_prompt, user_prompt, temperature)
+            response = None
+            if cached is None:
+                client, semaphore = await self._async_resources()
+                messages = self._messages(system_prompt, user_prompt)
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        async with semaphore:
+                            if self._rate_limiter is not None:
+                                await self._rate_limiter.acquire()
+                            if on_token is None:
+                                response = await client.chat.completions.create(
+                                    model=self.model,
+                                    messages=messages,
+                                    temperature=temperature
+                                )
+                            else:
+                                response = await self._acollect_stream(await client.chat.completions.create(
+                                    model=self.model,
+                                    messages=messages,
+                                    temperature=temperature,
+                                    stream=True,
+                                    stream_options={"include_usage": True}
+                                ), on_token, call)
+                        break
+                    except RETRYABLE_ERRORS:
+                        if not self._should_retry(attempt, call):
+                            raise
+                    # Back off outside the semaphore so other requests can use the slot.
+                    await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+            elif on_token is not None:
+                on_token(cached)
+        self._record_call(metrics, response, call)
+
+        return cached if response is None else await self._aparse(response, key)
+
+    async def aclose(self):
+        """Close the async connection pool (only if this client created it)."""
+        if self._async_client is not None and self._owns_async_client:
+            await self._async_client.close()
+            self._async_client = None
+        self._async_loop = None
+
+    async def _async_resources(self):
+        # The pool and the semaphore belong to one event loop; rebuild them
+        # when called from a new loop (e.g. a second asyncio.run).
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            if self._owns_async_client:
+                if self._async_client is not None:
+                    # Close the previous loop's pool. Its connections may be tied to
+                    # that (now closed) loop, so closing them can fail; the pool is
+                    # dropped either way.
+                    with contextlib.suppress(Exception):
+                        await self._async_client.close()
+                self._async_client = AsyncOpenAI(
+                    base_url=self.base_url,
+                    api_key=API_KEY,
+                    max_retries=0,
+                    timeout=self.timeout,
+                    http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency
+                    ))
+                )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            if self.requests_per_second:
+                self._rate_limiter = AsyncRateLimiter(self.requests_per_second)
+            self._async_loop = loop
+        return self._async_client, self._semaphore
+
+    def _should_retry(self, attempt: int, call: dict) -> bool:
+        # Tokens already handed to the callback cannot be taken back.
+        if attempt >= self.max_retries or call["first_token_at"] is not None:
+            return False
+        call["retries"] += 1
+        return True
+
+    @staticmethod
+    def _collect_stream(stream, on_token, call: dict) -> "StreamedResponse":
+        response = StreamedResponse()
+        for chunk in stream:
+            response.add(chunk, on_token, call)
+        return response
+
+    @staticmethod
+    async def _acollect_stream(stream, on_token, call: dict) -> "StreamedResponse":
+        response = StreamedResponse()
+        async for chunk in stream:
+            response.add(chunk, on_token, call)
+        return response
+
+    def _record_call(self, metrics: dict, response, call: dict) -> None:
+        usage = getattr(response, "usage", None)
+        first_token_at = call.pop("first_token_at")
+        call = {
+            "model": self.model,
+            "latency_seconds": metrics["wall_seconds"],
+            "ttft_seconds": (first_token_at - metrics["started_at_us"] / 1e6
+                             if first_token_at is not None else None),
+            "streamed": isinstance(response, StreamedResponse),
+            "retries": call["retries"],
+            "cached": response is None,
+            "prompt_tokens": getattr(usage, "prompt_tokens", None),
+            "completion_tokens": getattr(usage, "completion_tokens", None),
+        }
+        with self._usage_lock:
+            self.last_call = call
+            self.usage["calls"] += 1
+            self.usage["cache_hits"] += int(call["cached"])
+            self.usage["retries"] += call["retries"]
+            self.usage["latency_seconds"] += call["latency_seconds"]
+            self.usage["prompt_tokens"] += call["prompt_tokens"] or 0
+            self.usage["completion_tokens"] += call["completion_tokens"] or 0
+        trace_metrics(self.tracer, "LLMClient.chat", "llm", metrics, **call)
+
+    def _cache_lookup(self, system_prompt: str, user_prompt: str, temperature: float):
+        if self.cache is None:
+            return None, None
+        key = self.cache.make_key(self.model, system_prompt, user_prompt, temperature)
+        return key, self.cache.get(key)
+
+    async def _acache_lookup(self, system_prompt: str, user_prompt: str, temperature: float):
+        if self.cache is None:
+            return None, None
+        return await asyncio.to_thread(self._cache_lookup, system_prompt, user_prompt, temperature)
+
+    @staticmethod
+    def _messages(system_prompt: str, user_prompt: str) -> list:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
 
+    @staticmethod
+    def _text(response) -> Optional[str]:
         try:
             return response.choices[0].message.content.strip()
         except Exception:
-            return "LLM response could not be parsed."
+            return None
+
+    def _parse(self, response, key=None) -> str:
+        text = self._text(response)
+        if text is None:
+            return PARSE_ERROR_MESSAGE
+
+        if key is not None:
+            self.cache.put(key, text)
+        return text
+
+    async def _aparse(self, response, key=None) -> str:
+        """`_parse` with the cache write in a worker thread."""
+        text = self._text(response)
+        if text is None:
+            return PARSE_ERROR_MESSAGE
+
+        if key is not None:
+            await asyncio.to_thread(self.cache.put, key, text)
+        return text
+
+
+class StreamedResponse:
+    """
+    Accumulates streamed chunks into the shape of a non-streamed response
+    (`choices[0].message.content`, `usage`), so `_parse` and the cache
+    treat both the same way.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.usage = None
+
+    def add(self, chunk, on_token, call: dict) -> None:
+        if getattr(chunk, "usage", None) is not None:
+            self.usage = chunk.usage
+        if not chunk.choices:
+            return
+        text = chunk.choices[0].delta.content
+        if text:
+            if call["first_token_at"] is None:
+                call["first_token_at"] = time.time()
+            self.parts.append(text)
+            on_token(text)
+
+    @property
+    def choices(self):
+        return [SimpleNamespace(message=SimpleNamespace(content="".join(self.parts)))]
@@ -1,14 +1,19 @@
-import json
+from utils.serialization import dumps
+from utils.template_renderer import TemplateRenderer
 
 class OverviewGenerator:
     """
     Responsible for:
     - Preparing the Overview prompt
+    - Rendering it from a template instead when there is no llm_client (offline)
     - Calling LLMClient to get the Overview text
     """
 
-    def __init__(self, llm_client):
+    def __init__(self, llm_client, compactor=None):
         self.llm_client = llm_client
+        # Optional PromptCompactor that shrinks the payload to a token budget.
+        self.compactor = compactor
+        self.renderer = TemplateRenderer()
 
         self.system_prompt = """
         You are a data analyst assistant.
@@ -27,16 +32,46 @@ class OverviewGenerator:
         6. Return ONLY the formatted text.
         """
 
-    def generate(self, dataset_profile: dict) -> str:
+    def build_user_prompt(self, dataset_profile: dict) -> str:
+        if hasattr(dataset_profile, "to_dict"):
+            # LazyDatasetProfile: computes whatever has not been computed yet.
+            dataset_profile = dataset_profile.to_dict()
+        if self.compactor is not None:
+            dataset_profile = self.compactor.compact_profile(dataset_profile)
+        return f"Dataset profile:\n{dumps(dataset_profile)}"
+
+    def generate(self, dataset_profile: dict, on_token=None) -> str:
         """
         Takes the full dataset profile dict and returns
         the LLM-generated overview text.
+        on_token: optional callback that receives the text as it streams in.
         """
-
-        user_prompt = f"Dataset profile:\n{json.dumps(dataset_profile, separators=(',', ':'))}"
+        if self.llm_client is None:
+            return self._render_offline(dataset_profile, on_token)
 
         return self.llm_client.chat(
             system_prompt=self.system_prompt,
-            user_prompt=user_prompt,
-            temperature=0
+            user_prompt=self.build_user_prompt(dataset_profile),
+            temperature=0,
+            on_token=on_token
         )
+
+    async def agenerate(self, dataset_profile: dict, on_token=None) -> str:
+        """Async version of `generate`."""
+        if self.llm_client is None:
+            return self._render_offline(dataset_profile, on_token)
+
+        return await self.llm_client.achat(
+            system_prompt=self.system_prompt,
+            user_prompt=self.build_user_prompt(dataset_profile),
+            temperature=0,
+            on_token=on_token
+        )
+
+    def _render_offline(self, dataset_profile: dict, on_token=None) -> str:
+        if hasattr(dataset_profile, "to_dict"):
+            dataset_profile = dataset_profile.to_dict()
+        text = self.renderer.render_overview(dataset_profile)
+        if on_token is not None:
+            on_token(text)
+        return text
@@ -0,0 +1,189 @@
+import math
+from typing import Optional
+
+from utils.serialization import dumps
+
+SEVERITY = {"critical": 0, "warning": 1, "healthy": 2}
+
+# Per-column dicts in the health report, ranked by value (worst first).
+_HEALTH_COLUMN_FIELDS = ("null_ratio_per_column", "outlier_count_per_column")
+_HEALTH_DEPENDENT_FIELDS = {"outlier_count_bounds_per_column": "outlier_count_per_column"}
+
+
+def estimate_tokens(payload) -> int:
+    """Rough token count of a JSON payload (~4 characters per token)."""
+    text = payload if isinstance(payload, str) else dumps(payload)
+    return int(math.ceil(len(text) / 4))
+
+
+class PromptCompactor:
+    """
+    Responsible for:
+    - Shrinking the profile / health payloads before they are sent to the LLM
+    - Keeping what matters: issues ranked by severity, unhealthy columns first
+    - Staying within `token_budget` when possible
+
+    Always applied: floats rounded to `float_digits` significant digits, healthy
+    columns dropped from per-column issue maps, columns grouped by schema type
+    or by identical issue value, sample rows and long strings truncated.
+    Applied only while over budget: keep only the top-N ranked columns (N halves
+    each step), then drop sample rows.
+    `last_stats` records tokens_before / tokens_after / tokens_saved of the last call.
+    """
+
+    def __init__(self, token_budget: int = 2000, float_digits: int = 4, max_sample_rows: int = 3,
+                 max_string_length: int = 50):
+        self.token_budget = token_budget
+        self.float_digits = float_digits
+        self.max_sample_rows = max_sample_rows
+        self.max_string_length = max_string_length
+        self.last_stats: Optional[dict] = None
+
+    # ---------- profile ----------
+
+    def compact_profile(self, profile: dict) -> dict:
+        before = estimate_tokens(profile)
+        compact = self._round(self._base_profile(profile))
+        compact = self._fit(compact, self._limit_profile_columns, len(compact.get("statistics", {})), "sample_rows")
+        return self._record(before, compact)
+
+    def _base_profile(self, profile: dict) -> dict:
+        compact = {}
+        metadata = dict(profile.get("metadata", {}))
+        if "missing_counts" in metadata:
+            metadata["missing_counts"] = self._unhealthy(metadata["missing_counts"])
+        # Column names are repeated by the schema groups below.
+        metadata.pop("column_names", None)
+        compact["metadata"] = metadata
+
+        if "schema" in profile:
+            compact["schema"] = self._group_schema(profile["schema"])
+        if "sample_rows" in profile:
+            compact["sample_rows"] = self._truncate_rows(profile["sample_rows"])
+        if "statistics" in profile:
+            missing = metadata.get("missing_counts", {})
+            ranked = sorted(profile["statistics"], key=lambda col: -missing.get(col, 0))
+            compact["statistics"] = {col: profile["statistics"][col] for col in ranked}
+        return compact
+
+    def _group_schema(self, schema: dict) -> list:
+        groups = {}
+        for col, info in schema.items():
+            key = (info.get("dtype_inferred"), bool(info.get("nullable")))
+            groups.setdefault(key, []).append(col)
+        return [
+            {"dtype": dtype, "nullable": nullable, "columns": columns}
+            for (dtype, nullable), columns in groups.items()
+        ]
+
+    def _limit_profile_columns(self, compact: dict, limit: int) -> dict:
+        compact = dict(compact)
+        stats = compact.get("statistics", {})
+        if len(stats) > limit:
+            kept = list(stats)[:limit]
+            compact["statistics"] = {col: stats[col] for col in kept}
+            compact["statistics_omitted_columns"] = len(stats) - limit
+            if "sample_rows" in compact:
+                compact["sample_rows"] = [{col: row[col] for col in kept if col in row}
+                                          for row in compact["sample_rows"]]
+        return compact
+
+    # ---------- health report ----------
+
+    def compact_health_report(self, report: dict) -> dict:
+        before = estimate_tokens(report)
+        checks = sorted(report.get("checks", []), key=lambda c: SEVERITY.get(c.get("status"), len(SEVERITY)))
+        compact = {"checks": [self._base_check(check) for check in checks]}
+        compact = self._round(compact)
+        width = max([len(c["details"].get(f, {})) for c in compact["checks"] for f in _HEALTH_COLUMN_FIELDS] or [0])
+        compact = self._fit(compact, self._limit_health_columns, width, "sample_duplicates")
+        for check in compact["checks"]:
+            for field in _HEALTH_COLUMN_FIELDS:
+                if field in check["details"]:
+                    check["details"][field] = self._group_equal_values(check["details"][field])
+        return self._record(before, compact)
+
+    def _base_check(self, check: dict) -> dict:
+        details = dict(check.get("details", {}))
+        for field in _HEALTH_COLUMN_FIELDS:
+            if field in details:
+                details[field] = self._unhealthy(details[field])
+        for field, source in _HEALTH_DEPENDENT_FIELDS.items():
+            if field in details:
+                details[field] = {col: details[field][col] for col in details.get(source, {}) if col in details[field]}
+        if "sample_duplicates" in details:
+            details["sample_duplicates"] = self._truncate_rows(details["sample_duplicates"])
+        return {"name": check.get("name"), "status": check.get("status"), "details": details}
+
+    def _limit_health_columns(self, compact: dict, limit: int) -> dict:
+        checks = []
+        for check in compact["checks"]:
+            details = dict(check["details"])
+            for field in _HEALTH_COLUMN_FIELDS:
+                values = details.get(field, {})
+                if len(values) > limit:
+                    details[field] = dict(list(values.items())[:limit])
+                    details[field.replace("_per_column", "_omitted_columns")] = len(values) - limit
+            for field, source in _HEALTH_DEPENDENT_FIELDS.items():
+                if field in details:
+                    details[field] = {col: v for col, v in details[field].items() if col in details.get(source, {})}
+            checks.append({**check, "details": details})
+        return {"checks": checks}
+
+    # ---------- shared helpers ----------
+
+    def _fit(self, compact: dict, limit_columns, width: int, samples_field: str) -> dict:
+        """Shrink step by step until the payload fits the token budget."""
+        shrunk, limit = compact, width
+        while limit > 1 and estimate_tokens(shrunk) > self.token_budget:
+            limit //= 2
+            shrunk = limit_columns(compact, limit)
+        if estimate_tokens(shrunk) > self.token_budget:
+            shrunk = self._drop_field(shrunk, samples_field)
+        return shrunk
+
+    def _drop_field(self, value, field: str):
+        if isinstance(value, dict):
+            return {k: self._drop_field(v, field) for k, v in value.items() if k != field}
+        if isinstance(value, list):
+            return [self._drop_field(v, field) for v in value]
+        return value
+
+    def _unhealthy(self, per_column: dict) -> dict:
+        """Drop zero-valued (healthy) columns and put the worst first."""
+        items = [(col, v) for col, v in per_column.items() if isinstance(v, (int, float)) and v and v == v]
+        return dict(sorted(items, key=lambda item: -item[1]))
+
+    def _group_equal_values(self, per_column: dict):
+        """{col: value} -> [{"value": v, "columns": [...]}] when many columns share a value."""
+        groups = {}
+        for col, value in per_column.items():
+            groups.setdefault(value, []).append(col)
+        if len(groups) == len(per_column):
+            return per_column
+        return [{"value": value, "columns": columns} for value, columns in groups.items()]
+
+    def _truncate_rows(self, rows: list) -> list:
+        return [
+            {k: self._truncate_value(v) for k, v in row.items()}
+            for row in rows[:self.max_sample_rows]
+        ]
+
+    def _truncate_value(self, value):
+        if isinstance(value, str) and len(value) > self.max_string_length:
+            return value[:self.max_string_length] + "…"
+        return value
+
+    def _round(self, value):
+        if isinstance(value, dict):
+            return {k: self._round(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._round(v) for v in value]
+        if isinstance(value, float) and math.isfinite(value):
+            return float(f"{value:.{self.float_digits}g}")
+        return value
+
+    def _record(self, before: int, compact: dict) -> dict:
+        after = estimate_tokens(compact)
+        self.last_stats = {"tokens_before": before, "tokens_after": after, "tokens_saved": before - after}
+        return compact
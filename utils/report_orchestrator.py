@@ -0,0 +1,38 @@
+import asyncio
+
+
+class ReportOrchestrator:
+    """
+    Responsible for:
+    - Computing every section's local input (profile, health report) first
+    - Sending all section prompts to the LLM at once
+    So a report takes as long as its slowest section, not the sum of all of them.
+    """
+
+    def __init__(self, overview_module=None, data_health_module=None):
+        self.overview_module = overview_module
+        self.data_health_module = data_health_module
+
+    async def agenerate(self, df, file_path: str = None, n_samples: int = 5) -> dict:
+        """Returns {"overview": text, "data_health": text} for the configured modules."""
+        local_steps = {}
+        if self.overview_module is not None:
+            local_steps["overview"] = asyncio.to_thread(
+                self.overview_module.build_profile, df, file_path=file_path, n_samples=n_samples
+            )
+        if self.data_health_module is not None:
+            local_steps["data_health"] = asyncio.to_thread(self.data_health_module.build_health_report, df)
+
+        inputs = dict(zip(local_steps, await asyncio.gather(*local_steps.values())))
+
+        prompts = {}
+        if "overview" in inputs:
+            prompts["overview"] = self.overview_module.overview_generator.agenerate(inputs["overview"])
+        if "data_health" in inputs:
+            prompts["data_health"] = self.data_health_module.data_health_generator.agenerate(inputs["data_health"])
+
+        return dict(zip(prompts, await asyncio.gather(*prompts.values())))
+
+    def generate(self, df, file_path: str = None, n_samples: int = 5) -> dict:
+        """Blocking wrapper around `agenerate` for scripts."""
+        return asyncio.run(self.agenerate(df, file_path=file_path, n_samples=n_samples))
@@ -0,0 +1,232 @@
+import json
+import os
+import socketserver
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+import pandas as pd
+
+from utils.data_loader import CSVLoader
+from utils.serialization import dumps
+
+SECTIONS = ("overview", "data_health")
+
+
+class DatasetCache:
+    """
+    Responsible for:
+    - Keeping loaded DataFrames and everything computed from them in memory
+    - Evicting the least recently used datasets past `max_bytes`
+
+    Entries are keyed by (absolute path, mtime, size), so an edited file is
+    reloaded and its stale entry dropped. The size of an entry is the deep
+    memory usage of its DataFrame; the profiles stored next to it are small.
+    Loading is serialized per dataset, so concurrent requests for the same
+    file load it once.
+    """
+
+    def __init__(self, max_bytes: int = 2 * 1024 ** 3, loader_factory: Callable = CSVLoader):
+        self.max_bytes = max_bytes
+        self.loader_factory = loader_factory
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._loading = {}
+
+    @staticmethod
+    def key(path: str) -> tuple:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def entry(self, path: str) -> dict:
+        """The cache entry of `path` ({"df", "results"}), loading the file on a miss."""
+        key = self.key(path)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        with load_lock:
+            try:
+                with self._lock:
+                    entry = self._lookup(key)
+                if entry is None:
+                    df = self.loader_factory(key[0]).load()
+                    entry = {"df": df, "results": {}, "bytes": int(df.memory_usage(deep=True).sum())}
+                    with self._lock:
+                        self.misses += 1
+                        self._insert(key, entry)
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+        return entry
+
+    def get_or_compute(self, path: str, name, compute: Callable[[pd.DataFrame], object]):
+        """Result `name` for the dataset at `path`, computed with `compute(df)` only once."""
+        entry = self.entry(path)
+        results = entry["results"]
+        if name not in results:
+            # Two threads may compute the same result; both get a valid answer.
+            results[name] = compute(entry["df"])
+        return results[name]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "datasets": [{"path": k[0], "bytes": e["bytes"], "results": list(map(str, e["results"]))}
+                             for k, e in self._entries.items()],
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _lookup(self, key: tuple) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry
+
+    def _insert(self, key: tuple, entry: dict) -> None:
+        for stale in [k for k in self._entries if k[0] == key[0]]:
+            self._bytes -= self._entries.pop(stale)["bytes"]
+        self._entries[key] = entry
+        self._bytes += entry["bytes"]
+        # The newest dataset stays even when it alone exceeds the budget.
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted["bytes"]
+
+
+class ReportService:
+    """
+    Responsible for:
+    - Keeping OverviewModule and DataHealthModule resident between requests
+    - Answering profile, health report and report requests from DatasetCache
+
+    Repeated or follow-up requests on an unchanged file skip loading and
+    profiling; only the LLM step (if any) runs again.
+    """
+
+    def __init__(self, overview_module, data_health_module, cache: DatasetCache = None):
+        self.overview_module = overview_module
+        self.data_health_module = data_health_module
+        self.cache = cache or DatasetCache()
+
+    def profile(self, path: str, n_samples: int = 5) -> dict:
+        return self.cache.get_or_compute(path, ("profile", n_samples), lambda df: self.overview_module.build_profile(
+            df, file_path=os.path.abspath(path), n_samples=n_samples
+        ))
+
+    def health_report(self, path: str) -> dict:
+        return self.cache.get_or_compute(path, "health_report", self.data_health_module.build_health_report)
+
+    def report(self, path: str, sections: tuple = SECTIONS, n_samples: int = 5) -> dict:
+        """{section: text} for the requested sections."""
+        texts = {}
+        if "overview" in sections:
+            texts["overview"] = self.overview_module.overview_generator.generate(self.profile(path, n_samples))
+        if "data_health" in sections:
+            texts["data_health"] = self.data_health_module.data_health_generator.generate(self.health_report(path))
+        return texts
+
+
+class ReportRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON over HTTP:
+    - GET  /status          cache statistics
+    - POST /profile         {"path", "n_samples"?}         -> dataset profile
+    - POST /health_report   {"path"}                       -> health report dict
+    - POST /report          {"path", "sections"?, "n_samples"?} -> {section: text}
+    - POST /cache/clear
+    """
+
+    service: ReportService = None  # set by make_server
+
+    def do_GET(self):
+        if self.path == "/status":
+            self._send(200, self.service.cache.stats())
+        else:
+            self._send(404, {"error": f"Unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as exc:
+            self._send(400, {"error": f"Invalid JSON: {exc}"})
+            return
+
+        try:
+            if self.path == "/cache/clear":
+                self.service.cache.clear()
+                self._send(200, {"cleared": True})
+                return
+            if "path" not in body:
+                self._send(400, {"error": "Missing 'path'"})
+                return
+            n_samples = int(body.get("n_samples", 5))
+            if self.path == "/profile":
+                result = self.service.profile(body["path"], n_samples)
+            elif self.path == "/health_report":
+                result = self.service.health_report(body["path"])
+            elif self.path == "/report":
+                sections = tuple(body.get("sections") or SECTIONS)
+                unknown = set(sections) - set(SECTIONS)
+                if unknown:
+                    self._send(400, {"error": f"Unknown sections {sorted(unknown)}; expected {list(SECTIONS)}"})
+                    return
+                result = self.service.report(body["path"], sections, n_samples)
+            else:
+                self._send(404, {"error": f"Unknown endpoint {self.path}"})
+                return
+        except FileNotFoundError as exc:
+            self._send(404, {"error": str(exc)})
+            return
+        except Exception as exc:
+            self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        self._send(200, result)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def _send(self, status: int, payload) -> None:
+        body = dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+        # BaseHTTPRequestHandler reads these for its log lines and headers.
+        self.server_name, self.server_port = "localhost", 0
+
+
+def make_server(service: ReportService, host: str = "127.0.0.1", port: int = 8765, unix_socket: str = None):
+    """A threaded HTTP server for `service` on host:port, or on a Unix socket path."""
+    handler = type("BoundReportRequestHandler", (ReportRequestHandler,), {"service": service})
+    if unix_socket:
+        return ThreadingUnixHTTPServer(unix_socket, handler)
+    return ThreadingHTTPServer((host, port), handler)
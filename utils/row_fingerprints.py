@@ -0,0 +1,179 @@
+import heapq
+import os
+import shutil
+import tempfile
+import weakref
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Two independent 64-bit hashes give a 128-bit row fingerprint.
+_HASH_KEYS = ("0123456789123456", "6543219876543210")
+
+FINGERPRINT_DTYPE = np.dtype([("h1", "<u8"), ("h2", "<u8"), ("pos", "<i8")])
+
+
+# Object columns pandas inferred as these hold only integers / booleans or only numbers (plus nulls).
+_INTEGER_INFERRED = ("boolean", "integer")
+_NUMBER_INFERRED = ("floating", "mixed-integer-float", "decimal")
+# One hash for every missing number, whatever dtype held it.
+_MISSING_HASH = pd.util.hash_array(np.array([np.nan]))[0]
+
+
+def _number_hashes(series: pd.Series) -> np.ndarray:
+    """
+    Per-value hashes of a numeric column. Integral values hash as int64
+    whether they were read as integers or floats, so they stay lossless past
+    2**53; other floats hash as float64 and every missing value as one hash.
+    """
+    missing = series.isna().to_numpy()
+    if series.dtype.kind in "iub":
+        # numpy or nullable integers / booleans; missing slots are overwritten below.
+        dtype = np.uint64 if series.dtype.kind == "u" else np.int64
+        hashes = pd.util.hash_array(series.to_numpy(dtype=dtype, na_value=0))
+    else:
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        hashes = pd.util.hash_array(values)
+        integral = np.isfinite(values) & (values == np.trunc(values)) & (np.abs(values) < 2.0 ** 63)
+        if integral.any():
+            hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    hashes[missing] = _MISSING_HASH
+    return hashes
+
+
+def hashable_frame(df: pd.DataFrame, hash_key: str = None) -> pd.DataFrame:
+    """
+    One uint64 column of per-value hashes for every column of `df`, so a row
+    hashes the same whichever dtype its chunk was read with: numbers go
+    through _number_hashes (integers, booleans, floats, nullable and
+    all-numeric object columns alike); text hashes the same as object, str
+    or category. Hash the result with pd.util.hash_pandas_object.
+    """
+    key = {} if hash_key is None else {"hash_key": hash_key}
+    columns = {}
+    for col in range(df.shape[1]):
+        series = df.iloc[:, col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        dtype = series.dtype
+        if dtype == object:
+            inferred = pd.api.types.infer_dtype(series, skipna=True)
+            if inferred in _INTEGER_INFERRED:
+                series = series.astype("Int64")
+            elif inferred in _NUMBER_INFERRED:
+                series = pd.to_numeric(series.where(series.notna(), np.nan)).astype(np.float64)
+        if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_complex_dtype(series.dtype):
+            columns[col] = _number_hashes(series)
+        else:
+            columns[col] = pd.util.hash_pandas_object(series, index=False, **key).to_numpy(dtype=np.uint64)
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def row_fingerprints(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized 128-bit fingerprint of every row (see hashable_frame), as two uint64 arrays."""
+    return tuple(
+        pd.util.hash_pandas_object(hashable_frame(df, hash_key=key), index=False).to_numpy(dtype=np.uint64)
+        for key in _HASH_KEYS
+    )
+
+
+class RowFingerprintStore:
+    """
+    Hash-partitioned store of row fingerprints used for exact duplicate counting.
+    Records (h1, h2, row position) are bucketed by the top bits of h1. When the
+    in-memory records exceed `memory_budget_bytes`, every bucket is appended to
+    its own temp file, so the final scan only ever holds one bucket in memory.
+    """
+
+    def __init__(self, memory_budget_bytes: int = 256 * 1024 ** 2, num_partitions: int = 64,
+                 spill_dir: str = None):
+        if num_partitions < 1 or num_partitions & (num_partitions - 1):
+            raise ValueError("num_partitions must be a power of two.")
+        self.memory_budget_bytes = memory_budget_bytes
+        self.num_partitions = num_partitions
+        self.spill_dir = spill_dir
+        self.partitions: List[List[np.ndarray]] = [[] for _ in range(num_partitions)]
+        self.buffered_bytes = 0
+        self.row_count = 0
+        self._spill_path = None
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill_path is not None
+
+    def add(self, h1: np.ndarray, h2: np.ndarray, positions: np.ndarray) -> None:
+        records = np.empty(len(h1), dtype=FINGERPRINT_DTYPE)
+        records["h1"], records["h2"], records["pos"] = h1, h2, positions
+        self.row_count += len(records)
+
+        shift = np.uint64(64 - self.num_partitions.bit_length() + 1)
+        buckets = (h1 >> shift).astype(np.intp) if self.num_partitions > 1 else np.zeros(len(h1), np.intp)
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(self.num_partitions + 1))
+        for p in range(self.num_partitions):
+            if bounds[p] < bounds[p + 1]:
+                self.partitions[p].append(records[order[bounds[p]:bounds[p + 1]]])
+
+        self.buffered_bytes += records.nbytes
+        if self.buffered_bytes > self.memory_budget_bytes:
+            self.spill()
+
+    def spill(self) -> None:
+        """Append every in-memory bucket to its temp file."""
+        if self._spill_path is None:
+            self._spill_path = tempfile.mkdtemp(prefix="row-fingerprints-", dir=self.spill_dir)
+            weakref.finalize(self, shutil.rmtree, self._spill_path, True)
+        for p, chunks in enumerate(self.partitions):
+            if chunks:
+                with open(self._partition_file(p), "ab") as f:
+                    for records in chunks:
+                        records.tofile(f)
+        self.partitions = [[] for _ in range(self.num_partitions)]
+        self.buffered_bytes = 0
+
+    def scan(self, sample_size: int = 5) -> Tuple[int, List[int]]:
+        """
+        Returns (duplicate_count, positions) where positions are the first
+        `sample_size` row positions that repeat an earlier row.
+        A row counts as a duplicate when it equals any earlier row, as in df.duplicated().
+        """
+        duplicate_count = 0
+        first_positions: List[int] = []
+        for p in range(self.num_partitions):
+            records = self._load_partition(p)
+            if records.size < 2:
+                continue
+            records = records[np.lexsort((records["pos"], records["h2"], records["h1"]))]
+            repeat = (records["h1"][1:] == records["h1"][:-1]) & (records["h2"][1:] == records["h2"][:-1])
+            duplicate_count += int(repeat.sum())
+            if sample_size:
+                positions = records["pos"][1:][repeat]
+                if positions.size > sample_size:
+                    positions = np.partition(positions, sample_size - 1)[:sample_size]
+                first_positions = heapq.nsmallest(sample_size, first_positions + positions.tolist())
+        return duplicate_count, sorted(first_positions)
+
+    def __getstate__(self):
+        # Temp files do not survive pickling: fold every bucket back into memory.
+        state = self.__dict__.copy()
+        state["partitions"] = [[self._load_partition(p)] for p in range(self.num_partitions)]
+        state["buffered_bytes"] = sum(parts[0].nbytes for parts in state["partitions"])
+        state["_spill_path"] = None
+        return state
+
+    def close(self) -> None:
+        if self._spill_path is not None:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+            self._spill_path = None
+
+    def _partition_file(self, p: int) -> str:
+        return os.path.join(self._spill_path, f"part-{p:05d}.bin")
+
+    def _load_partition(self, p: int) -> np.ndarray:
+        parts = list(self.partitions[p])
+        if self._spill_path is not None and os.path.exists(self._partition_file(p)):
+            parts.insert(0, np.fromfile(self._partition_file(p), dtype=FINGERPRINT_DTYPE))
+        if not parts:
+            return np.empty(0, dtype=FINGERPRINT_DTYPE)
+        return np.concatenate(parts)
@@ -0,0 +1,115 @@
+import math
+from statistics import NormalDist
+from typing import List
+
+import pandas as pd
+
+from utils.column_stats import ColumnStatsContext
+from utils.data_loader import SAMPLING_ATTR
+
+
+def wilson_interval(successes: int, n: int, confidence: float = 0.95, population: int = None) -> List[float]:
+    """
+    Wilson score interval for a proportion observed as successes / n.
+    With `population` (rows in the whole file) the finite population
+    correction is applied, so a sample of the entire file gives a zero-width interval.
+    """
+    if n == 0:
+        return [0.0, 1.0]
+    p = successes / n
+    fpc = (population - n) / (population - 1) if population and population > 1 else 1.0
+    if fpc <= 0:
+        return [p, p]
+    z2 = NormalDist().inv_cdf(0.5 + confidence / 2) ** 2 * fpc
+    denominator = 1 + z2 / n
+    center = (p + z2 / (2 * n)) / denominator
+    half_width = math.sqrt(z2 * (p * (1 - p) / n + z2 / (4 * n * n))) / denominator
+    return [max(0.0, center - half_width), min(1.0, center + half_width)]
+
+
+def mean_interval(mean: float, std: float, n: int, confidence: float = 0.95, population: int = None) -> List[float]:
+    """Normal-approximation interval for a column mean."""
+    if n < 2 or pd.isna(std):
+        return [float("nan"), float("nan")]
+    fpc = (population - n) / (population - 1) if population and population > 1 else 1.0
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * std / math.sqrt(n) * math.sqrt(max(fpc, 0.0))
+    return [mean - half_width, mean + half_width]
+
+
+class SampleEstimator:
+    """
+    Responsible for:
+    - Turning results computed on a random sample into estimates for the whole file
+    - Attaching confidence intervals to a dataset profile and to a health report
+
+    Works on DataFrames produced by SamplingCSVLoader (df.attrs["sampling"]).
+    Null ratios, outlier rates and top-value shares get Wilson intervals.
+    The duplicate rate found inside a sample is a lower bound for the file:
+    a duplicate only shows up when its original was sampled as well. Dividing
+    it by the sampling fraction gives an estimate for the file that is right
+    when duplicated rows mostly occur twice.
+    """
+
+    def __init__(self, confidence: float = 0.95):
+        self.confidence = confidence
+
+    @staticmethod
+    def is_sample(df: pd.DataFrame) -> bool:
+        return SAMPLING_ATTR in df.attrs
+
+    def sampling_summary(self, df: pd.DataFrame) -> dict:
+        return {**df.attrs[SAMPLING_ATTR], "confidence": self.confidence}
+
+    def annotate_profile(self, profile: dict, df: pd.DataFrame) -> dict:
+        n, population = len(df), df.attrs[SAMPLING_ATTR]["population_rows"]
+        missing = ColumnStatsContext.of(df).null_counts
+
+        for col, col_stats in profile.get("statistics", {}).items():
+            if not col_stats:
+                continue
+            col_stats["missing_ratio_interval"] = self._interval(int(missing[col]), n, population)
+            non_null = n - int(missing[col])
+            if "mean" in col_stats:
+                col_stats["mean_interval"] = mean_interval(col_stats["mean"], col_stats["std"], non_null,
+                                                           self.confidence, population)
+            if "top_values" in col_stats:
+                col_stats["top_value_share_intervals"] = {
+                    value: self._interval(count, non_null, population) for value, count in col_stats["top_values"].items()
+                }
+            if "counts" in col_stats:
+                col_stats["count_share_intervals"] = {
+                    value: self._interval(count, non_null, population) for value, count in col_stats["counts"].items()
+                }
+
+        profile["sampling"] = self.sampling_summary(df)
+        return profile
+
+    def annotate_health_report(self, report: dict, df: pd.DataFrame) -> dict:
+        sampling = df.attrs[SAMPLING_ATTR]
+        n, population = len(df), sampling["population_rows"]
+
+        for check in report["checks"]:
+            details = check["details"]
+            if "null_ratio_per_column" in details:
+                missing = ColumnStatsContext.of(df).null_counts
+                details["null_ratio_intervals"] = {
+                    col: self._interval(int(missing[col]), n, population) for col in details["null_ratio_per_column"]
+                }
+            if "outlier_count_per_column" in details:
+                details["outlier_rate_intervals"] = {
+                    col: self._interval(count, n, population)
+                    for col, count in details["outlier_count_per_column"].items()
+                }
+            if "duplicate_count" in details:
+                low, high = self._interval(details["duplicate_count"], n, population)
+                details["duplicate_rate_lower_bound_interval"] = [low, high]
+                fraction = sampling["fraction"] or 1.0
+                details["duplicate_rate_estimate_interval"] = [min(1.0, low / fraction), min(1.0, high / fraction)]
+            if "row_count" in details:
+                details["population_row_count"] = population
+
+        report["sampling"] = self.sampling_summary(df)
+        return report
+
+    def _interval(self, successes: int, n: int, population: int) -> List[float]:
+        return wilson_interval(int(successes), n, self.confidence, population)
@@ -0,0 +1,128 @@
+import datetime
+import decimal
+import json
+import math
+import pickle
+
+import numpy as np
+import pandas as pd
+
+# Bumped when the binary layout changes; loadb rejects other versions.
+BINARY_FORMAT_VERSION = 1
+_BINARY_MAGIC = b"RPT"
+_PLAIN_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _array_to_list(values: np.ndarray) -> list:
+    """Whole-array conversion to Python values: one tolist() plus a vectorized non-finite pass."""
+    kind = values.dtype.kind
+    if kind in "iub":
+        return values.tolist()
+    if kind == "f":
+        result = values.tolist()
+        for i in np.flatnonzero(~np.isfinite(values)):
+            result[i] = None
+        return result
+    if kind in "mM":
+        missing = np.isnat(values)
+        strings = (np.datetime_as_string(values) if kind == "M" else values.astype(str)).astype(object)
+        strings[missing] = None
+        return strings.tolist()
+    return [to_builtin(v) for v in values.tolist()]
+
+
+def _series_to_list(series: pd.Series) -> list:
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype) and dtype.kind in "iub":
+        # Nullable Int64 / boolean: keep integers instead of going through float64.
+        return [to_builtin(v) for v in series.to_numpy(dtype=object, na_value=None).tolist()]
+    return _array_to_list(series.to_numpy())
+
+
+def _key(key):
+    value = to_builtin(key)
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
+
+def to_builtin(value):
+    """
+    Convert a payload to JSON-compatible Python values.
+    - NumPy / pandas scalars -> int, float, bool; NaN, ±inf, NaT, pd.NA -> None
+    - Timestamps, datetimes, dates -> ISO 8601 strings; Timedeltas -> strings
+    - ndarrays, Index, Series -> lists / dicts, converted per array, not per element
+    - DataFrames -> list of records; dict keys become str / int / float / bool
+    """
+    value_type = type(value)
+    if value_type in _PLAIN_TYPES:
+        return value
+    if value_type is float:
+        return value if math.isfinite(value) else None
+    if value_type is dict:
+        return {k if type(k) in _PLAIN_TYPES else _key(k): to_builtin(v) for k, v in value.items()}
+    if value_type is list or value_type is tuple:
+        return [to_builtin(v) for v in value]
+    if isinstance(value, float):  # np.float64 and other float subclasses
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return to_builtin(dict(value))
+    if isinstance(value, str):  # np.str_ and other str subclasses
+        return str(value)
+    if isinstance(value, int) and not isinstance(value, np.generic):
+        return int(value)
+    if isinstance(value, np.ndarray):
+        return _array_to_list(value) if value.ndim == 1 else [to_builtin(row) for row in value]
+    if isinstance(value, pd.DataFrame):
+        keys = [_key(col) for col in value.columns]
+        columns = [_series_to_list(value.iloc[:, i]) for i in range(value.shape[1])]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+    if isinstance(value, pd.Series):
+        if isinstance(value.index, pd.RangeIndex):
+            return _series_to_list(value)
+        return dict(zip(map(_key, value.index), _series_to_list(value)))
+    if isinstance(value, pd.Index):
+        return to_builtin(value.to_numpy())
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value) if np.isfinite(value) else None
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, (pd.Timestamp, datetime.datetime, datetime.date, datetime.time)):
+        return None if value is pd.NaT else value.isoformat()
+    if isinstance(value, (pd.Timedelta, datetime.timedelta, np.timedelta64, np.datetime64)):
+        return None if pd.isna(value) else str(value)
+    if isinstance(value, decimal.Decimal):
+        return to_builtin(float(value))
+    if isinstance(value, (set, frozenset)):
+        return [to_builtin(v) for v in sorted(value, key=str)]
+    if value is pd.NA:
+        return None
+    if hasattr(value, "to_dict"):
+        return to_builtin(value.to_dict())
+    return str(value)
+
+
+def dumps(payload, indent: int = None) -> str:
+    """Compact JSON text of `payload` (as produced by to_builtin); never fails on NumPy / pandas values."""
+    separators = None if indent is not None else (",", ":")
+    # to_builtin already maps NaN / ±inf to None; allow_nan=False keeps the output strict JSON.
+    return json.dumps(to_builtin(payload), separators=separators, indent=indent, ensure_ascii=False,
+                      allow_nan=False)
+
+
+def dumpb(payload) -> bytes:
+    """
+    Binary form of `payload` for local caches: the to_builtin payload pickled
+    with the newest protocol behind a small versioned header. Only load bytes
+    this process (or a trusted one) wrote.
+    """
+    return _BINARY_MAGIC + bytes([BINARY_FORMAT_VERSION]) + pickle.dumps(
+        to_builtin(payload), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def loadb(data: bytes):
+    """Inverse of dumpb."""
+    if data[:len(_BINARY_MAGIC)] != _BINARY_MAGIC or data[len(_BINARY_MAGIC)] != BINARY_FORMAT_VERSION:
+        raise ValueError("Not a payload written by dumpb (or written by another format version).")
+    return pickle.loads(data[len(_BINARY_MAGIC) + 1:])
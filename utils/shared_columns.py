@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import weakref
+from functools import partial
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.column_stats import at_most_two_values, block_moments
+from utils.executors import create_executor
+
+# Shards per worker: enough to balance uneven columns, few enough to keep task overhead low.
+_SHARDS_PER_WORKER = 4
+
+
+def _shareable(series: pd.Series) -> np.ndarray:
+    """Plain NumPy buffer of a numeric column (nullable / boolean columns become float64 with NaN)."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iuf":
+        return np.ascontiguousarray(series.to_numpy())
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+class SharedColumnStore:
+    """
+    Numeric columns of a DataFrame written once to memory-mapped .npy files,
+    so worker processes attach to them zero-copy instead of unpickling data.
+    Files live in /dev/shm (shared memory) when it exists, else in the temp dir.
+    `files` (column -> path) is all a worker needs; it pickles in microseconds.
+    Use as a context manager; the files are removed on close.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: List, directory: str = None):
+        if directory is None and os.path.isdir("/dev/shm"):
+            directory = "/dev/shm"
+        self.path = tempfile.mkdtemp(prefix="shared-columns-", dir=directory)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, True)
+        self.files: Dict = {}
+        for i, col in enumerate(columns):
+            file = os.path.join(self.path, f"{i}.npy")
+            np.save(file, _shareable(df[col]))
+            self.files[col] = file
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def __enter__(self) -> "SharedColumnStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach(files: Dict, columns: List) -> Dict:
+    """Worker side: read-only, memory-mapped views of the given columns."""
+    return {col: np.load(files[col], mmap_mode="r") for col in columns}
+
+
+def _shards(columns: List, max_workers: Optional[int]) -> List[List]:
+    workers = max_workers or os.cpu_count() or 1
+    size = max(1, -(-len(columns) // (workers * _SHARDS_PER_WORKER)))
+    return [columns[i:i + size] for i in range(0, len(columns), size)]
+
+
+def _map_shards(task, df: pd.DataFrame, columns: List, max_workers: Optional[int]) -> Dict:
+    columns = list(columns)
+    if not columns:
+        return {}
+    results = {}
+    with SharedColumnStore(df, columns) as store, create_executor("process", max_workers) as pool:
+        for shard_result in pool.map(partial(task, store.files), _shards(columns, max_workers)):
+            results.update(shard_result)
+    return {col: results[col] for col in columns}
+
+
+def _numeric_stats_task(files: Dict, columns: List) -> Dict:
+    values = attach(files, columns)
+    block = np.column_stack([values[col].astype(np.float64, copy=False) for col in columns])
+    moments = block_moments(block, columns)
+    return {col: {**row, "missing": int(row["missing"])}
+            for col, row in zip(columns, moments.to_dict(orient="records"))}
+
+
+def _outlier_task(files: Dict, columns: List) -> Dict:
+    return {col: iqr_outlier_count(values) for col, values in attach(files, columns).items()}
+
+
+def iqr_outlier_count(values: np.ndarray) -> Optional[int]:
+    """IQR outlier count of a NumPy column, or None for binary/constant columns (as in OutlierIQRCheck)."""
+    if values.dtype.kind == "f":
+        values = values[~np.isnan(values)]
+    if values.size == 0 or at_most_two_values(values, values.min(), values.max()):
+        return None
+    q1, q3 = np.quantile(values, [0.25, 0.75])
+    iqr = q3 - q1
+    return int(((values < q1 - 1.5*iqr) | (values > q3 + 1.5*iqr)).sum())
+
+
+def shared_numeric_stats(df: pd.DataFrame, columns: List, max_workers: int = None) -> Dict:
+    """Column -> {missing, mean, std, min, max}, computed by worker processes over shared columns."""
+    return _map_shards(_numeric_stats_task, df, columns, max_workers)
+
+
+def shared_outlier_counts(df: pd.DataFrame, columns: List, max_workers: int = None) -> Dict:
+    """Column -> IQR outlier count (None for binary columns), computed by worker processes over shared columns."""
+    return _map_shards(_outlier_task, df, columns, max_workers)
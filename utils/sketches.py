@@ -0,0 +1,230 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch (Karnin, Lang & Liberty).
+    Memory is O(k) regardless of how many values are added.
+    Rank queries are within `rank_error` of the true normalized rank
+    with high probability (~99%).
+    """
+
+    _CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        self.k = max(int(k), 8)
+        self.rng = np.random.default_rng(seed)
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def for_error(cls, relative_error: float, seed: Optional[int] = 0) -> "KLLSketch":
+        """Smallest sketch whose normalized rank error is at most `relative_error`."""
+        return cls(k=cls.k_for_error(relative_error), seed=seed)
+
+    @staticmethod
+    def k_for_error(relative_error: float) -> int:
+        # Empirical KLL error curve (same constants as Apache DataSketches).
+        return int(math.ceil((2.296 / relative_error) ** (1 / 0.9723)))
+
+    @property
+    def rank_error(self) -> float:
+        return 2.296 / self.k ** 0.9723
+
+    def update(self, values) -> None:
+        """Add a batch of values; NaNs are ignored."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.count += int(values.size)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        if other.count == 0:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        """
+        Value whose estimated normalized rank is q, interpolated linearly
+        between neighbouring ranks as Series.quantile does; exact while no
+        compaction has happened.
+        """
+        if self.count == 0:
+            return float("nan")
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        items, weights = self._sorted_items()
+        cumulative = np.cumsum(weights)
+        # 0-based rank position; item i holds ranks [cumulative[i-1], cumulative[i]).
+        position = q * (cumulative[-1] - 1)
+        lower = math.floor(position)
+        below, above = np.searchsorted(cumulative, [lower, lower + 1], side="right").clip(max=items.size - 1)
+        return float(items[below] + (items[above] - items[below]) * (position - lower))
+
+    def rank(self, value: float, inclusive: bool = False) -> float:
+        """Estimated fraction of values < value (or <= value when inclusive)."""
+        if self.count == 0:
+            return float("nan")
+        items, weights = self._sorted_items()
+        side = "right" if inclusive else "left"
+        index = int(np.searchsorted(items, value, side=side))
+        return float(weights[:index].sum() / weights.sum())
+
+    def _sorted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2 ** h, dtype=np.float64)
+                                  for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * self._CAPACITY_DECAY ** depth)), 2)
+
+    def _compress(self) -> None:
+        while sum(level.size for level in self.levels) > sum(self._capacity(h) for h in range(len(self.levels))):
+            for h in range(len(self.levels)):
+                if self.levels[h].size > self._capacity(h):
+                    self._compact(h)
+                    break
+
+    def _compact(self, h: int) -> None:
+        items = np.sort(self.levels[h])
+        keep = items[-1:] if items.size % 2 else items[:0]
+        if items.size % 2:
+            items = items[:-1]
+        promoted = items[int(self.rng.integers(2))::2]
+        if h + 1 == len(self.levels):
+            self.levels.append(np.empty(0))
+        self.levels[h] = keep
+        self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorized int.bit_length for uint64 arrays (exact: splits into 32-bit halves)."""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch over 64-bit hashes.
+    Uses 2**precision one-byte registers; relative error is about
+    1.04 / sqrt(2**precision) (0.8% at the default precision of 14).
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(self.registers.size)
+
+    def update_hashes(self, hashes) -> None:
+        """Add a batch of uint64 hashes (e.g. from pd.util.hash_pandas_object)."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        rank = ((64 - p) - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting).
+            return float(m * math.log(m / zeros))
+        return float(raw)
+
+
+class SpaceSaving:
+    """
+    Mergeable heavy-hitter sketch (Space-Saving, Metwally et al.; merged as in
+    Agarwal et al., "Mergeable Summaries"). Keeps at most `capacity` counters,
+    so memory is bounded however many distinct values there are.
+    A reported count overestimates the true count by at most its own error;
+    `max_error` bounds that error for every counter and the count of every
+    value without one (roughly total / capacity for skewed data).
+    """
+
+    def __init__(self, capacity: int = 64):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict = {}
+        self.errors: Dict = {}
+        # Upper bound on the count of any value without a counter.
+        self.floor = 0
+
+    @property
+    def max_error(self) -> int:
+        return max(self.floor, max(self.errors.values(), default=0))
+
+    def update_counts(self, values, counts) -> None:
+        """Add the exact counts of one batch (e.g. from factorize + bincount)."""
+        counts = np.asarray(counts, dtype=np.int64)
+        if counts.size == 0:
+            return
+        order = np.argsort(-counts, kind="stable")
+        batch = SpaceSaving(self.capacity)
+        batch.total = int(counts.sum())
+        keep = order[:self.capacity]
+        batch.counts = dict(zip((values[i] for i in keep), counts[keep].tolist()))
+        batch.errors = dict.fromkeys(batch.counts, 0)
+        if counts.size > self.capacity:
+            batch.floor = int(counts[order[self.capacity]])
+        self.merge(batch)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        counts, errors = {}, {}
+        for value in self.counts.keys() | other.counts.keys():
+            mine, theirs = value in self.counts, value in other.counts
+            counts[value] = (self.counts[value] if mine else self.floor) + (other.counts[value] if theirs else other.floor)
+            errors[value] = (self.errors[value] if mine else self.floor) + (other.errors[value] if theirs else other.floor)
+        ranked = sorted(counts, key=counts.__getitem__, reverse=True)
+        floor = self.floor + other.floor
+        if len(ranked) > self.capacity:
+            floor = max(floor, counts[ranked[self.capacity]])
+        self.counts = {value: counts[value] for value in ranked[:self.capacity]}
+        self.errors = {value: errors[value] for value in ranked[:self.capacity]}
+        self.floor = floor
+        self.total += other.total
+
+    def top(self, k: int) -> List:
+        """[(value, estimated count, guaranteed minimum count)] for the k largest counters."""
+        ranked = sorted(self.counts, key=self.counts.__getitem__, reverse=True)[:k]
+        return [(value, self.counts[value], self.counts[value] - self.errors[value]) for value in ranked]
@@ -0,0 +1,83 @@
+from typing import Callable, Iterable, Tuple
+
+import pandas as pd
+
+from utils.data_health_base import HealthReport, HealthValidator
+from utils.data_loader import CSVLoader
+from utils.info_extraction.dataset_profile_builder import CombinedDatasetProfileBuilder
+
+
+class StreamingProfiler:
+    """
+    Responsible for:
+    - Reading a dataset once, chunk by chunk
+    - Feeding every chunk to the profile accumulators and the health-check accumulators
+    - Returning the dataset profile and the HealthReport from that single pass
+
+    Memory is the chunk size plus the accumulator state, which is not
+    bounded with the default settings:
+    - DuplicateRowsCheck(mode="exact") keeps one hash per distinct row;
+      mode="fingerprint" spills them to disk past its memory budget and
+      mode="approximate" uses constant memory
+    - StatisticsExtractor(mode="exact") keeps a count per distinct value of
+      every string column; mode="sketch" keeps a fixed-size sketch per column
+      instead. Numeric columns keep only their moments.
+
+    A column read as numbers in some chunks and as text in others loads as
+    text in a full read. Its values are counted again in a second pass that
+    reads only those columns, as text (profile_file does this; see recount).
+    """
+
+    def __init__(self, profile_builder: CombinedDatasetProfileBuilder, health_validator: HealthValidator,
+                 n_samples: int = 5):
+        self.profile_builder = profile_builder
+        self.health_validator = health_validator
+        self.n_samples = n_samples
+
+    def run(self, chunks: Iterable[pd.DataFrame], file_path: str = None) -> Tuple[dict, HealthReport]:
+        state = self.create_state()
+        self.update(state, chunks)
+        return self.finalize(state, file_path=file_path)
+
+    def create_state(self) -> dict:
+        """Fresh accumulators for the profile and for every health check."""
+        return {
+            "profile": self.profile_builder.create_accumulator(n_samples=self.n_samples),
+            "checks": self.health_validator.create_accumulators(),
+        }
+
+    def update(self, state: dict, chunks: Iterable[pd.DataFrame]) -> None:
+        for chunk in chunks:
+            state["profile"].update(chunk)
+            for accumulator in state["checks"]:
+                accumulator.update(chunk)
+
+    def recount(self, state: dict, read_text_chunks: Callable[[dict], Iterable[pd.DataFrame]]) -> None:
+        """
+        Second pass for the columns that mixed numeric and text chunks.
+        read_text_chunks(read_kwargs) re-reads the dataset with the extra
+        pd.read_csv arguments that select those columns as text.
+        """
+        statistics = state["profile"].statistics
+        columns = statistics.recount_columns
+        if columns:
+            statistics.recount(read_text_chunks(self.text_read_kwargs(columns)))
+
+    @staticmethod
+    def text_read_kwargs(columns: list) -> dict:
+        return {"usecols": columns, "dtype": {col: str for col in columns}}
+
+    def finalize(self, state: dict, file_path: str = None) -> Tuple[dict, HealthReport]:
+        """Does not consume the state: more chunks may be added afterwards."""
+        profile = self.profile_builder.finalize(state["profile"], file_path=file_path, n_samples=self.n_samples)
+        report = self.health_validator.finalize(state["checks"])
+        return profile, report
+
+    def profile_file(self, loader, chunksize: int = 100_000) -> Tuple[dict, HealthReport]:
+        """Profile a CSVLoader's file without loading it fully into memory."""
+        state = self.create_state()
+        self.update(state, loader.iter_chunks(chunksize=chunksize))
+        self.recount(state, lambda kwargs: CSVLoader(
+            loader.file_path, {**loader.read_kwargs, **kwargs}
+        ).iter_chunks(chunksize=chunksize))
+        return self.finalize(state, file_path=loader.file_path)
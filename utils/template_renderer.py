@@ -0,0 +1,138 @@
+from typing import List
+
+STATUS_ORDER = ("healthy", "warning", "critical")
+# Per-column bullets in the overview; wide datasets get a "… more columns" line.
+MAX_COLUMN_BULLETS = 12
+
+_FIXES = {
+    "Null Ratio Check": [
+        "Impute missing values (median / mode) or add a missing-indicator column.",
+        "Drop columns that are mostly empty if they carry no signal.",
+    ],
+    "Outlier IQR Check": [
+        "Verify extreme values at the source; correct data-entry errors.",
+        "Cap (winsorize) or transform skewed columns, or use robust models.",
+    ],
+    "Empty Dataset Check": [
+        "Check the export or query that produced the file.",
+    ],
+    "Duplicate Rows Check": [
+        "Remove exact duplicate rows, or deduplicate on the record key.",
+        "Find the step that produces duplicates (joins, repeated loads).",
+    ],
+}
+
+
+def _pct(value: float) -> str:
+    return f"{value * 100:.1f}%"
+
+
+def _join(items: List[str], limit: int = 5) -> str:
+    shown = ", ".join(f"`{item}`" for item in items[:limit])
+    return shown + (f" and {len(items) - limit} more" if len(items) > limit else "")
+
+
+class TemplateRenderer:
+    """
+    Responsible for:
+    - Rendering the Overview and Data Health sections without an LLM
+
+    Output follows the formats the LLM prompts ask for and depends only on
+    the profile / health report, so the same input always gives the same
+    text. Used by the generators when they have no llm_client (offline mode).
+    """
+
+    def render_overview(self, profile: dict) -> str:
+        metadata = profile.get("metadata", {})
+        schema = profile.get("schema", {})
+        statistics = profile.get("statistics", {})
+        rows, columns = metadata.get("num_rows", 0), metadata.get("num_columns", len(schema))
+
+        types = {}
+        for col, info in schema.items():
+            types.setdefault(info.get("dtype_inferred", "unknown"), []).append(col)
+        type_summary = ", ".join(f"{len(cols)} {dtype}" for dtype, cols in sorted(types.items()))
+
+        missing = {col: count for col, count in metadata.get("missing_counts", {}).items() if count}
+        total_missing = sum(missing.values())
+        source = metadata.get("file_path") or "The dataset"
+        paragraph = f"{source} contains {rows:,} rows and {columns} columns ({type_summary or 'no columns'})."
+        paragraph += (f" {total_missing:,} values are missing across {len(missing)} "
+                      f"column{'s' if len(missing) > 1 else ''}."
+                      if missing else " There are no missing values.")
+
+        column_bullets = []
+        identifiers = [col for col, stats in statistics.items()
+                       if stats and rows and stats.get("unique_values") == rows]
+        for col, stats in statistics.items():
+            if not stats:
+                continue
+            if "mean" in stats:
+                column_bullets.append(f"`{col}`: mean {stats['mean']:.4g}, std {stats['std']:.4g}, "
+                                      f"range {stats['min']:.4g} to {stats['max']:.4g}.")
+            elif "top_values" in stats and col not in identifiers and stats["top_values"]:
+                value, count = next(iter(stats["top_values"].items()))
+                share = count / (rows - stats.get("missing", 0)) if rows else 0
+                column_bullets.append(f"`{col}`: {stats['unique_values']} distinct values, "
+                                      f"most common `{value}` ({_pct(share)}).")
+        bullets = []
+        if identifiers:
+            bullets.append(f"Likely identifier columns (all values unique): {_join(identifiers)}.")
+        bullets += column_bullets[:MAX_COLUMN_BULLETS]
+        if len(column_bullets) > MAX_COLUMN_BULLETS:
+            bullets.append(f"… and {len(column_bullets) - MAX_COLUMN_BULLETS} more columns.")
+        if missing:
+            worst = sorted(missing, key=lambda col: -missing[col])
+            bullets.append(f"Missing values are concentrated in {_join(worst)}.")
+
+        return paragraph + "\n\n" + "\n".join(f"- {bullet}" for bullet in bullets)
+
+    def render_data_health(self, health_report: dict) -> str:
+        checks = health_report.get("checks", [])
+        row_count = next((c["details"]["row_count"] for c in checks if "row_count" in c["details"]), None)
+        worst = max((c["status"] for c in checks), key=STATUS_ORDER.index, default="healthy")
+        flagged = [c for c in checks if c["status"] != "healthy"]
+
+        if not flagged:
+            summary = f"All {len(checks)} checks passed; the dataset is healthy."
+        else:
+            summary = (f"Overall status is **{worst}**: {len(flagged)} of {len(checks)} checks "
+                       f"reported issues ({', '.join(c['name'] for c in flagged)}).")
+
+        issues = [issue for check in flagged for issue in self._issues(check, row_count)]
+        fixes = [f"- **{check['name']}**: {fix}" for check in flagged for fix in _FIXES.get(check["name"], [])]
+
+        return "\n".join([
+            "### Overall Quality Status:",
+            f"- {summary}",
+            "",
+            "### Key Issues:",
+            *(issues or ["- No issues detected."]),
+            "",
+            "### Recommended Fixes:",
+            *(fixes or ["- No action needed."]),
+        ])
+
+    def _issues(self, check: dict, row_count: int) -> List[str]:
+        details, status = check["details"], check["status"]
+        threshold = details.get("warning_threshold", 0)
+
+        if "null_ratio_per_column" in details:
+            ratios = details["null_ratio_per_column"]
+            cols = sorted((c for c, r in ratios.items() if r >= threshold), key=lambda c: -ratios[c])
+            return [f"- ({status}) Missing values: {_join([f'{c}: {_pct(ratios[c])}' for c in cols])} "
+                    f"exceed {_pct(threshold)} missing; they bias statistics and break many models."]
+        if "outlier_count_per_column" in details:
+            counts = details["outlier_count_per_column"]
+            cols = sorted((c for c in counts if row_count and counts[c] / row_count >= threshold),
+                          key=lambda c: -counts[c])
+            cols = cols or sorted(counts, key=lambda c: -counts[c])
+            return [f"- ({status}) Outliers (outside 1.5×IQR): {_join([f'{c}: {counts[c]:,}' for c in cols])}; "
+                    f"they distort means and scale-sensitive models."]
+        if "duplicate_count" in details:
+            return [f"- ({status}) Duplicate rows: {details['duplicate_count']:,} "
+                    f"({_pct(details['duplicate_percentage'])} of rows); they inflate counts and leak between "
+                    f"train and test splits."]
+        if details.get("is_empty"):
+            return [f"- ({status}) {details.get('message', 'The dataset is empty.')}"]
+        return [f"- ({status}) {check['name']} reported an issue."]